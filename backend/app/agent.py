@@ -1,43 +1,54 @@
-from strands import Agent
-from strands.models import BedrockModel
+"""Single-turn agent runner for the Lambda handler and the CLI (``app.main``).
+
+Everything expensive — Strands, the Bedrock client, built agents and the
+event loop — lives at module scope and is created on first use, so only a
+cold start pays for it and warm invocations reuse it. Runs go through the
+orchestrator, so these entry points get the same routing, permissions and
+approvals as the API.
+"""
+from __future__ import annotations
+
+import asyncio
 import logging
-import sys
+import threading
 
-from agent_factory import create_agent_from_spec, AgentSpec
+from app.config import get_settings
+from app.models import ChatResponse
+from app.orchestrator.router import orchestrator
 
-# Configure logging to stdout
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
 logger = logging.getLogger(__name__)
 
+_loop: asyncio.AbstractEventLoop | None = None
+_lock = threading.Lock()
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    # Kept across invocations: pooled agents, the events bus and async drivers
+    # stay bound to one loop instead of a fresh asyncio.run() each time.
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+def preinit(personas: list[str] | None = None) -> dict:
+    """Pay import, client and agent construction costs now (e.g. in the Lambda init phase)."""
+    from app.warmup import WarmupState, warm_up
+
+    settings = get_settings()
+    if personas is not None:
+        settings = settings.model_copy(update={"warmup_personas": personas})
+    with _lock:
+        asyncio.set_event_loop(_event_loop())
+        state = warm_up(settings, WarmupState())
+    return state.to_dict()
+
 
-def create_agent():
-    model = BedrockModel(
-        model_id=os.environ.get("BEDROCK_MODEL_ID", "us.anthropic.claude-3-5-sonnet-20241022-v2:0"),
-        streaming=False
-    )
-    
-    return Agent(
-        model=model,
-        system_prompt=system_prompt,
-        tools=[] # Basic version with no tools
-    )
-    return create_agent_from_spec(spec)
-
-
-def run_agent(prompt):
-    """Process a request using the Strands agent"""
-    try:
-        agent = create_agent()
-        response = agent(prompt)
-        # Strands responses can be converted to string or accessed via .content
-        return str(response)
-    except Exception as e:
-        import traceback
-
-        print(f"ERROR: Exception in run_agent: {str(e)}")
-        traceback.print_exc()
-        return {"status": "Error", "message": "Internal error occurred."}
+def run_agent(prompt: str, persona: str | None = None, conversation_id: str | None = None) -> ChatResponse:
+    """Run one chat turn for ``persona`` (default: ``DEFAULT_PERSONA``)."""
+    persona = persona or get_settings().default_persona
+    # One loop, one run at a time; Lambda sends one event per environment anyway.
+    with _lock:
+        return _event_loop().run_until_complete(
+            orchestrator.handle_chat(prompt, persona, conversation_id)
+        )
@@ -1,10 +1,18 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Any, Callable
-from strands import Agent
-from strands.models import BedrockModel
+from typing import TYPE_CHECKING, Any, Callable
 import logging
 import os
 
+from app.orchestrator.deadline import Deadline
+
+# Strands (and boto3 behind BedrockModel) are imported on first agent build,
+# not at import time, so the API process starts quickly.
+if TYPE_CHECKING:
+    from strands import Agent
+    from strands.hooks import BeforeModelCallEvent, BeforeToolCallEvent, HookProvider, HookRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +27,10 @@ class AgentSpec:
     tools: list = None
     data_access: list = None
     routing: list = None
+    data_tools: dict = None  # data_type → direct tool call, see app.orchestrator.fastpath
+    model_tiers: dict = None  # tier → model_id ("small", optional "large"), see app.orchestrator.tiering
+    tier: str = ""  # set on per-tier copies; pooled separately from the base spec
+    version: int = 0  # stamped by the agent registry; bumps invalidate pooled agents
 
     def __post_init__(self):
         if self.tools is None:
@@ -27,6 +39,14 @@ class AgentSpec:
             self.data_access = []
         if self.routing is None:
             self.routing = []
+        if self.data_tools is None:
+            self.data_tools = {}
+        if self.model_tiers is None:
+            self.model_tiers = {}
+
+    @property
+    def pool_key(self) -> str:
+        return f"{self.slug}@{self.tier}" if self.tier else self.slug
 
     def permissions_dict(self) -> dict[str, list[str]]:
         return {
@@ -36,10 +56,40 @@ class AgentSpec:
         }
 
 
+class DeadlineHooks:
+    """Stops an agent run at the next model or tool call once its deadline is cancelled.
+
+    Tool calls that do start are counted on ``context.tools_started`` (the
+    pooled agent's RunContext), so callers know whether a failed run had
+    side effects.
+    """
+
+    def __init__(self, deadline: Deadline | None = None, context=None) -> None:
+        self.deadline = deadline
+        self.context = context
+
+    def register_hooks(self, registry: HookRegistry) -> None:
+        from strands.hooks import BeforeModelCallEvent, BeforeToolCallEvent
+
+        registry.add_callback(BeforeModelCallEvent, self._before_model_call)
+        registry.add_callback(BeforeToolCallEvent, self._before_tool_call)
+
+    def _before_model_call(self, event: BeforeModelCallEvent) -> None:
+        if self.deadline is not None:
+            self.deadline.check()
+
+    def _before_tool_call(self, event: BeforeToolCallEvent) -> None:
+        if self.deadline is not None and self.deadline.cancelled:
+            event.cancel_tool = f"Request cancelled: {self.deadline.reason}"
+        elif self.context is not None:
+            self.context.tools_started += 1
+
+
 class AgentFactory:
     _instance = None
     _registry: dict[str, type] = {}
     _tools_registry: dict[str, Callable] = {}
+    _prepared_tools: dict[str, Callable] = {}  # registry tools with cache/process wrappers applied
 
     def __new__(cls):
         if cls._instance is None:
@@ -56,13 +106,55 @@ class AgentFactory:
     @classmethod
     def register_tools(cls, tools: dict[str, Callable]) -> None:
         cls._tools_registry.update(tools)
+        for name in tools:
+            cls._prepared_tools.pop(name, None)
+
+    @classmethod
+    def get_tool(cls, name: str) -> Callable | None:
+        tool = cls._tools_registry.get(name)
+        if tool is None:
+            return None
+        prepared = cls._prepared_tools.get(name)
+        if prepared is None:
+            prepared = cls._prepared_tools[name] = cls._prepare_tool(name, tool)
+        return prepared
+
+    @staticmethod
+    def _prepare_tool(name: str, tool: Callable) -> Callable:
+        """Apply what the registry declared for ``tool``: process-pool execution, then caching."""
+        from app.config import get_settings
+
+        settings = get_settings()
+        cache_policy = getattr(tool, "cache_policy", None)
+        if getattr(tool, "execution", None) == "process" and settings.tool_process_enabled:
+            from app.tool_executor import tool_executor
+
+            tool = tool_executor.wrap(tool)
+        # Cache outermost, so hits never reach the process pool.
+        if cache_policy is not None and settings.tool_cache_enabled:
+            from app.tool_cache import tool_cache
+
+            tool.cache_policy = cache_policy
+            tool = tool_cache.wrap(name, tool)
+        return tool
 
     @classmethod
-    def build(cls, spec: AgentSpec) -> Agent:
-        return cls.build_default(spec)
+    def build(
+        cls,
+        spec: AgentSpec,
+        hooks: list[HookProvider] | None = None,
+        tool_overrides: dict[str, Callable] | None = None,
+    ) -> Agent:
+        return cls.build_default(spec, hooks=hooks, tool_overrides=tool_overrides)
 
     @classmethod
-    def create(cls, spec: AgentSpec | dict, agent_type: str = "default") -> Agent:
+    def create(
+        cls,
+        spec: AgentSpec | dict,
+        agent_type: str = "default",
+        hooks: list[HookProvider] | None = None,
+        tool_overrides: dict[str, Callable] | None = None,
+    ) -> Agent:
         if isinstance(spec, dict):
             spec = AgentSpec(**spec)
 
@@ -71,20 +163,31 @@ class AgentFactory:
             agent_type = "default"
 
         agent_class = cls._registry[agent_type]
-        return agent_class.build(spec)
+        return agent_class.build(spec, hooks=hooks, tool_overrides=tool_overrides)
 
     @classmethod
-    def build_default(cls, spec: AgentSpec) -> Agent:
-        model_id = spec.model_id or os.environ.get(
-            "BEDROCK_MODEL_ID", "us.anthropic.claude-3-5-sonnet-20241022-v2:0"
-        )
-        model = BedrockModel(model_id=model_id, streaming=False)
+    def build_default(
+        cls,
+        spec: AgentSpec,
+        hooks: list[HookProvider] | None = None,
+        tool_overrides: dict[str, Callable] | None = None,
+    ) -> Agent:
+        model_id = spec.model_id or cls.default_model_id()
+        from strands import Agent
+
+        from app.bedrock import get_model
+
+        model = get_model(model_id)
 
         system_prompt = spec.system_prompt or cls._build_system_prompt(spec)
 
-        tools = cls._resolve_tools(spec.tools)
+        tools = cls._resolve_tools(spec.tools, tool_overrides)
+
+        return Agent(model=model, system_prompt=system_prompt, tools=tools, hooks=hooks)
 
-        return Agent(model=model, system_prompt=system_prompt, tools=tools)
+    @staticmethod
+    def default_model_id() -> str:
+        return os.environ.get("BEDROCK_MODEL_ID", "us.anthropic.claude-3-5-sonnet-20241022-v2:0")
 
     @classmethod
     def _build_system_prompt(cls, spec: AgentSpec) -> str:
@@ -98,11 +201,11 @@ You can route to these agents: {", ".join(spec.routing) if spec.routing else "no
         return prompt
 
     @classmethod
-    def _resolve_tools(cls, tool_names: list) -> list:
+    def _resolve_tools(cls, tool_names: list, overrides: dict[str, Callable] | None = None) -> list:
         resolved = []
         for name in tool_names:
-            # First check the orchestrator tools registry
-            tool = cls._tools_registry.get(name)
+            # Per-agent overrides win, then the orchestrator tools registry
+            tool = (overrides or {}).get(name) or cls.get_tool(name)
             if tool:
                 resolved.append(tool)
                 continue
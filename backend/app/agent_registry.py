@@ -0,0 +1,256 @@
+"""Dynamic agent registry: specs from built-ins, the graph and a spec directory.
+
+Sources are indexed cheaply (file mtimes, graph property hashes) and each
+spec is only built the first time it is looked up. ``watch()`` rescans the
+index every ``reload_interval`` seconds in a worker thread (the API server
+runs it as a background task), so adding or editing a persona takes effect
+without a restart and lookups never touch the graph or the disk. Every change bumps that spec's ``version`` and the
+registry-wide ``version``; listeners (e.g. the agent pool) are told which
+slug changed so cached agents built from an old spec are dropped.
+
+Precedence, lowest first: built-in specs, graph ``Person`` nodes, spec files.
+Graph and file entries are merged over a built-in spec with the same slug,
+so they only need to carry the fields they change.
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from app.agent_factory import AgentSpec
+
+logger = logging.getLogger(__name__)
+
+SPEC_FIELDS = {f.name for f in dataclasses.fields(AgentSpec)} - {"version", "tier"}
+SPEC_SUFFIXES = (".yaml", ".yml", ".json")
+
+GRAPH_SPECS_CYPHER = """
+MATCH (p:Person)
+RETURN p {.*} AS props
+"""
+
+
+@dataclass
+class _Entry:
+    slug: str
+    source: str
+    stamp: Any
+    load: Callable[[], dict[str, Any]]
+    version: int = 0
+    spec: AgentSpec | None = None
+
+
+def _read_spec_file(path: Path) -> dict[str, Any]:
+    if path.suffix == ".json":
+        return json.loads(path.read_text())
+    import yaml
+
+    return yaml.safe_load(path.read_text()) or {}
+
+
+class AgentRegistry:
+    """O(1) slug → AgentSpec lookups over lazily built, hot-reloaded specs."""
+
+    def __init__(
+        self,
+        builtin: dict[str, AgentSpec],
+        spec_dir: str | Path | None = None,
+        from_graph: bool = False,
+        reload_interval: float = 5.0,
+    ) -> None:
+        self._builtin = builtin
+        self._spec_dir = Path(spec_dir) if spec_dir else None
+        self._from_graph = from_graph
+        self._reload_interval = reload_interval
+        self._entries: dict[str, _Entry] = {}
+        self._overrides: dict[str, dict[str, Any]] = {}
+        self._listeners: list[Callable[[str], None]] = []
+        self._lock = threading.RLock()
+        self._last_scan = 0.0
+        self._counter = 0
+        self.version = 0
+
+    # ── Lookups ─────────────────────────────────────────────────────────
+
+    def get(self, slug: str) -> AgentSpec | None:
+        self._ensure_loaded()
+        entry = self._entries.get(slug)
+        if entry is None:
+            return None
+        return entry.spec or self._build(entry)
+
+    def __contains__(self, slug: str) -> bool:
+        self._ensure_loaded()
+        return slug in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        self._ensure_loaded()
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._entries)
+
+    def current_version(self) -> int:
+        """Registry-wide version; bumped by every spec change."""
+        self._ensure_loaded()
+        return self.version
+
+    def slugs(self) -> list[str]:
+        return list(self)
+
+    def values(self) -> list[AgentSpec]:
+        """All specs (builds any not built yet)."""
+        return [spec for spec in (self.get(slug) for slug in self) if spec is not None]
+
+    # ── Changes ─────────────────────────────────────────────────────────
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """``listener(slug)`` is called whenever a spec changes or disappears."""
+        self._listeners.append(listener)
+
+    def update(self, slug: str, **changes: Any) -> AgentSpec | None:
+        """Apply runtime changes to a spec (kept until its source changes)."""
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is None:
+                return None
+            self._overrides.setdefault(slug, {}).update(changes)
+            self._replace(slug, _Entry(slug, entry.source, entry.stamp, entry.load))
+            return self._build(self._entries[slug])
+
+    def reload(self) -> list[str]:
+        """Rescan all sources now; returns the slugs that changed."""
+        with self._lock:
+            self._last_scan = time.monotonic()
+            candidates = self._scan()
+            changed = []
+            for slug in list(self._entries):
+                if slug not in candidates:
+                    del self._entries[slug]
+                    self._overrides.pop(slug, None)
+                    changed.append(slug)
+            for slug, candidate in candidates.items():
+                current = self._entries.get(slug)
+                if current is not None and (current.source, current.stamp) == (candidate.source, candidate.stamp):
+                    continue
+                if current is not None:
+                    self._overrides.pop(slug, None)
+                self._replace(slug, candidate, notify=False)
+                changed.append(slug)
+        if changed:
+            logger.info("Agent registry reloaded (version %d): %s", self.version, changed)
+            for slug in changed:
+                self._notify(slug)
+        return changed
+
+    async def watch(self) -> None:
+        """Load, then rescan every ``reload_interval`` seconds (``<= 0`` disables), off the event loop."""
+        await asyncio.to_thread(self._ensure_loaded)
+        if self._reload_interval <= 0 or (self._spec_dir is None and not self._from_graph):
+            return
+        while True:
+            await asyncio.sleep(self._reload_interval)
+            try:
+                await asyncio.to_thread(self._refresh)
+            except Exception:
+                logger.exception("Agent registry reload failed")
+
+    # ── Internal ────────────────────────────────────────────────────────
+
+    def _ensure_loaded(self) -> None:
+        # Only the very first lookup scans; after that only watch()/reload() do.
+        if not self._last_scan:
+            with self._lock:
+                if not self._last_scan:
+                    self.reload()
+
+    def _refresh(self) -> None:
+        for slug in self.reload():
+            entry = self._entries.get(slug)
+            # Built here, in the reload thread, so lookups don't parse spec files.
+            if entry is not None and entry.source != "builtin":
+                self._build(entry)
+
+    def _replace(self, slug: str, entry: _Entry, notify: bool = True) -> None:
+        self._counter += 1
+        entry.version = self._counter
+        self._entries[slug] = entry
+        self.version = self._counter
+        if notify:
+            self._notify(slug)
+
+    def _notify(self, slug: str) -> None:
+        for listener in self._listeners:
+            try:
+                listener(slug)
+            except Exception:
+                logger.exception("Agent registry listener failed for %s", slug)
+
+    def _build(self, entry: _Entry) -> AgentSpec:
+        with self._lock:
+            if entry.spec is not None:
+                return entry.spec
+            fields = {k: v for k, v in entry.load().items() if k in SPEC_FIELDS}
+            fields.update(self._overrides.get(entry.slug, {}))
+            base = self._builtin.get(entry.slug)
+            if base is not None:
+                spec = dataclasses.replace(base, **fields, version=entry.version)
+            else:
+                fields.setdefault("name", entry.slug)
+                fields.setdefault("role", "")
+                fields.setdefault("description", "")
+                spec = AgentSpec(**{**fields, "slug": entry.slug}, version=entry.version)
+            # Lists are copied so runtime edits never leak into the built-ins.
+            spec.tools, spec.data_access, spec.routing = list(spec.tools), list(spec.data_access), list(spec.routing)
+            spec.data_tools, spec.model_tiers = dict(spec.data_tools), dict(spec.model_tiers)
+            entry.spec = spec
+            return spec
+
+    def _scan(self) -> dict[str, _Entry]:
+        candidates: dict[str, _Entry] = {}
+        for slug in self._builtin:
+            candidates[slug] = _Entry(slug, "builtin", 0, lambda: {})
+        if self._from_graph:
+            candidates.update(self._scan_graph())
+        if self._spec_dir is not None:
+            candidates.update(self._scan_dir(self._spec_dir))
+        return candidates
+
+    def _scan_dir(self, spec_dir: Path) -> dict[str, _Entry]:
+        found: dict[str, _Entry] = {}
+        if not spec_dir.is_dir():
+            logger.warning("Agent spec directory %s does not exist", spec_dir)
+            return found
+        for path in sorted(spec_dir.iterdir()):
+            if path.suffix not in SPEC_SUFFIXES:
+                continue
+            # Filenames are slugs, so indexing needs only a stat, not a parse.
+            found[path.stem] = _Entry(
+                path.stem, "dir", path.stat().st_mtime_ns, lambda p=path: _read_spec_file(p)
+            )
+        return found
+
+    def _scan_graph(self) -> dict[str, _Entry]:
+        try:
+            from app.graph.client import run_query
+
+            rows = run_query(GRAPH_SPECS_CYPHER)
+        except Exception as e:
+            logger.warning("Agent specs unavailable from graph: %s", e)
+            # Keep whatever the graph contributed last time.
+            return {slug: entry for slug, entry in self._entries.items() if entry.source == "graph"}
+        found: dict[str, _Entry] = {}
+        for row in rows:
+            props = row["props"]
+            stamp = hashlib.sha1(json.dumps(props, sort_keys=True, default=str).encode()).hexdigest()
+            found[props["slug"]] = _Entry(props["slug"], "graph", stamp, lambda p=props: dict(p))
+        return found
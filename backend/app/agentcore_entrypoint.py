@@ -1,19 +1,37 @@
 # Entry point for Amazon Bedrock AgentCore
+#
+# Runs any persona from the agent registry through the shared orchestrator,
+# so agents come from the warm pool instead of being rebuilt per payload, and
+# streams events and text deltas back as they are produced.
+import asyncio
+
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
-import example_agents
+
+from app.agents import agent_registry
+from app.config import get_settings
+from app.orchestrator.router import orchestrator
 
 app = BedrockAgentCoreApp()
 
+# Slugs used by the original example agents.
+LEGACY_AGENT_TYPES = {"finance": "finance-manager", "analytics": "accountant"}
+
+_registry_watcher: asyncio.Task | None = None
+
 
 @app.entrypoint
-def handler(payload):
-    """AgentCore handler function"""
-    agent_type = payload.get("agent_type", "finance")
+async def handler(payload):
+    """AgentCore handler: yields orchestration events, deltas and a final result."""
+    global _registry_watcher
+    if _registry_watcher is None:
+        # Hot-reload agent specs in the background, as the API server does.
+        _registry_watcher = asyncio.ensure_future(agent_registry.watch())
+    persona = payload.get("persona") or payload.get("agent_type") or get_settings().default_persona
+    persona = LEGACY_AGENT_TYPES.get(persona, persona)
     prompt = payload.get("prompt", "Hello, who are you?")
 
-    if agent_type == "analytics":
-        return example_agents.run_analytics_agent(prompt)
-    return example_agents.run_finance_agent(prompt)
+    async for event in orchestrator.stream_chat(prompt, persona, payload.get("conversation_id")):
+        yield event
 
 
 if __name__ == "__main__":
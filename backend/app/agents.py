@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 from app.agent_factory import AgentSpec
+from app.agent_registry import AgentRegistry
+from app.config import get_settings
 
 FM_SPEC = AgentSpec(
     slug="finance-manager",
@@ -17,12 +19,14 @@ FM_SPEC = AgentSpec(
         "- Manage budget forecasting\n\n"
         "When you need financial data you don't have, use the request_from_agent tool to ask the Accountant.\n"
         "Always specify the data_type accurately (e.g., 'pnl', 'invoices', 'expenses').\n"
-        "When you receive data, use summarize_report to create clear executive summaries.\n\n"
+        "When you receive data, use summarize_report to create clear executive summaries.\n"
+        "Large results arrive as a data handle with a summary; use fetch_data to read only the parts you need.\n\n"
         "Be concise, professional, and data-driven in your responses."
     ),
-    tools=["request_from_agent", "summarize_report"],
+    tools=["request_from_agent", "fetch_data", "summarize_report", "read_report_section"],
     data_access=["pnl", "invoices", "budget"],
     routing=["accountant"],
+    model_tiers={"small": "us.amazon.nova-lite-v1:0"},
 )
 
 ACCOUNTANT_SPEC = AgentSpec(
@@ -44,8 +48,24 @@ ACCOUNTANT_SPEC = AgentSpec(
         "Return data in a clear, structured format."
     ),
     tools=["pull_pnl", "pull_invoices", "check_approval_required"],
+    # Data fetches are lookups plus formatting; the small model is enough.
+    model_tiers={"small": "us.amazon.nova-lite-v1:0"},
     data_access=["pnl", "invoices", "expenses", "budget"],
     routing=[],
+    # Plain fetches of these are answered by the tool directly, without an LLM hop.
+    data_tools={
+        "pnl": {"tool": "pull_pnl", "params": {"quarter": "quarter", "year": "year"}},
+        "invoices": {
+            "tool": "pull_invoices",
+            "params": {
+                "status_filter": {"choices": ["paid", "pending", "overdue"]},
+                "category": {"choices": [
+                    "ai_services", "infrastructure", "legal", "monitoring", "office_supplies", "recruiting",
+                ]},
+            },
+            "defaults": {"status_filter": "all", "category": "all"},
+        },
+    },
 )
 
 CEO_SPEC = AgentSpec(
@@ -60,15 +80,29 @@ CEO_SPEC = AgentSpec(
         "- Review and approve sensitive financial data requests\n"
         "- Access any data across the organization\n\n"
         "You can request data from any agent using request_from_agent.\n"
+        "Large results arrive as a data handle with a summary; use fetch_data to read only the parts you need.\n"
         "You have authority to approve or deny data access requests.\n"
         "Provide high-level strategic insights when analyzing data."
     ),
-    tools=["request_from_agent", "summarize_report"],
+    tools=["request_from_agent", "fetch_data", "summarize_report", "read_report_section"],
     data_access=["pnl", "invoices", "budget", "expenses"],
     routing=["finance-manager", "accountant"],
 )
 
-# Registry of all agent specs by slug
-AGENT_SPECS: dict[str, AgentSpec] = {
+# Built-in specs by slug; the graph and AGENT_SPEC_DIR can override or extend them.
+BUILTIN_SPECS: dict[str, AgentSpec] = {
     spec.slug: spec for spec in [FM_SPEC, ACCOUNTANT_SPEC, CEO_SPEC]
 }
+
+
+def _make_registry() -> AgentRegistry:
+    settings = get_settings()
+    return AgentRegistry(
+        BUILTIN_SPECS,
+        spec_dir=settings.agent_spec_dir or None,
+        from_graph=settings.agent_specs_from_graph,
+        reload_interval=settings.agent_registry_reload_seconds,
+    )
+
+
+agent_registry = _make_registry()
@@ -0,0 +1,132 @@
+"""Shared, connection-pooled Bedrock runtime clients and model instances.
+
+Building a ``BedrockModel`` creates a boto3 client with its own HTTP
+connection pool, so doing it per agent repeats credential resolution and TLS
+handshakes on every request and sub-agent hop. Instead there is one client
+per region (boto3 clients are thread-safe) and one ``BedrockModel`` per
+model id, shared by every agent the factory builds.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+from app.config import Settings, get_settings
+
+if TYPE_CHECKING:
+    from strands.models import BedrockModel
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_sessions: dict[str, Any] = {}
+_clients: dict[tuple, Any] = {}
+_models: dict[tuple, "BedrockModel"] = {}
+
+
+def _client_config_key(settings: Settings) -> tuple:
+    return (
+        settings.bedrock_max_pool_connections,
+        settings.bedrock_connect_timeout,
+        settings.bedrock_read_timeout,
+        settings.bedrock_retry_mode,
+        settings.bedrock_max_attempts,
+        settings.bedrock_tcp_keepalive,
+    )
+
+
+def client_config(settings: Settings | None = None):
+    from botocore.config import Config
+
+    s = settings or get_settings()
+    return Config(
+        max_pool_connections=s.bedrock_max_pool_connections,
+        connect_timeout=s.bedrock_connect_timeout,
+        read_timeout=s.bedrock_read_timeout,
+        retries={"mode": s.bedrock_retry_mode, "max_attempts": s.bedrock_max_attempts},
+        tcp_keepalive=s.bedrock_tcp_keepalive,
+        user_agent_extra="strands-agents",
+    )
+
+
+def _session(region: str):
+    # Caller holds _lock: boto3 sessions aren't safe to share while creating clients.
+    session = _sessions.get(region)
+    if session is None:
+        import boto3
+
+        session = boto3.Session(region_name=region)
+        _sessions[region] = session
+    return session
+
+
+def get_bedrock_client(region: str | None = None):
+    """Return the shared bedrock-runtime client for ``region``."""
+    s = get_settings()
+    region = region or s.aws_region
+    key = (region, _client_config_key(s))
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _session(region).client("bedrock-runtime", config=client_config(s))
+            _clients[key] = client
+            logger.info(
+                "Bedrock runtime client created region=%s max_pool_connections=%d retry_mode=%s",
+                region, s.bedrock_max_pool_connections, s.bedrock_retry_mode,
+            )
+    return client
+
+
+class _SharedClientSession:
+    """Stands in for the boto3 session so ``BedrockModel`` takes the shared client."""
+
+    def __init__(self, client) -> None:
+        self._client = client
+        self.region_name = client.meta.region_name
+
+    def client(self, service_name: str, **kwargs: Any):
+        return self._client
+
+
+def get_model(model_id: str, region: str | None = None) -> "BedrockModel":
+    """Return the shared ``BedrockModel`` for ``model_id``, wired to the shared client.
+
+    The model streams (ConverseStream) unless ``bedrock_streaming`` is off, so
+    ``stream_chat`` and the AgentCore entry point get text as it is generated.
+    ``fake`` / ``fake:<latency_ms>`` returns the offline FakeModel instead.
+    """
+    if model_id == "fake" or model_id.startswith("fake:"):
+        from app.fake_model import FakeModel
+
+        return FakeModel(model_id)
+    s = get_settings()
+    region = region or s.aws_region
+    key = (model_id, region, s.bedrock_streaming, _client_config_key(s))
+    model = _models.get(key)
+    if model is not None:
+        return model
+    client = get_bedrock_client(region)
+    with _lock:
+        model = _models.get(key)
+        if model is None:
+            from strands.models import BedrockModel
+
+            model = BedrockModel(
+                model_id=model_id,
+                streaming=s.bedrock_streaming,
+                boto_session=_SharedClientSession(client),
+            )
+            _models[key] = model
+    return model
+
+
+def reset() -> None:
+    """Forget cached clients and models (tests, credential rotation)."""
+    with _lock:
+        _models.clear()
+        _clients.clear()
+        _sessions.clear()
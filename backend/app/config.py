@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -13,11 +14,25 @@ class Settings(BaseSettings):
     aws_secret_access_key: str = ""
     aws_session_token: str = ""
     bedrock_model_id: str = "us.anthropic.claude-3-5-sonnet-20241022-v2:0"
+    bedrock_max_pool_connections: int = 50
+    bedrock_connect_timeout: float = 5.0
+    bedrock_read_timeout: float = 120.0
+    bedrock_retry_mode: str = "adaptive"
+    bedrock_max_attempts: int = 4
+    bedrock_tcp_keepalive: bool = True
+    bedrock_streaming: bool = True  # ConverseStream; false → Converse, one text delta per model turn
+
+    # Graph
+    graph_backend: str = "neo4j"  # "neo4j" or "memory"
+    graph_org_path: str = ""  # org definition for the memory backend; bundled org.yaml if empty
 
     # Neo4j
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = "agentorg123"
+    graph_query_timeout_seconds: float = 5.0
+    graph_load_batch_size: int = 1000
+    graph_ensure_schema: bool = True
 
     # Datadog
     dd_service: str = "agentorg"
@@ -29,6 +44,75 @@ class Settings(BaseSettings):
     app_port: int = 8000
     frontend_url: str = "http://localhost:3000"
 
+    # Entry points (Lambda handler, CLI)
+    default_persona: str = "finance-manager"
+    lambda_preinit: bool = False
+
+    # Warm-up
+    warmup_enabled: bool = True
+    warmup_blocking: bool = False
+    warmup_personas: list[str] = []
+    warmup_agents_per_persona: int = 1
+
+    # Orchestrator
+    async_orchestrator: bool = True
+    request_timeout_seconds: float = 120.0
+    agent_pool_max_idle: int = 4
+    batch_max_parallelism: int = 8
+    batch_max_items: int = 500
+    approvals_max_page_size: int = 500
+    suspend_on_approval: bool = True
+    approval_mode: Literal["eager", "deferred"] = "eager"
+    data_fast_path: bool = True
+    model_tiering: bool = True
+    model_tier_small_max_chars: int = 200
+    approval_ttl_seconds: float = 86400.0
+    approval_sweep_interval_seconds: float = 300.0
+
+    # Tool result cache
+    tool_cache_enabled: bool = True
+    tool_cache_max_entries: int = 1024
+
+    # Process pool for CPU-heavy tools
+    tool_process_enabled: bool = True
+    tool_process_workers: int = 2
+    tool_shm_threshold: int = 1024 * 1024
+
+    # Report digests (summarize_report)
+    report_digest_top_n: int = 5
+    report_store_dir: str = ""
+    report_ttl_seconds: float = 86400.0
+
+    # Data handles for inter-agent payloads
+    data_handles: bool = True
+    data_handle_threshold: int = 4096
+    data_fetch_max_bytes: int = 16384
+    data_handle_ttl_seconds: float = 3600.0
+
+    # Speculative prefetch of sub-agent data at chat start
+    prefetch_enabled: bool = False
+    prefetch_max_calls: int = 3
+    prefetch_min_share: float = 0.5
+    prefetch_ttl_seconds: float = 30.0
+
+    # Request profiling (X-Profile: 1 header, or a sample of all requests)
+    profiling_enabled: bool = False
+    profile_sample_rate: float = 0.0
+    profile_interval_ms: float = 5.0
+    profile_dir: str = ""
+    profile_ring_size: int = 200
+
+    # Approval payloads
+    payload_inline_threshold: int = 256 * 1024
+    payload_spool_dir: str = ""
+    payload_compression: Literal["auto", "zstd", "gzip"] = "auto"
+    approval_wait_max_seconds: float = 60.0
+
+    # Agent registry
+    agent_spec_dir: str = ""
+    agent_specs_from_graph: bool = False
+    agent_registry_reload_seconds: float = 5.0
+
     model_config = {"env_file": os.path.join(os.path.dirname(__file__), "..", ".env")}
 
 
@@ -1,4 +1,4 @@
-from agent_factory import create_agent_from_spec, AgentSpec
+from app.agent_factory import AgentSpec, create_agent_from_spec
 
 FINANCE_AGENT_SPEC = AgentSpec(
     slug="finance",
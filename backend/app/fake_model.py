@@ -0,0 +1,111 @@
+"""Deterministic stand-in for Bedrock, for local harnesses and load tests.
+
+Selected with ``BEDROCK_MODEL_ID=fake`` (or ``fake:<latency_ms>``). It never
+touches the network: each turn sleeps for the configured latency and streams
+a canned reply. If the agent has ``request_from_agent`` and the prompt names
+a known data type, the first turn asks for it so routing, graph lookups and
+approvals are exercised exactly as with a real model. Structured output
+requests get an instance of the requested model filled with each field's
+default, or a placeholder value of the field's type.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import types
+import typing
+from typing import Any, AsyncGenerator
+
+from pydantic import BaseModel
+
+from strands.models.model import Model
+
+DATA_TYPES = re.compile(r"\b(pnl|p&l|invoices?|expenses?|budget)\b", re.IGNORECASE)
+_CANONICAL = {"p&l": "pnl", "invoice": "invoices", "expense": "expenses"}
+
+
+_PLACEHOLDERS: dict[type, Any] = {str: "fake", int: 0, float: 0.0, bool: False}
+
+
+def _placeholder(annotation: Any) -> Any:
+    """A value of type ``annotation`` for a required field."""
+    origin = typing.get_origin(annotation) or annotation
+    args = typing.get_args(annotation)
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (typing.Union, types.UnionType):
+        return None if type(None) in args else _placeholder(args[0])
+    if origin in (list, dict, set, tuple):
+        return origin()
+    if isinstance(origin, type) and issubclass(origin, BaseModel):
+        return _fill(origin)
+    return _PLACEHOLDERS.get(origin)
+
+
+def _fill(output_model: type[BaseModel]) -> BaseModel:
+    values = {
+        name: _placeholder(field.annotation)
+        for name, field in output_model.model_fields.items()
+        if field.is_required()
+    }
+    return output_model(**values)
+
+
+def parse_model_id(model_id: str) -> float:
+    """Latency in seconds from ``fake`` / ``fake:<ms>``."""
+    _, _, ms = model_id.partition(":")
+    return float(ms or 0) / 1000
+
+
+class FakeModel(Model):
+    def __init__(self, model_id: str = "fake", latency: float | None = None) -> None:
+        self.config: dict[str, Any] = {"model_id": model_id}
+        self.latency = parse_model_id(model_id) if latency is None else latency
+
+    def update_config(self, **model_config: Any) -> None:
+        self.config.update(model_config)
+
+    def get_config(self) -> dict[str, Any]:
+        return self.config
+
+    async def structured_output(
+        self, output_model, prompt, system_prompt=None, **kwargs: Any
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        yield {"output": _fill(output_model)}
+
+    async def stream(
+        self,
+        messages,
+        tool_specs=None,
+        system_prompt=None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        last = messages[-1]["content"] if messages else []
+        tool_names = {spec["name"] for spec in tool_specs or []}
+        prompt = " ".join(block.get("text", "") for block in last)
+        match = DATA_TYPES.search(prompt)
+
+        yield {"messageStart": {"role": "assistant"}}
+        if match and "request_from_agent" in tool_names and len(messages) == 1:
+            data_type = match.group(1).lower()
+            data_type = _CANONICAL.get(data_type, data_type)
+            tool_input = {"target_agent": "accountant", "data_type": data_type, "ask": prompt[:200]}
+            yield {"contentBlockStart": {"start": {"toolUse": {"toolUseId": f"fake-{len(messages)}", "name": "request_from_agent"}}}}
+            yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(tool_input)}}}}
+            yield {"contentBlockStop": {}}
+            yield {"messageStop": {"stopReason": "tool_use"}}
+            return
+
+        if any("toolResult" in block for block in last):
+            text = "Here is what I found."
+        else:
+            text = f"[{self.config['model_id']}] {prompt[:200]}"
+        yield {"contentBlockDelta": {"delta": {"text": text}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+        yield {"metadata": {"usage": {"inputTokens": 0, "outputTokens": 0, "totalTokens": 0}, "metrics": {"latencyMs": int(self.latency * 1000)}}}
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, GraphDatabase, Query
 
 from app.config import get_settings
+from app.orchestrator.deadline import current_deadline
 
 logger = logging.getLogger(__name__)
 
 _driver = None
+_async_driver = None
+_async_driver_loop: asyncio.AbstractEventLoop | None = None
 
 
 def get_driver():
@@ -29,8 +33,60 @@ def close_driver():
         logger.info("Neo4j driver closed")
 
 
+def open_async_driver():
+    """Create the async driver on the running loop (the server loop, from lifespan)."""
+    global _async_driver, _async_driver_loop
+    if _async_driver is None:
+        s = get_settings()
+        _async_driver = AsyncGraphDatabase.driver(s.neo4j_uri, auth=(s.neo4j_user, s.neo4j_password))
+        _async_driver_loop = asyncio.get_running_loop()
+        logger.info("Neo4j async driver created → %s", s.neo4j_uri)
+    return _async_driver
+
+
+def get_async_driver():
+    """Return the async driver if it belongs to the running loop, else None."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _async_driver if _async_driver_loop is loop else None
+
+
+async def close_async_driver():
+    global _async_driver, _async_driver_loop
+    if _async_driver is not None:
+        await _async_driver.close()
+        _async_driver = None
+        _async_driver_loop = None
+        logger.info("Neo4j async driver closed")
+
+
+def _query_timeout() -> Optional[float]:
+    deadline = current_deadline()
+    if deadline is None:
+        return None
+    deadline.check()
+    return deadline.timeout(get_settings().graph_query_timeout_seconds)
+
+
 def run_query(cypher: str, **params) -> list[dict]:
+    """Run a read query, bounded by the current request deadline if there is one."""
+    timeout = _query_timeout()
     driver = get_driver()
     with driver.session() as session:
-        result = session.run(cypher, **params)
+        result = session.run(Query(cypher, timeout=timeout), **params)
         return [record.data() for record in result]
+
+
+async def run_query_async(cypher: str, **params) -> list[dict]:
+    """Async counterpart of run_query."""
+    driver = get_async_driver()
+    if driver is None:
+        # No async driver on this loop (CLI use, or a Strands run on a worker
+        # thread) — use the sync driver off-loop instead.
+        return await asyncio.to_thread(run_query, cypher, **params)
+    timeout = _query_timeout()
+    async with driver.session() as session:
+        result = await session.run(Query(cypher, timeout=timeout), **params)
+        return [record.data() async for record in result]
@@ -0,0 +1,303 @@
+"""Bulk loader for org definitions (people, data resources, approval policies).
+
+An org definition can be a YAML or JSON document, or a directory of CSV
+files. Nodes and relationships are upserted with batched ``UNWIND ... MERGE``
+transactions, so reloading an org only touches what changed and never needs a
+full wipe. Managed nodes and relationships that are no longer in the
+definition (a revoked ``can_request``, a dropped policy) are deleted: each
+batch of source nodes has its stale outgoing edges removed in the same
+transaction that merges its current ones.
+
+YAML/JSON layout (relationship lists live on the entity that owns them)::
+
+    people:
+      - {slug: accountant, name: acct_agent, role: Accountant,
+         manages: [], owns_data: [pnl], can_request: [pnl]}
+    data_resources:
+      - {id: pnl, label: Profit & Loss Statement, requires_approval: [pnl-ceo-approval]}
+    policies:
+      - {id: pnl-ceo-approval, level: ceo, reason: ...}
+
+CSV layout: ``people.csv``, ``data_resources.csv`` and ``policies.csv`` with the
+same columns; list-valued columns are ``;``-separated.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ORG_PATH = Path(__file__).parent / "org.yaml"
+
+PERSON_RELATIONSHIPS = ("manages", "owns_data", "can_request")
+DATA_RELATIONSHIPS = ("requires_approval",)
+LIST_SEPARATOR = ";"
+
+
+@dataclass
+class OrgDefinition:
+    people: list[dict[str, Any]] = field(default_factory=list)
+    data_resources: list[dict[str, Any]] = field(default_factory=list)
+    policies: list[dict[str, Any]] = field(default_factory=list)
+
+    def relationships(self, name: str) -> list[dict[str, str]]:
+        """Flatten one relationship list into ``{"src": ..., "dst": ...}`` rows."""
+        if name in PERSON_RELATIONSHIPS:
+            owners, key = self.people, "slug"
+        else:
+            owners, key = self.data_resources, "id"
+        return [{"src": entity[key], "dst": dst} for entity in owners for dst in entity.get(name, [])]
+
+
+@dataclass
+class LoadStats:
+    nodes: dict[str, int] = field(default_factory=dict)
+    relationships: dict[str, int] = field(default_factory=dict)
+    removed: dict[str, int] = field(default_factory=dict)
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.nodes.values()) + sum(self.relationships.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total_rows / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.total_rows} rows in {self.batches} batches, {self.seconds:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s) nodes={self.nodes} relationships={self.relationships}"
+            f" removed={self.removed}"
+        )
+
+
+# ── Parsing ──────────────────────────────────────────────────────────────
+
+def _as_list(value: Any) -> list[str]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, str):
+        return [v.strip() for v in value.split(LIST_SEPARATOR) if v.strip()]
+    return [str(v) for v in value]
+
+
+def _normalize(raw: dict[str, Any]) -> OrgDefinition:
+    org = OrgDefinition(
+        people=[dict(p) for p in raw.get("people") or []],
+        data_resources=[dict(d) for d in raw.get("data_resources") or []],
+        policies=[dict(p) for p in raw.get("policies") or []],
+    )
+    for person in org.people:
+        for rel in PERSON_RELATIONSHIPS:
+            person[rel] = _as_list(person.get(rel))
+    for resource in org.data_resources:
+        for rel in DATA_RELATIONSHIPS:
+            resource[rel] = _as_list(resource.get(rel))
+    return org
+
+
+def _read_csv(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    with path.open(newline="", encoding="utf-8") as f:
+        return [{k: v for k, v in row.items() if v != ""} for row in csv.DictReader(f)]
+
+
+def load_definition(path: str | Path = DEFAULT_ORG_PATH) -> OrgDefinition:
+    """Read an org definition from a YAML/JSON file or a directory of CSVs."""
+    path = Path(path)
+    if path.is_dir():
+        raw = {
+            "people": _read_csv(path / "people.csv"),
+            "data_resources": _read_csv(path / "data_resources.csv"),
+            "policies": _read_csv(path / "policies.csv"),
+        }
+    elif path.suffix in (".yaml", ".yml"):
+        import yaml
+
+        raw = yaml.safe_load(path.read_text()) or {}
+    elif path.suffix == ".json":
+        raw = json.loads(path.read_text())
+    else:
+        raise ValueError(f"Unsupported org definition format: {path}")
+    return _normalize(raw)
+
+
+# ── Loading ──────────────────────────────────────────────────────────────
+
+NODE_CYPHER = {
+    "Person": """
+        UNWIND $rows AS row
+        MERGE (n:Person {slug: row.key})
+        SET n += row.props
+    """,
+    "DataResource": """
+        UNWIND $rows AS row
+        MERGE (n:DataResource {id: row.key})
+        SET n += row.props
+    """,
+    "ApprovalPolicy": """
+        UNWIND $rows AS row
+        MERGE (n:ApprovalPolicy {id: row.key})
+        SET n += row.props
+    """,
+}
+
+RELATIONSHIP_CYPHER = {
+    "manages": """
+        UNWIND $rows AS row
+        MATCH (a:Person {slug: row.src})
+        MATCH (b:Person {slug: row.dst})
+        MERGE (a)-[:MANAGES]->(b)
+    """,
+    "owns_data": """
+        UNWIND $rows AS row
+        MATCH (a:Person {slug: row.src})
+        MATCH (b:DataResource {id: row.dst})
+        MERGE (a)-[:OWNS_DATA]->(b)
+    """,
+    "can_request": """
+        UNWIND $rows AS row
+        MATCH (a:Person {slug: row.src})
+        MATCH (b:DataResource {id: row.dst})
+        MERGE (a)-[:CAN_REQUEST]->(b)
+    """,
+    "requires_approval": """
+        UNWIND $rows AS row
+        MATCH (a:DataResource {id: row.src})
+        MATCH (b:ApprovalPolicy {id: row.dst})
+        MERGE (a)-[:REQUIRES_APPROVAL]->(b)
+    """,
+}
+
+# Per source node: drop outgoing edges whose target is no longer listed.
+PRUNE_RELATIONSHIP_CYPHER = {
+    "manages": """
+        UNWIND $rows AS row
+        MATCH (a:Person {slug: row.src})-[r:MANAGES]->(b:Person)
+        WHERE NOT b.slug IN row.dsts
+        DELETE r
+    """,
+    "owns_data": """
+        UNWIND $rows AS row
+        MATCH (a:Person {slug: row.src})-[r:OWNS_DATA]->(b:DataResource)
+        WHERE NOT b.id IN row.dsts
+        DELETE r
+    """,
+    "can_request": """
+        UNWIND $rows AS row
+        MATCH (a:Person {slug: row.src})-[r:CAN_REQUEST]->(b:DataResource)
+        WHERE NOT b.id IN row.dsts
+        DELETE r
+    """,
+    "requires_approval": """
+        UNWIND $rows AS row
+        MATCH (a:DataResource {id: row.src})-[r:REQUIRES_APPROVAL]->(b:ApprovalPolicy)
+        WHERE NOT b.id IN row.dsts
+        DELETE r
+    """,
+}
+
+PRUNE_NODE_CYPHER = {
+    "Person": "MATCH (n:Person) WHERE NOT n.slug IN $keys DETACH DELETE n",
+    "DataResource": "MATCH (n:DataResource) WHERE NOT n.id IN $keys DETACH DELETE n",
+    "ApprovalPolicy": "MATCH (n:ApprovalPolicy) WHERE NOT n.id IN $keys DETACH DELETE n",
+}
+
+CLEAR_CYPHER = "MATCH (n) DETACH DELETE n"
+
+_RELATIONSHIP_FIELDS = set(PERSON_RELATIONSHIPS) | set(DATA_RELATIONSHIPS)
+
+
+def _node_rows(entities: list[dict[str, Any]], key: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "key": entity[key],
+            "props": {k: v for k, v in entity.items() if k not in _RELATIONSHIP_FIELDS},
+        }
+        for entity in entities
+    ]
+
+
+def _batches(rows: list[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+class GraphLoader:
+    """Upserts an OrgDefinition into Neo4j in batched write transactions."""
+
+    def __init__(self, driver, batch_size: int = 1000) -> None:
+        self._driver = driver
+        self.batch_size = max(1, batch_size)
+
+    def _write(self, session, cypher: str, rows: list[dict[str, Any]], stats: LoadStats) -> int:
+        written = 0
+        for batch in _batches(rows, self.batch_size):
+            session.execute_write(lambda tx, b=batch: tx.run(cypher, rows=b).consume())
+            stats.batches += 1
+            written += len(batch)
+        return written
+
+    def _sync_relationships(self, session, name: str, org: OrgDefinition, stats: LoadStats) -> int:
+        """Replace each source node's ``name`` edges with the ones ``org`` lists, a batch per transaction."""
+        if name in PERSON_RELATIONSHIPS:
+            owners, key = org.people, "slug"
+        else:
+            owners, key = org.data_resources, "id"
+        sources = [{"src": entity[key], "dsts": entity.get(name, [])} for entity in owners]
+
+        def work(tx, batch: list[dict[str, Any]]) -> int:
+            removed = tx.run(PRUNE_RELATIONSHIP_CYPHER[name], rows=batch).consume().counters.relationships_deleted
+            edges = [{"src": row["src"], "dst": dst} for row in batch for dst in row["dsts"]]
+            tx.run(RELATIONSHIP_CYPHER[name], rows=edges).consume()
+            return removed
+
+        written = 0
+        for batch in _batches(sources, self.batch_size):
+            stats.removed[name] = stats.removed.get(name, 0) + session.execute_write(work, batch)
+            stats.batches += 1
+            written += sum(len(row["dsts"]) for row in batch)
+        return written
+
+    def load(self, org: OrgDefinition, wipe: bool = False, prune: bool = True) -> LoadStats:
+        """Upsert ``org``. With ``wipe=True`` the graph is cleared first.
+
+        With ``prune`` (the default) managed nodes and relationships missing
+        from ``org`` are deleted; without it the load only adds and updates.
+        """
+        stats = LoadStats()
+        start = time.perf_counter()
+        with self._driver.session() as session:
+            if wipe:
+                session.run(CLEAR_CYPHER).consume()
+            # Nodes first so relationship MATCHes find both ends.
+            node_sets: Iterable[tuple[str, list[dict[str, Any]]]] = (
+                ("Person", _node_rows(org.people, "slug")),
+                ("DataResource", _node_rows(org.data_resources, "id")),
+                ("ApprovalPolicy", _node_rows(org.policies, "id")),
+            )
+            for label, rows in node_sets:
+                stats.nodes[label] = self._write(session, NODE_CYPHER[label], rows, stats)
+                if prune and not wipe:
+                    keys = [row["key"] for row in rows]
+                    summary = session.execute_write(
+                        lambda tx, c=PRUNE_NODE_CYPHER[label], k=keys: tx.run(c, keys=k).consume()
+                    )
+                    stats.removed[label] = summary.counters.nodes_deleted
+            for name, cypher in RELATIONSHIP_CYPHER.items():
+                if prune and not wipe:
+                    stats.relationships[name] = self._sync_relationships(session, name, org, stats)
+                else:
+                    stats.relationships[name] = self._write(session, cypher, org.relationships(name), stats)
+        stats.seconds = time.perf_counter() - start
+        logger.info("Org graph loaded: %s", stats.summary())
+        return stats
@@ -0,0 +1,103 @@
+"""In-process graph backend: adjacency dicts instead of Neo4j round trips.
+
+Built from the same org definition the seed loader uses, and answers the
+queries in ``app.graph.queries`` with the same results the Cypher versions
+return against a graph seeded from that definition.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from app.graph.loader import OrgDefinition
+
+
+@dataclass
+class MemoryBackend:
+    can_request: dict[str, set[str]] = field(default_factory=dict)
+    owns_data: dict[str, list[str]] = field(default_factory=dict)  # data id → owner slugs
+    requires_approval: dict[str, list[str]] = field(default_factory=dict)  # data id → policy ids
+    manages: dict[str, set[str]] = field(default_factory=dict)
+    policies: dict[str, dict] = field(default_factory=dict)
+
+    @classmethod
+    def from_definition(cls, org: OrgDefinition) -> "MemoryBackend":
+        people = {p["slug"] for p in org.people}
+        data = {d["id"] for d in org.data_resources}
+        backend = cls(policies={p["id"]: p for p in org.policies})
+
+        # Like the loader's MATCH ... MERGE, edges to undefined nodes are dropped
+        # and duplicates collapse to one.
+        for person in org.people:
+            src = person["slug"]
+            for dst in person["can_request"]:
+                if dst in data:
+                    backend.can_request.setdefault(src, set()).add(dst)
+            for dst in person["owns_data"]:
+                owners = backend.owns_data.setdefault(dst, []) if dst in data else None
+                if owners is not None and src not in owners:
+                    owners.append(src)
+            for dst in person["manages"]:
+                if dst in people:
+                    backend.manages.setdefault(src, set()).add(dst)
+        for resource in org.data_resources:
+            src = resource["id"]
+            for dst in resource["requires_approval"]:
+                policies = backend.requires_approval.setdefault(src, [])
+                if dst in backend.policies and dst not in policies:
+                    policies.append(dst)
+        return backend
+
+    def _policy(self, data_id: str) -> dict | None:
+        policy_ids = self.requires_approval.get(data_id)
+        if not policy_ids:
+            return None
+        policy = self.policies[policy_ids[0]]
+        return {"level": policy.get("level"), "reason": policy.get("reason")}
+
+    def check_permission(self, requester_slug: str, data_id: str) -> bool:
+        return data_id in self.can_request.get(requester_slug, ())
+
+    def find_data_owner(self, data_id: str) -> str | None:
+        owners = self.owns_data.get(data_id)
+        return owners[0] if owners else None
+
+    def check_approval_required(self, data_id: str) -> dict | None:
+        return self._policy(data_id)
+
+    def full_routing_query(self, requester_slug: str, data_id: str) -> dict:
+        if not self.check_permission(requester_slug, data_id):
+            return {"has_permission": False, "owner_slug": None, "approval_level": None, "approval_reason": None}
+        policy = self._policy(data_id) or {}
+        return {
+            "has_permission": True,
+            "owner_slug": self.find_data_owner(data_id),
+            "approval_level": policy.get("level"),
+            "approval_reason": policy.get("reason"),
+        }
+
+    def requestable_data(self, requester_slug: str) -> list[dict]:
+        return [
+            {
+                "data_id": data_id,
+                "owner_slug": self.find_data_owner(data_id),
+                "requires_approval": bool(self.requires_approval.get(data_id)),
+            }
+            for data_id in sorted(self.can_request.get(requester_slug, ()))
+        ]
+
+    # Lookups never block, so the async variants just answer inline.
+
+    async def check_permission_async(self, requester_slug: str, data_id: str) -> bool:
+        return self.check_permission(requester_slug, data_id)
+
+    async def find_data_owner_async(self, data_id: str) -> str | None:
+        return self.find_data_owner(data_id)
+
+    async def check_approval_required_async(self, data_id: str) -> dict | None:
+        return self.check_approval_required(data_id)
+
+    async def full_routing_query_async(self, requester_slug: str, data_id: str) -> dict:
+        return self.full_routing_query(requester_slug, data_id)
+
+    async def requestable_data_async(self, requester_slug: str) -> list[dict]:
+        return self.requestable_data(requester_slug)
@@ -0,0 +1,88 @@
+"""Query-plan checks: every routing query must be index-backed.
+
+Runs ``EXPLAIN`` (or ``PROFILE``) for each query in ``app.graph.queries`` and
+reports the operators used. A query passes when its plan contains an index
+seek and no label/all-nodes scan. Against a local Neo4j container::
+
+    docker compose up -d neo4j
+    python -m app.graph.plans --seed
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any, Iterator
+
+from app.graph import queries
+
+QUERY_CASES: dict[str, tuple[str, dict[str, Any]]] = {
+    "check_permission": (queries.CHECK_PERMISSION_CYPHER, {"requester": "finance-manager", "data_id": "pnl"}),
+    "find_data_owner": (queries.FIND_DATA_OWNER_CYPHER, {"data_id": "pnl"}),
+    "check_approval_required": (queries.CHECK_APPROVAL_REQUIRED_CYPHER, {"data_id": "pnl"}),
+    "full_routing_query": (queries.FULL_ROUTING_CYPHER, {"requester": "finance-manager", "data_id": "pnl"}),
+    "requestable_data": (queries.REQUESTABLE_DATA_CYPHER, {"requester": "finance-manager"}),
+}
+
+INDEX_OPERATORS = ("NodeUniqueIndexSeek", "NodeIndexSeek")
+SCAN_OPERATORS = ("NodeByLabelScan", "AllNodesScan")
+
+
+def _operators(plan: dict[str, Any] | None) -> Iterator[str]:
+    if not plan:
+        return
+    # Neo4j 5 suffixes operators with the database, e.g. "NodeIndexSeek@neo4j".
+    yield plan["operatorType"].split("@")[0]
+    for child in plan.get("children", []):
+        yield from _operators(child)
+
+
+def query_plan(session, cypher: str, params: dict[str, Any], profile: bool = False) -> dict[str, Any]:
+    summary = session.run(("PROFILE " if profile else "EXPLAIN ") + cypher, **params).consume()
+    plan = summary.profile if profile else summary.plan
+    operators = list(_operators(plan))
+    result: dict[str, Any] = {
+        "operators": operators,
+        "index_backed": any(op.startswith(INDEX_OPERATORS) for op in operators)
+        and not any(op.startswith(SCAN_OPERATORS) for op in operators),
+    }
+    if profile and plan is not None:
+        result["db_hits"] = plan.get("dbHits")
+    return result
+
+
+def check_query_plans(driver=None, profile: bool = False) -> dict[str, dict[str, Any]]:
+    """Plan every query in QUERY_CASES; returns per-query operators and verdict."""
+    from app.graph.client import get_driver
+
+    driver = driver or get_driver()
+    with driver.session() as session:
+        return {
+            name: query_plan(session, cypher, params, profile=profile)
+            for name, (cypher, params) in QUERY_CASES.items()
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that graph queries are index-backed.")
+    parser.add_argument("--profile", action="store_true", help="use PROFILE instead of EXPLAIN")
+    parser.add_argument("--seed", action="store_true",
+                        help="ensure schema and upsert the default org first, leaving other data in place")
+    parser.add_argument("--wipe", action="store_true",
+                        help="with --seed, delete the whole graph and load only the default org")
+    args = parser.parse_args()
+
+    from app.graph.client import close_driver
+    from app.graph.schema import ensure_schema
+
+    try:
+        ensure_schema()
+        if args.seed:
+            from app.graph.seed import seed
+            seed(wipe=args.wipe, prune=args.wipe)
+        report = check_query_plans(profile=args.profile)
+    finally:
+        close_driver()
+    print(json.dumps(report, indent=2))
+    failed = [name for name, r in report.items() if not r["index_backed"]]
+    if failed:
+        raise SystemExit(f"Not index-backed: {', '.join(failed)}")
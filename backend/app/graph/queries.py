@@ -1,62 +1,170 @@
+"""Graph queries used for routing, behind a pluggable backend (``GRAPH_BACKEND``).
+
+``neo4j`` runs the Cypher below; ``memory`` answers from in-process adjacency
+dicts (see app.graph.memory) loaded from the same org definition as the seed.
+"""
 from __future__ import annotations
 
-from app.graph.client import run_query
+import threading
+
+from app.config import get_settings
+from app.graph.client import run_query, run_query_async
+
+CHECK_PERMISSION_CYPHER = """
+MATCH (r:Person {slug: $requester})-[:CAN_REQUEST]->(d:DataResource {id: $data_id})
+RETURN d.id AS data_id
+"""
+
+FIND_DATA_OWNER_CYPHER = """
+MATCH (owner:Person)-[:OWNS_DATA]->(d:DataResource {id: $data_id})
+RETURN owner.slug AS slug
+"""
+
+CHECK_APPROVAL_REQUIRED_CYPHER = """
+MATCH (d:DataResource {id: $data_id})-[:REQUIRES_APPROVAL]->(p:ApprovalPolicy)
+RETURN p.level AS level, p.reason AS reason
+"""
+
+FULL_ROUTING_CYPHER = """
+OPTIONAL MATCH (r:Person {slug: $requester})-[:CAN_REQUEST]->(d:DataResource {id: $data_id})
+WITH d, r
+OPTIONAL MATCH (owner:Person)-[:OWNS_DATA]->(d)
+OPTIONAL MATCH (d)-[:REQUIRES_APPROVAL]->(p:ApprovalPolicy)
+RETURN
+    d IS NOT NULL AS has_permission,
+    owner.slug AS owner_slug,
+    p.level AS approval_level,
+    p.reason AS approval_reason
+"""
+
+REQUESTABLE_DATA_CYPHER = """
+MATCH (r:Person {slug: $requester})-[:CAN_REQUEST]->(d:DataResource)
+OPTIONAL MATCH (owner:Person)-[:OWNS_DATA]->(d)
+OPTIONAL MATCH (d)-[:REQUIRES_APPROVAL]->(p:ApprovalPolicy)
+RETURN d.id AS data_id, collect(DISTINCT owner.slug)[0] AS owner_slug, count(p) > 0 AS requires_approval
+ORDER BY data_id
+"""
+
+NO_ROUTE = {"has_permission": False, "owner_slug": None, "approval_level": None, "approval_reason": None}
+
+
+class Neo4jBackend:
+    """Runs the routing queries as Cypher against Neo4j."""
+
+    def check_permission(self, requester_slug: str, data_id: str) -> bool:
+        rows = run_query(CHECK_PERMISSION_CYPHER, requester=requester_slug, data_id=data_id)
+        return len(rows) > 0
+
+    def find_data_owner(self, data_id: str) -> str | None:
+        rows = run_query(FIND_DATA_OWNER_CYPHER, data_id=data_id)
+        return rows[0]["slug"] if rows else None
+
+    def check_approval_required(self, data_id: str) -> dict | None:
+        rows = run_query(CHECK_APPROVAL_REQUIRED_CYPHER, data_id=data_id)
+        return rows[0] if rows else None
+
+    def full_routing_query(self, requester_slug: str, data_id: str) -> dict:
+        rows = run_query(FULL_ROUTING_CYPHER, requester=requester_slug, data_id=data_id)
+        return rows[0] if rows else dict(NO_ROUTE)
+
+    def requestable_data(self, requester_slug: str) -> list[dict]:
+        return run_query(REQUESTABLE_DATA_CYPHER, requester=requester_slug)
+
+    async def check_permission_async(self, requester_slug: str, data_id: str) -> bool:
+        rows = await run_query_async(CHECK_PERMISSION_CYPHER, requester=requester_slug, data_id=data_id)
+        return len(rows) > 0
+
+    async def find_data_owner_async(self, data_id: str) -> str | None:
+        rows = await run_query_async(FIND_DATA_OWNER_CYPHER, data_id=data_id)
+        return rows[0]["slug"] if rows else None
+
+    async def check_approval_required_async(self, data_id: str) -> dict | None:
+        rows = await run_query_async(CHECK_APPROVAL_REQUIRED_CYPHER, data_id=data_id)
+        return rows[0] if rows else None
+
+    async def full_routing_query_async(self, requester_slug: str, data_id: str) -> dict:
+        rows = await run_query_async(FULL_ROUTING_CYPHER, requester=requester_slug, data_id=data_id)
+        return rows[0] if rows else dict(NO_ROUTE)
+
+    async def requestable_data_async(self, requester_slug: str) -> list[dict]:
+        return await run_query_async(REQUESTABLE_DATA_CYPHER, requester=requester_slug)
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Return the configured graph backend, building it on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _build_backend()
+    return _backend
+
+
+def _build_backend():
+    settings = get_settings()
+    if settings.graph_backend == "memory":
+        from app.graph.loader import DEFAULT_ORG_PATH, load_definition
+        from app.graph.memory import MemoryBackend
+
+        return MemoryBackend.from_definition(load_definition(settings.graph_org_path or DEFAULT_ORG_PATH))
+    if settings.graph_backend != "neo4j":
+        raise ValueError(f"Unknown graph backend: {settings.graph_backend}")
+    return Neo4jBackend()
+
+
+def reset_backend() -> None:
+    """Drop the cached backend so the next query rebuilds it (e.g. after a reseed)."""
+    global _backend
+    with _backend_lock:
+        _backend = None
 
 
 def check_permission(requester_slug: str, data_id: str) -> bool:
     """Return True if the requester agent can access the data resource."""
-    rows = run_query(
-        """
-        MATCH (r:Person {slug: $requester})-[:CAN_REQUEST]->(d:DataResource {id: $data_id})
-        RETURN d.id AS data_id
-        """,
-        requester=requester_slug,
-        data_id=data_id,
-    )
-    return len(rows) > 0
+    return get_backend().check_permission(requester_slug, data_id)
 
 
 def find_data_owner(data_id: str) -> str | None:
     """Return the slug of the agent that owns the data resource."""
-    rows = run_query(
-        """
-        MATCH (owner:Person)-[:OWNS_DATA]->(d:DataResource {id: $data_id})
-        RETURN owner.slug AS slug
-        """,
-        data_id=data_id,
-    )
-    return rows[0]["slug"] if rows else None
+    return get_backend().find_data_owner(data_id)
 
 
 def check_approval_required(data_id: str) -> dict | None:
     """Return the approval policy if the data resource requires approval, else None."""
-    rows = run_query(
-        """
-        MATCH (d:DataResource {id: $data_id})-[:REQUIRES_APPROVAL]->(p:ApprovalPolicy)
-        RETURN p.level AS level, p.reason AS reason
-        """,
-        data_id=data_id,
-    )
-    return rows[0] if rows else None
+    return get_backend().check_approval_required(data_id)
 
 
 def full_routing_query(requester_slug: str, data_id: str) -> dict:
     """Combined query: permission check, owner lookup, approval requirement."""
-    rows = run_query(
-        """
-        OPTIONAL MATCH (r:Person {slug: $requester})-[:CAN_REQUEST]->(d:DataResource {id: $data_id})
-        WITH d, r
-        OPTIONAL MATCH (owner:Person)-[:OWNS_DATA]->(d)
-        OPTIONAL MATCH (d)-[:REQUIRES_APPROVAL]->(p:ApprovalPolicy)
-        RETURN
-            d IS NOT NULL AS has_permission,
-            owner.slug AS owner_slug,
-            p.level AS approval_level,
-            p.reason AS approval_reason
-        """,
-        requester=requester_slug,
-        data_id=data_id,
-    )
-    if not rows:
-        return {"has_permission": False, "owner_slug": None, "approval_level": None, "approval_reason": None}
-    return rows[0]
+    return get_backend().full_routing_query(requester_slug, data_id)
+
+
+def requestable_data(requester_slug: str) -> list[dict]:
+    """Data the requester can request, with each resource's owner and whether it is approval-gated."""
+    return get_backend().requestable_data(requester_slug)
+
+
+# ── Async variants (used by the async orchestrator path) ────────────────
+
+async def check_permission_async(requester_slug: str, data_id: str) -> bool:
+    return await get_backend().check_permission_async(requester_slug, data_id)
+
+
+async def find_data_owner_async(data_id: str) -> str | None:
+    return await get_backend().find_data_owner_async(data_id)
+
+
+async def check_approval_required_async(data_id: str) -> dict | None:
+    return await get_backend().check_approval_required_async(data_id)
+
+
+async def full_routing_query_async(requester_slug: str, data_id: str) -> dict:
+    return await get_backend().full_routing_query_async(requester_slug, data_id)
+
+
+async def requestable_data_async(requester_slug: str) -> list[dict]:
+    return await get_backend().requestable_data_async(requester_slug)
@@ -0,0 +1,40 @@
+"""Idempotent graph schema bootstrap: uniqueness constraints and indexes.
+
+Routing queries look people up by ``Person.slug`` and data by
+``DataResource.id``; without these constraints every lookup is a label scan.
+Each uniqueness constraint is backed by a range index the planner can seek on.
+"""
+from __future__ import annotations
+
+import logging
+
+from app.graph.client import get_driver
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_STATEMENTS: dict[str, str] = {
+    "person_slug_unique": (
+        "CREATE CONSTRAINT person_slug_unique IF NOT EXISTS "
+        "FOR (p:Person) REQUIRE p.slug IS UNIQUE"
+    ),
+    "data_resource_id_unique": (
+        "CREATE CONSTRAINT data_resource_id_unique IF NOT EXISTS "
+        "FOR (d:DataResource) REQUIRE d.id IS UNIQUE"
+    ),
+    "approval_policy_id_unique": (
+        "CREATE CONSTRAINT approval_policy_id_unique IF NOT EXISTS "
+        "FOR (p:ApprovalPolicy) REQUIRE p.id IS UNIQUE"
+    ),
+}
+
+
+def ensure_schema(driver=None, await_seconds: int = 60) -> list[str]:
+    """Create any missing constraints/indexes and wait until they are online."""
+    driver = driver or get_driver()
+    with driver.session() as session:
+        for name, statement in SCHEMA_STATEMENTS.items():
+            session.run(statement).consume()
+            logger.debug("Schema ensured: %s", name)
+        session.run("CALL db.awaitIndexes($timeout)", timeout=await_seconds).consume()
+    logger.info("Graph schema ready (%d constraints)", len(SCHEMA_STATEMENTS))
+    return list(SCHEMA_STATEMENTS)
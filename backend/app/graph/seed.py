@@ -1,63 +1,58 @@
 """Seed the Neo4j graph with agent/data/policy nodes and relationships."""
 from __future__ import annotations
 
+import argparse
 import logging
+from pathlib import Path
 
+from app.config import get_settings
 from app.graph.client import get_driver, close_driver
+from app.graph.loader import DEFAULT_ORG_PATH, GraphLoader, LoadStats, load_definition
+from app.graph.queries import reset_backend
+from app.graph.schema import ensure_schema
 
 logger = logging.getLogger(__name__)
 
-CLEAR_CYPHER = "MATCH (n) DETACH DELETE n"
 
-SEED_CYPHER = """
-CREATE (fm:Person  {slug: 'finance-manager', name: 'fm_agent',   role: 'Finance Manager'})
-CREATE (acct:Person {slug: 'accountant',      name: 'acct_agent',  role: 'Accountant'})
-CREATE (ceo:Person  {slug: 'ceo',             name: 'ceo_agent',   role: 'CEO'})
+def seed(
+    path: str | Path = DEFAULT_ORG_PATH,
+    wipe: bool = True,
+    batch_size: int | None = None,
+    prune: bool = True,
+) -> LoadStats:
+    """Load an org definition into the graph.
 
-CREATE (pnl:DataResource      {id: 'pnl',      label: 'Profit & Loss Statement'})
-CREATE (invoices:DataResource  {id: 'invoices', label: 'Invoices'})
-CREATE (expenses:DataResource  {id: 'expenses', label: 'Expense Reports'})
-CREATE (budget:DataResource    {id: 'budget',   label: 'Budget Forecast'})
+    With ``wipe=False`` the load is incremental: existing nodes are updated in
+    place, missing relationships are added and, unless ``prune=False``, nodes
+    and relationships no longer in the definition are removed.
 
-CREATE (pnlPolicy:ApprovalPolicy {level: 'ceo', reason: 'P&L contains sensitive financial data requiring executive approval'})
-CREATE (budgetPolicy:ApprovalPolicy {level: 'ceo', reason: 'Budget forecast requires executive sign-off'})
-
-CREATE (fm)-[:MANAGES]->(acct)
-CREATE (ceo)-[:MANAGES]->(fm)
-
-CREATE (acct)-[:OWNS_DATA]->(pnl)
-CREATE (acct)-[:OWNS_DATA]->(invoices)
-CREATE (acct)-[:OWNS_DATA]->(expenses)
-CREATE (fm)-[:OWNS_DATA]->(budget)
-
-CREATE (fm)-[:CAN_REQUEST]->(pnl)
-CREATE (fm)-[:CAN_REQUEST]->(invoices)
-CREATE (fm)-[:CAN_REQUEST]->(expenses)
-CREATE (fm)-[:CAN_REQUEST]->(budget)
-CREATE (ceo)-[:CAN_REQUEST]->(pnl)
-CREATE (ceo)-[:CAN_REQUEST]->(invoices)
-CREATE (ceo)-[:CAN_REQUEST]->(expenses)
-CREATE (ceo)-[:CAN_REQUEST]->(budget)
-CREATE (acct)-[:CAN_REQUEST]->(pnl)
-CREATE (acct)-[:CAN_REQUEST]->(invoices)
-CREATE (acct)-[:CAN_REQUEST]->(expenses)
-
-CREATE (pnl)-[:REQUIRES_APPROVAL]->(pnlPolicy)
-CREATE (budget)-[:REQUIRES_APPROVAL]->(budgetPolicy)
-"""
-
-
-def seed():
+    The in-process graph backend is reset; tool results cached under the
+    ``graph`` tag are the caller's to invalidate.
+    """
+    org = load_definition(path)
     driver = get_driver()
-    with driver.session() as session:
-        session.run(CLEAR_CYPHER).consume()
-        session.run(SEED_CYPHER).consume()
-    logger.info("Neo4j graph seeded successfully")
+    # Constraints first: MERGE and relationship MATCHes then seek instead of scan.
+    ensure_schema(driver)
+    loader = GraphLoader(driver, batch_size or get_settings().graph_load_batch_size)
+    stats = loader.load(org, wipe=wipe, prune=prune)
+    reset_backend()
+    logger.info("Neo4j graph seeded successfully from %s", path)
+    return stats
 
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Load an org definition into Neo4j.")
+    parser.add_argument("path", nargs="?", default=str(DEFAULT_ORG_PATH),
+                        help="YAML/JSON file or directory of CSVs (default: bundled org.yaml)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="upsert into the existing graph instead of wiping it first")
+    parser.add_argument("--keep-missing", action="store_true",
+                        help="with --incremental, keep nodes and relationships the definition no longer lists")
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
     try:
-        seed()
+        stats = seed(args.path, wipe=not args.incremental, batch_size=args.batch_size, prune=not args.keep_missing)
+        print(stats.summary())
     finally:
         close_driver()
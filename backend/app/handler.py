@@ -1,42 +1,58 @@
-import asyncio
-import json
+"""AWS Lambda entry point (handler: ``app.handler.handler``).
+
+Module scope runs once per execution environment: settings are read, and
+with ``LAMBDA_PREINIT=true`` Strands, the Bedrock client and pooled agents
+are built during the init phase instead of on the first request. Warm
+invocations then only pay for the model calls.
+"""
+from __future__ import annotations
+
 import logging
-from aws_lambda_powertools import Logger
-from agent import run_agent
 
-logger = Logger()
+from app.agent import preinit, run_agent
+from app.config import get_settings
+from app.serialization import dumps_str, loads
 
-@logger.inject_lambda_context
-def handler(event, context):
-    logger.info("Received event: %s", event)
-    
-    # Get query from event body or use default
-    body = event.get('body', '{}')
-    if isinstance(body, str):
+try:
+    from aws_lambda_powertools import Logger
+except ImportError:  # pragma: no cover - optional dependency
+    Logger = None
+
+logger = Logger() if Logger is not None else logging.getLogger(__name__)
+
+DEFAULT_QUERY = "Hello! How can I assist you with AgentOrg today?"
+
+settings = get_settings()
+if settings.lambda_preinit:
+    logger.info("Pre-initialising: %s", preinit(settings.warmup_personas or [settings.default_persona]))
+
+
+def _parse_body(event: dict) -> dict:
+    body = event.get("body") or {}
+    if isinstance(body, (str, bytes)):
         try:
-            body_dict = json.loads(body)
-        except json.JSONDecodeError:
-            body_dict = {}
-    else:
-        body_dict = body
-        
-    query = body_dict.get('query', "Hello! How can I assist you with AgentOrg today?")
-    
-    # Run the agent
-    result = run_agent(query)
-    
-    # strands result object has .content or similar
-    # Let's assume it has .content for simplicity
-    try:
-        response_text = result.content if hasattr(result, 'content') else str(result)
-    except Exception as e:
-        response_text = f"Error processing result: {str(e)}"
+            body = loads(body)
+        except ValueError:
+            body = {}
+    return body if isinstance(body, dict) else {}
+
+
+def _handler(event, context):
+    logger.info("Received event: %s", event)
+    body = _parse_body(event)
+    query = body.get("query") or body.get("prompt") or DEFAULT_QUERY
 
+    result = run_agent(query, body.get("persona"), body.get("conversation_id"))
+    status_code = {"ok": 200, "pending_approval": 202, "cancelled": 504}.get(result.status, 500)
     return {
-        'statusCode': 200,
-        'body': json.dumps({
-            'message': 'Success',
-            'query': query,
-            'response': response_text
-        })
+        "statusCode": status_code,
+        "headers": {"Content-Type": "application/json"},
+        "body": dumps_str({
+            "message": "Success" if status_code < 300 else "Error",
+            "query": query,
+            **result.model_dump(),
+        }),
     }
+
+
+handler = logger.inject_lambda_context(_handler) if Logger is not None else _handler
@@ -0,0 +1,81 @@
+"""Version-keyed response caching and conditional GET helpers.
+
+Resources that carry a change counter (the agent registry, the approval
+queue) serialize each distinct view once per version. Polls then either get
+the cached bytes or, if the client's ``If-None-Match`` matches, a bodiless 304.
+"""
+from __future__ import annotations
+
+import threading
+import uuid
+from typing import Any, Callable, Hashable
+
+from fastapi import Request, Response
+
+from app.serialization import dumps
+
+# Version counters restart with the process; the boot id keeps old ETags from
+# matching new content after a restart.
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+
+class CachedBody:
+    __slots__ = ("etag", "body", "headers")
+
+    def __init__(self, etag: str, body: bytes, headers: dict[str, str]) -> None:
+        self.etag = etag
+        self.body = body
+        self.headers = headers
+
+
+class VersionedCache:
+    """Serialized bodies keyed by view, valid only for a single source version."""
+
+    def __init__(self, name: str, max_entries: int = 256) -> None:
+        self._name = name
+        self._max_entries = max_entries
+        self._version: Any = None
+        self._entries: dict[Hashable, CachedBody] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        version: Any,
+        key: Hashable,
+        build: Callable[[], tuple[Any, dict[str, str]]],
+    ) -> CachedBody:
+        """Cached body for ``key`` at ``version``; ``build`` returns (payload, headers)."""
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            cached = self._entries.get(key)
+            if cached is not None:
+                return cached
+        payload, headers = build()
+        etag = f'"{self._name}-{_BOOT_ID}-{version}-{abs(hash(key)) & 0xFFFFFFFF:08x}"'
+        cached = CachedBody(etag, dumps(payload), headers)
+        with self._lock:
+            if version == self._version:
+                if len(self._entries) >= self._max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+                self._entries[key] = cached
+        return cached
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def conditional_response(request: Request, cached: CachedBody) -> Response:
+    """200 with the cached body, or 304 if the client already has this version."""
+    # no-cache: browsers may store the body but must revalidate on every poll.
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache", **cached.headers}
+    if _etag_matches(request, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(cached.body, media_type="application/json", headers=headers)
@@ -1,7 +1,8 @@
-import asyncio
-import sys
+"""Run one chat turn from the command line: ``python -m app.main [--persona SLUG] QUERY``."""
+import argparse
 import logging
-from agent import run_agent
+
+from app.agent import run_agent
 
 # Configure logging
 logging.basicConfig(
@@ -11,20 +12,21 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
 def main():
-    if len(sys.argv) > 1:
-        query = " ".join(sys.argv[1:])
-    else:
-        query = "Hello! How can I assist you with AgentOrg today?"
-        
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("query", nargs="*")
+    parser.add_argument("--persona", default=None)
+    args = parser.parse_args()
+    query = " ".join(args.query) or "Hello! How can I assist you with AgentOrg today?"
+
     logger.info("Running agent with query: %s", query)
     try:
-        result = run_agent(query)
-        # Assuming the result has a .content attribute like in strands
-        response = result.content if hasattr(result, 'content') else str(result)
-        logger.info("Agent Response: %s", response)
+        result = run_agent(query, args.persona)
+        logger.info("Agent Response (%s): %s", result.status, result.response)
     except Exception as e:
         logger.error("Error running agent: %s", e, exc_info=True)
 
+
 if __name__ == "__main__":
     main()
@@ -17,6 +17,19 @@ class ChatResponse(BaseModel):
     conversation_id: str
     agent: str
     trace_id: Optional[str] = None
+    status: Literal["ok", "error", "cancelled", "pending_approval"] = "ok"
+    approval_id: Optional[str] = None  # set when the run is parked on an approval
+
+
+class BatchChatRequest(BaseModel):
+    items: list[ChatRequest] = Field(min_length=1)
+    parallelism: Optional[int] = Field(default=None, ge=1)
+
+
+class BatchChatResult(ChatResponse):
+    index: int
+    persona: str
+    duration_ms: float
 
 
 # ── Approvals ───────────────────────────────────────────────────────────
@@ -26,11 +39,16 @@ class ApprovalOut(BaseModel):
     target_agent: str
     data_type: str
     sensitivity_reason: str
-    status: Literal["pending", "approved", "denied", "fulfilled"]
+    status: Literal["pending", "approved", "denied", "fulfilled", "expired"]
     created_at: str
     resolved_at: Optional[str] = None
 
 
+class ApprovalWaitOut(ApprovalOut):
+    settled: bool  # False if the wait timed out first
+    response: Optional[str] = None  # answer of the run resumed by this decision
+
+
 # ── Agent Config ────────────────────────────────────────────────────────
 class PermissionsBlock(BaseModel):
     dataAccess: list[str] = Field(default_factory=list)
@@ -1,6 +1,10 @@
 """In-memory approval queue for inter-agent data requests."""
 from __future__ import annotations
 
+import asyncio
+import bisect
+import itertools
+import threading
 import uuid
 import logging
 from dataclasses import dataclass, field
@@ -16,6 +20,7 @@ class ApprovalStatus(str, Enum):
     APPROVED = "approved"
     DENIED = "denied"
     FULFILLED = "fulfilled"
+    EXPIRED = "expired"
 
 
 @dataclass
@@ -30,7 +35,27 @@ class ApprovalRequest:
     status: ApprovalStatus = ApprovalStatus.PENDING
     created_at: str = ""
     resolved_at: Optional[str] = None
-    stored_data: Any = None  # Data cached when target agent responds, released on approval
+    stored_data: Any = None  # Payload (inline or spilled) released on approval
+    deferred: bool = False  # target agent runs only after approval (stored_data filled then)
+    seq: int = 0  # creation order; list cursors are seq values
+    suspended: Any = None  # SuspendedRun parked until this request is resolved
+    held: bool = False  # a run is parking on this request; it, not /fulfill, releases the data
+    resuming: bool = False  # a suspended run is being resumed right now
+    response: Optional[str] = None  # final answer of the resumed run
+
+    @property
+    def settled(self) -> bool:
+        """Resolved, and any run waiting on it has finished resuming.
+
+        A run parked on several approvals keeps ``suspended`` set on each of
+        them until the last one is resolved and it resumes.
+        """
+        return (
+            self.status != ApprovalStatus.PENDING
+            and not self.held
+            and not self.resuming
+            and self.suspended is None
+        )
 
     def __post_init__(self):
         if not self.created_at:
@@ -50,10 +75,74 @@ class ApprovalRequest:
 
 
 class ApprovalQueue:
-    """In-memory store for approval requests."""
+    """In-memory store for approval requests.
+
+    ``version`` bumps on every change so callers can cache serialized lists
+    and answer conditional GETs. Requests are also indexed by status in
+    ``seq`` order, so a page after a cursor costs O(log n + page) rather than
+    a scan of the whole history.
+    """
 
     def __init__(self) -> None:
         self._requests: dict[str, ApprovalRequest] = {}
+        self._by_seq: dict[int, ApprovalRequest] = {}
+        self._seqs: dict[str | None, list[int]] = {None: []}  # None → any status
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self._waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self.version = 0
+
+    def _drop_seq(self, key: str | None, seq: int) -> None:
+        seqs = self._seqs.get(key, [])
+        i = bisect.bisect_left(seqs, seq)
+        if i < len(seqs) and seqs[i] == seq:
+            del seqs[i]
+
+    @staticmethod
+    def _discard_payload(req: ApprovalRequest) -> None:
+        if req.stored_data is not None:
+            req.stored_data.discard()
+            req.stored_data = None
+
+    def _set_status(self, req: ApprovalRequest, status: ApprovalStatus) -> None:
+        self._drop_seq(req.status.value, req.seq)
+        req.status = status
+        bisect.insort(self._seqs.setdefault(status.value, []), req.seq)
+        self.version += 1
+        self._wake(req.id)
+
+    def _wake(self, approval_id: str) -> None:
+        for loop, future in self._waiters.pop(approval_id, []):
+            loop.call_soon_threadsafe(lambda f=future: f.done() or f.set_result(None))
+
+    def touch(self, approval_id: str) -> None:
+        """Record a change to a request made outside the queue and wake its waiters."""
+        with self._lock:
+            self.version += 1
+            self._wake(approval_id)
+
+    async def wait_settled(self, approval_id: str, timeout: float) -> Optional[ApprovalRequest]:
+        """Wait up to ``timeout`` seconds for a request to settle; returns it either way."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            with self._lock:
+                req = self._requests.get(approval_id)
+                if req is None or req.settled:
+                    return req
+                future = loop.create_future()
+                self._waiters.setdefault(approval_id, []).append((loop, future))
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return req
+            try:
+                await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
+                with self._lock:
+                    waiters = self._waiters.get(approval_id, [])
+                    if (loop, future) in waiters:
+                        waiters.remove((loop, future))
+                return self._requests.get(approval_id)
 
     def create(
         self,
@@ -73,7 +162,13 @@ class ApprovalQueue:
             conversation_id=conversation_id,
             ask=ask,
         )
-        self._requests[req.id] = req
+        with self._lock:
+            req.seq = next(self._counter)
+            self._requests[req.id] = req
+            self._by_seq[req.seq] = req
+            self._seqs[None].append(req.seq)
+            self._seqs.setdefault(req.status.value, []).append(req.seq)
+            self.version += 1
         logger.info("Created approval request %s: %s → %s (%s)", req.id, source_agent, target_agent, data_type)
         return req
 
@@ -81,40 +176,106 @@ class ApprovalQueue:
         return self._requests.get(approval_id)
 
     def approve(self, approval_id: str) -> Optional[ApprovalRequest]:
-        req = self._requests.get(approval_id)
-        if req and req.status == ApprovalStatus.PENDING:
-            req.status = ApprovalStatus.APPROVED
-            req.resolved_at = datetime.now(timezone.utc).isoformat()
-            logger.info("Approved request %s", approval_id)
+        with self._lock:
+            req = self._requests.get(approval_id)
+            if req and req.status == ApprovalStatus.PENDING:
+                self._set_status(req, ApprovalStatus.APPROVED)
+                req.resolved_at = datetime.now(timezone.utc).isoformat()
+                logger.info("Approved request %s", approval_id)
         return req
 
     def deny(self, approval_id: str) -> Optional[ApprovalRequest]:
-        req = self._requests.get(approval_id)
-        if req and req.status == ApprovalStatus.PENDING:
-            req.status = ApprovalStatus.DENIED
-            req.resolved_at = datetime.now(timezone.utc).isoformat()
-            logger.info("Denied request %s", approval_id)
+        with self._lock:
+            req = self._requests.get(approval_id)
+            if req and req.status == ApprovalStatus.PENDING:
+                self._set_status(req, ApprovalStatus.DENIED)
+                req.resolved_at = datetime.now(timezone.utc).isoformat()
+                self._discard_payload(req)
+                logger.info("Denied request %s", approval_id)
         return req
 
     def fulfill(self, approval_id: str) -> Optional[ApprovalRequest]:
-        req = self._requests.get(approval_id)
-        if req and req.status == ApprovalStatus.APPROVED:
-            req.status = ApprovalStatus.FULFILLED
-            logger.info("Fulfilled request %s", approval_id)
+        with self._lock:
+            req = self._requests.get(approval_id)
+            if req and req.status == ApprovalStatus.APPROVED:
+                self._set_status(req, ApprovalStatus.FULFILLED)
+                # Released; nothing reads stored data once fulfilled.
+                self._discard_payload(req)
+                logger.info("Fulfilled request %s", approval_id)
         return req
 
+    def expire(self, max_age_seconds: float) -> list[ApprovalRequest]:
+        """Mark pending requests older than ``max_age_seconds`` expired and drop their data."""
+        cutoff = datetime.now(timezone.utc).timestamp() - max_age_seconds
+        expired = []
+        with self._lock:
+            for seq in list(self._seqs.get(ApprovalStatus.PENDING.value, [])):
+                req = self._by_seq[seq]
+                if datetime.fromisoformat(req.created_at).timestamp() >= cutoff:
+                    # seq order is creation order, so everything after is newer.
+                    break
+                self._set_status(req, ApprovalStatus.EXPIRED)
+                req.resolved_at = datetime.now(timezone.utc).isoformat()
+                self._discard_payload(req)
+                expired.append(req)
+        if expired:
+            logger.info("Expired %d pending approval requests", len(expired))
+        return expired
+
     def list_by_status(self, status: Optional[str] = None) -> list[dict]:
-        results = self._requests.values()
-        if status:
-            results = [r for r in results if r.status.value == status]
-        return [r.to_dict() for r in results]
+        return self.page(status=status)[0]
+
+    def page(
+        self,
+        status: Optional[str] = None,
+        after: int = 0,
+        limit: Optional[int] = None,
+        **filters: str,
+    ) -> tuple[list[dict], Optional[int]]:
+        """Requests with ``seq > after`` in creation order, plus the next cursor.
+
+        ``filters`` match ApprovalRequest fields exactly (e.g. ``source_agent``).
+        The cursor is ``None`` once there is nothing further to read.
+        """
+        filters = {k: v for k, v in filters.items() if v}
+        with self._lock:
+            seqs = self._seqs.get(status or None, [])
+            results: list[dict] = []
+            last = None
+            for i in range(bisect.bisect_right(seqs, after), len(seqs)):
+                req = self._by_seq[seqs[i]]
+                if any(getattr(req, k) != v for k, v in filters.items()):
+                    continue
+                if limit is not None and len(results) == limit:
+                    return results, last
+                results.append(req.to_dict())
+                last = req.seq
+        return results, None
 
     def delete(self, approval_id: str) -> bool:
-        return self._requests.pop(approval_id, None) is not None
+        with self._lock:
+            req = self._requests.pop(approval_id, None)
+            if req is None:
+                return False
+            self._discard_payload(req)
+            del self._by_seq[req.seq]
+            self._drop_seq(None, req.seq)
+            self._drop_seq(req.status.value, req.seq)
+            self.version += 1
+            self._wake(approval_id)
+        return True
 
     def clear(self) -> int:
-        count = len(self._requests)
-        self._requests.clear()
+        with self._lock:
+            count = len(self._requests)
+            for req in self._requests.values():
+                self._discard_payload(req)
+            self._requests.clear()
+            self._by_seq.clear()
+            self._seqs = {None: []}
+            self.version += 1
+            for approval_id in list(self._waiters):
+                self._wake(approval_id)
         logger.info("Cleared %d approval requests", count)
         return count
 
@@ -0,0 +1,126 @@
+"""Per-request deadline budget and cooperative cancellation."""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Generator, Optional
+
+DEADLINE_EXCEEDED = "deadline_exceeded"
+CLIENT_DISCONNECTED = "client_disconnected"
+
+
+class RequestCancelled(Exception):
+    """Raised at a cancellation checkpoint once the request has been cancelled."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"Request cancelled: {reason}")
+        self.reason = reason
+
+
+class Deadline:
+    """A time budget shared by everything a single chat request starts.
+
+    The same instance is handed to the agent run, its tool calls, nested
+    sub-agent hops and graph queries. Work checks it cooperatively at safe
+    points (before model calls, before tool calls, before queries).
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        self._expires_at = time.monotonic() + timeout if timeout else None
+        self._cancelled = threading.Event()
+        self.reason: Optional[str] = None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the budget, or None if the budget is unbounded."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._cancelled.is_set() and self.expired:
+            self.cancel(DEADLINE_EXCEEDED)
+        return self._cancelled.is_set()
+
+    def cancel(self, reason: str) -> None:
+        if not self._cancelled.is_set():
+            self.reason = reason
+            self._cancelled.set()
+
+    def check(self) -> None:
+        """Raise RequestCancelled if the request was cancelled or ran out of time."""
+        if self.cancelled:
+            raise RequestCancelled(self.reason or DEADLINE_EXCEEDED)
+
+    def timeout(self, cap: Optional[float] = None) -> Optional[float]:
+        """Remaining budget clamped to ``cap`` — handy for client-side timeouts."""
+        remaining = self.remaining()
+        if remaining is None:
+            return cap
+        return min(remaining, cap) if cap is not None else remaining
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "agentorg_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+@contextmanager
+def bind_deadline(deadline: Optional[Deadline]) -> Generator[Optional[Deadline], None, None]:
+    """Make ``deadline`` the current one for code running in this context."""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def surface_cancellation() -> Generator[None, None, None]:
+    """Re-raise a RequestCancelled that a framework wrapped in its own exception.
+
+    Strands reports hook failures as ``EventLoopException`` chained from the
+    original error; callers only care that the request was cancelled.
+    """
+    try:
+        yield
+    except RequestCancelled:
+        raise
+    except Exception as e:
+        cause: BaseException | None = e.__cause__
+        while cause is not None:
+            if isinstance(cause, RequestCancelled):
+                raise RequestCancelled(cause.reason) from e
+            cause = cause.__cause__
+        raise
+
+
+async def run_with_deadline(
+    awaitable: Awaitable[Any], deadline: Deadline, poll_interval: float = 0.25
+) -> Any:
+    """Await ``awaitable`` but stop waiting as soon as ``deadline`` is cancelled.
+
+    Threads can't be interrupted, so work running in one keeps going until its
+    next checkpoint; the caller is released immediately either way.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=deadline.timeout(poll_interval))
+            if task in done:
+                return task.result()
+            deadline.check()
+    except BaseException:
+        task.cancel()
+        raise
@@ -15,8 +15,18 @@ class EventStreamManager:
 
     def __init__(self) -> None:
         self._queues: dict[str, list[asyncio.Queue]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Remember the event loop that owns the subscriber queues."""
+        self._loop = loop
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        return self._loop
 
     def subscribe(self, conversation_id: str) -> asyncio.Queue:
+        self.bind_loop(asyncio.get_running_loop())
         q: asyncio.Queue = asyncio.Queue()
         self._queues.setdefault(conversation_id, []).append(q)
         logger.debug("SSE subscriber added for conversation %s", conversation_id)
@@ -58,25 +68,33 @@ class EventStreamManager:
         if trace_id:
             event["trace_id"] = trace_id
 
+        if self._loop is None:
+            self.bind_loop(asyncio.get_running_loop())
         for q in self._queues.get(conversation_id, []):
             await q.put(event)
 
         logger.debug("Emitted %s for conversation %s", event_type, conversation_id)
 
     def emit_sync(self, conversation_id: str, event_type: str, agent: str, **kwargs) -> None:
-        """Fire-and-forget emit from synchronous code (best-effort)."""
+        """Fire-and-forget emit from synchronous code (best-effort).
+
+        Agent runs happen in worker threads, so the event is handed to the loop
+        that owns the subscriber queues rather than whatever loop the calling
+        thread happens to have.
+        """
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            logger.debug("No event loop for sync emit — skipping SSE event %s", event_type)
+            return
+        coro = self.emit(conversation_id, event_type, agent, **kwargs)
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.ensure_future(
-                    self.emit(conversation_id, event_type, agent, **kwargs)
-                )
-            else:
-                loop.run_until_complete(
-                    self.emit(conversation_id, event_type, agent, **kwargs)
-                )
+            running = asyncio.get_running_loop()
         except RuntimeError:
-            logger.debug("No event loop for sync emit — skipping SSE event %s", event_type)
+            running = None
+        if running is loop:
+            loop.create_task(coro)
+        else:
+            asyncio.run_coroutine_threadsafe(coro, loop)
 
 
 event_manager = EventStreamManager()
@@ -0,0 +1,148 @@
+"""Direct data_type → tool calls for routine inter-agent requests.
+
+An owner's AgentSpec can declare which of its tools serves a data type and
+how to fill that tool's parameters from the ask::
+
+    data_tools={
+        "pnl": {"tool": "pull_pnl", "params": {"quarter": "quarter", "year": "year"}},
+        "invoices": {
+            "tool": "pull_invoices",
+            "params": {"status_filter": {"choices": ["paid", "pending", "overdue"]}},
+            "defaults": {"status_filter": "all"},
+        },
+    }
+
+A param is either the name of an extractor in ``EXTRACTORS`` or
+``{"choices": [...]}`` (first choice mentioned in the ask wins). When every
+parameter resolves and the ask is a plain fetch, the orchestrator calls the
+tool itself instead of prompting the owner's agent. Anything else — an
+unmapped data type, a missing parameter, an analytical ask — falls back to
+the agent, as does a direct call whose tool returns an error result.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from app.agent_factory import AgentFactory, AgentSpec
+from app.serialization import tool_payload
+
+logger = logging.getLogger(__name__)
+
+# Asks that need reasoning over the data, not just the data.
+FREE_FORM = re.compile(
+    r"\b(why|how come|explain\w*|compar\w*|analy[sz]\w*|summar\w*|trend\w*|forecast\w*|reconcil\w*"
+    r"|insight\w*|recommend\w*|versus|vs)\b",
+    re.IGNORECASE,
+)
+
+_QUARTER_WORDS = {"first": 1, "1st": 1, "second": 2, "2nd": 2, "third": 3, "3rd": 3, "fourth": 4, "4th": 4}
+_QUARTER = re.compile(r"\bQ([1-4])\b|\b(first|1st|second|2nd|third|3rd|fourth|4th)\s+quarter\b", re.IGNORECASE)
+_YEAR = re.compile(r"\b(?:FY\s?)?((?:19|20)\d{2})\b", re.IGNORECASE)
+
+
+def _quarter(ask: str) -> str | None:
+    m = _QUARTER.search(ask)
+    if not m:
+        return None
+    return f"Q{m.group(1) or _QUARTER_WORDS[m.group(2).lower()]}"
+
+
+def _year(ask: str) -> str | None:
+    m = _YEAR.search(ask)
+    return m.group(1) if m else None
+
+
+EXTRACTORS: dict[str, Callable[[str], str | None]] = {
+    "quarter": _quarter,
+    "year": _year,
+}
+
+_stats = {"direct": 0, "fallback": 0, "failed": 0}
+
+
+class DirectCallFailed(Exception):
+    """The tool behind a direct call returned an error result."""
+
+
+def _choice(ask: str, choices: list[str]) -> str | None:
+    text = ask.lower()
+    for choice in choices:
+        words = choice.lower().replace("_", " ")
+        if re.search(rf"\b{re.escape(words)}\b", text):
+            return choice
+    return None
+
+
+@dataclass
+class DirectCall:
+    tool_name: str
+    kwargs: dict[str, Any]
+
+    @property
+    def key(self) -> tuple:
+        return (self.tool_name, tuple(sorted(self.kwargs.items())))
+
+    async def run(self) -> Any:
+        tool = AgentFactory.get_tool(self.tool_name)
+        # Decorated tools stay callable as plain functions.
+        if inspect.iscoroutinefunction(getattr(tool, "_tool_func", None)):
+            result = await tool(**self.kwargs)
+        else:
+            result = await asyncio.to_thread(tool, **self.kwargs)
+        payload = tool_payload(result)
+        if isinstance(result, dict) and result.get("status") == "error":
+            message = payload.get("message") if isinstance(payload, dict) else payload
+            raise DirectCallFailed(f"{self.tool_name}: {message}")
+        return payload
+
+
+def plan(spec: AgentSpec, data_type: str, ask: str, record: bool = True) -> DirectCall | None:
+    """A direct tool call that answers ``ask`` for ``spec``, or None to use the agent.
+
+    ``record=False`` leaves the direct/fallback counters alone (speculative plans).
+    """
+    mapping = spec.data_tools.get(data_type)
+    if mapping is None or FREE_FORM.search(ask or ""):
+        return _fallback(spec, data_type, "unmapped" if mapping is None else "free-form ask", record)
+    tool_name = mapping["tool"]
+    if tool_name not in spec.tools or AgentFactory.get_tool(tool_name) is None:
+        return _fallback(spec, data_type, f"tool {tool_name} unavailable", record)
+
+    kwargs: dict[str, Any] = {}
+    defaults = mapping.get("defaults", {})
+    for param, how in mapping.get("params", {}).items():
+        if isinstance(how, dict):
+            value = _choice(ask, how.get("choices", []))
+        else:
+            value = EXTRACTORS[how](ask)
+        if value is None:
+            value = defaults.get(param)
+        if value is None:
+            return _fallback(spec, data_type, f"no value for {param}", record)
+        kwargs[param] = value
+    if record:
+        _stats["direct"] += 1
+    logger.debug("Fast path for %s/%s: %s(%s)", spec.slug, data_type, tool_name, kwargs)
+    return DirectCall(tool_name, kwargs)
+
+
+def _fallback(spec: AgentSpec, data_type: str, why: str, record: bool = True) -> None:
+    if record:
+        _stats["fallback"] += 1
+    logger.debug("No fast path for %s/%s: %s", spec.slug, data_type, why)
+    return None
+
+
+def failed(spec: AgentSpec, data_type: str, error: Exception) -> None:
+    """Record a direct call that errored; the caller asks the agent instead."""
+    _stats["failed"] += 1
+    logger.warning("Fast path for %s/%s failed, asking the agent: %s", spec.slug, data_type, error)
+
+
+def stats() -> dict[str, int]:
+    return dict(_stats)
@@ -0,0 +1,150 @@
+"""Opaque handles for data passed between agents.
+
+Without them every hop of a CEO → finance-manager → accountant chain pastes
+the previous agent's whole output into the next prompt. Payloads whose
+encoded size reaches ``inline_threshold`` are kept server-side (through the
+payload store, so very large ones are spilled to disk) and the model gets a
+handle, the payload size and a short outline instead. Agents read what they
+need with the ``fetch_data`` tool; handles are only readable from the
+conversation that produced them.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from app.config import get_settings
+from app.orchestrator.payloads import Payload, payload_store
+from app.report_store import section
+from app.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_CHARS = 600
+
+
+@dataclass
+class DataHandle:
+    id: str
+    conversation_id: str
+    source: str
+    data_type: str
+    size: int
+    payload: Payload
+    created: float
+
+
+def outline(value: Any, depth: int = 2, items: int = 8) -> Any:
+    """A small structural sketch of ``value``: keys, list lengths, short scalars."""
+    if isinstance(value, dict):
+        if depth <= 0:
+            return f"object with {len(value)} keys"
+        sketch = {k: outline(v, depth - 1, items) for k, v in list(value.items())[:items]}
+        if len(value) > items:
+            sketch["…"] = f"{len(value) - items} more keys"
+        return sketch
+    if isinstance(value, list):
+        if not value:
+            return []
+        return {"list": len(value), "first": outline(value[0], depth, items)}
+    if isinstance(value, str) and len(value) > 80:
+        return f"text, {len(value)} chars: {value[:80]}…"
+    return value
+
+
+class HandleStore:
+    def __init__(self, inline_threshold: int, fetch_max_bytes: int) -> None:
+        self.inline_threshold = inline_threshold
+        self.fetch_max_bytes = fetch_max_bytes
+        self._handles: dict[str, DataHandle] = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, data: Any, conversation_id: str, source: str, data_type: str) -> Any:
+        """``data`` itself if it is small, else a handle with an outline of it."""
+        size = len(dumps(data))
+        if size < self.inline_threshold:
+            return data
+        handle = DataHandle(
+            id=f"h-{uuid.uuid4().hex[:12]}",
+            conversation_id=conversation_id,
+            source=source,
+            data_type=data_type,
+            size=size,
+            payload=payload_store.put(data),
+            created=time.time(),
+        )
+        with self._lock:
+            self._handles[handle.id] = handle
+        if isinstance(data, str):
+            summary: Any = data[:PREVIEW_CHARS] + ("…" if len(data) > PREVIEW_CHARS else "")
+        else:
+            summary = outline(data)
+        return {
+            "handle": handle.id,
+            "data_type": data_type,
+            "from": source,
+            "bytes": size,
+            "summary": summary,
+            "note": "Full data is held server-side. Call fetch_data with this handle and a path "
+                    "(e.g. 'invoices.0:10') or a character window to read the parts you need.",
+        }
+
+    def fetch(self, handle_id: str, conversation_id: str, path: str = "", start: int = 0, length: int = 0) -> dict[str, Any]:
+        """A slice of a handle's data, capped at ``fetch_max_bytes``."""
+        with self._lock:
+            handle = self._handles.get(handle_id)
+        if handle is None or handle.conversation_id != conversation_id:
+            return {"status": "error", "message": f"Unknown or expired handle: {handle_id}"}
+        try:
+            data = handle.payload.load()
+        except FileNotFoundError:
+            # Spilled, then expired or discarded since the lookup above.
+            return {"status": "error", "message": f"Unknown or expired handle: {handle_id}"}
+        try:
+            value = section(data, path)
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            return {"status": "error", "message": f"No path {path!r} in {handle_id}: {e}"}
+
+        if isinstance(value, str):
+            length = min(length or self.fetch_max_bytes, self.fetch_max_bytes)
+            chunk = value[start:start + length]
+            return {
+                "handle": handle_id, "path": path, "start": start, "end": start + len(chunk),
+                "total_chars": len(value), "data": chunk,
+            }
+        size = len(dumps(value))
+        if size > self.fetch_max_bytes:
+            # Too big to return whole: describe it so the caller can narrow the path.
+            return {
+                "handle": handle_id, "path": path, "bytes": size, "truncated": True,
+                "outline": outline(value),
+                "message": f"Section is {size} bytes (limit {self.fetch_max_bytes}); request a narrower path or slice.",
+            }
+        return {"handle": handle_id, "path": path, "data": value}
+
+    def expire(self, max_age_seconds: float) -> int:
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            doomed = [h for h in self._handles.values() if h.created < cutoff]
+            for h in doomed:
+                del self._handles[h.id]
+        for h in doomed:
+            h.payload.discard()
+        if doomed:
+            logger.info("Expired %d data handles", len(doomed))
+        return len(doomed)
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+
+def _make_store() -> HandleStore:
+    settings = get_settings()
+    return HandleStore(settings.data_handle_threshold, settings.data_fetch_max_bytes)
+
+
+handle_store = _make_store()
@@ -0,0 +1,174 @@
+"""Storage for data held back behind an approval.
+
+Small payloads stay in memory. Anything whose encoded size reaches
+``inline_threshold`` bytes is compressed (zstd when the ``zstandard``
+package is available, gzip otherwise) into a spool directory and only read
+back when the approval is fulfilled. Spilled files are removed through
+``Payload.discard()`` when their owner is done with them: an approval
+request that is fulfilled, denied, expired or deleted, or an expired data
+handle. Files are named after the process that wrote them, and
+``sweep_orphans`` (run at startup) only clears files whose process is gone.
+"""
+from __future__ import annotations
+
+import gzip
+import logging
+import mmap
+import os
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+from app.config import get_settings
+from app.serialization import dumps, loads
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+
+
+class InlinePayload:
+    __slots__ = ("value", "size")
+
+    def __init__(self, value: Any, size: int) -> None:
+        self.value = value
+        self.size = size
+
+    def load(self) -> Any:
+        return self.value
+
+    def discard(self) -> None:
+        self.value = None
+
+
+class SpilledPayload:
+    __slots__ = ("path", "codec", "size", "stored_size")
+
+    def __init__(self, path: Path, codec: str, size: int, stored_size: int) -> None:
+        self.path = path
+        self.codec = codec
+        self.size = size
+        self.stored_size = stored_size
+
+    def load(self) -> Any:
+        with self.path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if self.codec == "zstd":
+                raw = zstandard.ZstdDecompressor().decompress(mm, max_output_size=self.size)
+            else:
+                raw = gzip.decompress(mm)
+        return loads(raw)
+
+    def discard(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+Payload = InlinePayload | SpilledPayload
+
+
+class PayloadStore:
+    def __init__(
+        self,
+        spool_dir: str | Path | None = None,
+        inline_threshold: int = 256 * 1024,
+        codec: str = "auto",
+        level: int = 3,
+    ) -> None:
+        self.spool_dir = Path(spool_dir) if spool_dir else Path(tempfile.gettempdir()) / "agentorg-payloads"
+        self.inline_threshold = inline_threshold
+        if codec == "auto":
+            codec = "zstd" if zstandard is not None else "gzip"
+        elif codec == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; spilling payloads with gzip")
+            codec = "gzip"
+        self.codec = codec
+        self.level = level
+        self._lock = threading.Lock()
+        self._stats = {"inline": 0, "spilled": 0, "spilled_bytes": 0, "stored_bytes": 0}
+
+    def put(self, data: Any) -> Payload | None:
+        """Keep ``data`` inline or spill it to disk, depending on its encoded size."""
+        if data is None:
+            return None
+        encoded = dumps(data)
+        if len(encoded) < self.inline_threshold:
+            with self._lock:
+                self._stats["inline"] += 1
+            return InlinePayload(data, len(encoded))
+
+        if self.codec == "zstd":
+            compressed = zstandard.ZstdCompressor(level=self.level).compress(encoded)
+        else:
+            compressed = gzip.compress(encoded, compresslevel=min(self.level * 2, 9))
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        path = self.spool_dir / f"{os.getpid()}-{uuid.uuid4().hex}{_SUFFIXES[self.codec]}"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, path)
+        with self._lock:
+            self._stats["spilled"] += 1
+            self._stats["spilled_bytes"] += len(encoded)
+            self._stats["stored_bytes"] += len(compressed)
+        logger.debug("Spilled %d-byte payload to %s (%d bytes)", len(encoded), path, len(compressed))
+        return SpilledPayload(path, self.codec, len(encoded), len(compressed))
+
+    def sweep_orphans(self) -> int:
+        """Delete spool files written by processes that are no longer running; returns how many.
+
+        Live payloads are only ever freed by their owners, so files of this
+        process and of other running workers sharing the spool are kept.
+        """
+        if not self.spool_dir.is_dir():
+            return 0
+        removed = 0
+        for path in self.spool_dir.iterdir():
+            if _writer_alive(path):
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                continue
+        if removed:
+            logger.info("Swept %d orphaned payload files from %s", removed, self.spool_dir)
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+def _writer_alive(path: Path) -> bool:
+    pid, sep, _ = path.name.partition("-")
+    if not sep or not pid.isdigit():
+        return False  # unnamed files predate per-process names
+    if int(pid) == os.getpid():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _make_store() -> PayloadStore:
+    settings = get_settings()
+    return PayloadStore(
+        spool_dir=settings.payload_spool_dir or None,
+        inline_threshold=settings.payload_inline_threshold,
+        codec=settings.payload_compression,
+    )
+
+
+payload_store = _make_store()
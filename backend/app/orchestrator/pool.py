@@ -0,0 +1,149 @@
+"""Pool of warm, reusable agents keyed by persona slug."""
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generator
+
+from app.agent_factory import AgentSpec, DeadlineHooks
+from app.orchestrator.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RunContext:
+    """Per-run state that pooled agents' tools read instead of closing over it."""
+
+    conversation_id: str = ""
+    deadline: Deadline | None = None
+    suspendable: bool = False  # may this run park at an approval point?
+    suspensions: list[tuple[str, str]] = field(default_factory=list)  # (approval_id, toolUseId) per pending call
+    tools_started: int = 0  # tool calls this run has started (side effects may have happened)
+
+
+@dataclass
+class PooledAgent:
+    key: str  # AgentSpec.pool_key: the slug, plus "@<tier>" for per-tier agents
+    agent: Any
+    version: int = 0
+    context: RunContext = field(default_factory=RunContext)
+    hooks: DeadlineHooks = field(default_factory=DeadlineHooks)
+
+    def bind(self, conversation_id: str, deadline: Deadline | None) -> None:
+        self.context.conversation_id = conversation_id
+        self.context.deadline = deadline
+        self.context.suspensions = []
+        self.context.tools_started = 0
+        self.hooks.deadline = deadline
+
+    def reset(self) -> None:
+        self.bind("", None)
+        self.context.suspendable = False
+        self.agent.messages.clear()
+
+
+AgentBuilder = Callable[[AgentSpec, RunContext, DeadlineHooks], Any]
+
+
+class AgentPool:
+    """Keeps idle agents around so each chat doesn't pay model/tool setup again.
+
+    An agent is checked out by exactly one run at a time; on release its
+    conversation history is cleared and it goes back on the idle list. Agents
+    whose run raised are dropped rather than reused, as are agents built from
+    an older ``spec.version`` than the one being acquired.
+    """
+
+    def __init__(self, builder: AgentBuilder, max_idle_per_spec: int = 4) -> None:
+        self._builder = builder
+        self._max_idle = max_idle_per_spec
+        self._idle: dict[str, list[PooledAgent]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"built": 0, "reused": 0, "discarded": 0}
+
+    def _build(self, spec: AgentSpec) -> PooledAgent:
+        context = RunContext()
+        hooks = DeadlineHooks(context=context)
+        agent = self._builder(spec, context, hooks)
+        with self._lock:
+            self._stats["built"] += 1
+        return PooledAgent(key=spec.pool_key, agent=agent, version=spec.version, context=context, hooks=hooks)
+
+    def _take(self, spec: AgentSpec) -> PooledAgent:
+        with self._lock:
+            idle = self._idle.get(spec.pool_key)
+            while idle:
+                entry = idle.pop()
+                if entry.version == spec.version:
+                    self._stats["reused"] += 1
+                    return entry
+                self._stats["discarded"] += 1
+        return self._build(spec)
+
+    def _give_back(self, entry: PooledAgent) -> None:
+        entry.reset()
+        with self._lock:
+            idle = self._idle.setdefault(entry.key, [])
+            if idle and idle[0].version != entry.version:
+                # The spec changed while this run was out; keep the newer agents.
+                if idle[0].version > entry.version:
+                    self._stats["discarded"] += 1
+                    return
+                self._stats["discarded"] += len(idle)
+                idle.clear()
+            if len(idle) < self._max_idle:
+                idle.append(entry)
+                return
+            self._stats["discarded"] += 1
+
+    @contextmanager
+    def acquire(
+        self,
+        spec: AgentSpec,
+        conversation_id: str,
+        deadline: Deadline | None = None,
+    ) -> Generator[PooledAgent, None, None]:
+        entry = self._take(spec)
+        entry.bind(conversation_id, deadline)
+        try:
+            yield entry
+        except BaseException:
+            with self._lock:
+                self._stats["discarded"] += 1
+            raise
+        else:
+            self._give_back(entry)
+
+    def warm(self, spec: AgentSpec, count: int = 1) -> int:
+        """Pre-build up to ``count`` idle agents for ``spec``; returns how many were added."""
+        added = 0
+        while added < count:
+            with self._lock:
+                idle = self._idle.get(spec.pool_key, [])
+                idle[:] = [entry for entry in idle if entry.version == spec.version]
+                if len(idle) >= self._max_idle:
+                    break
+            entry = self._build(spec)
+            with self._lock:
+                self._idle.setdefault(spec.pool_key, []).append(entry)
+            added += 1
+        return added
+
+    def clear(self, slug: str | None = None) -> None:
+        with self._lock:
+            if slug is None:
+                self._idle.clear()
+            else:
+                # Per-tier agents are pooled as "<slug>@<tier>".
+                for key in [k for k in self._idle if k == slug or k.startswith(f"{slug}@")]:
+                    del self._idle[key]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "idle": {slug: len(entries) for slug, entries in self._idle.items()},
+            }
@@ -0,0 +1,237 @@
+"""Speculative prefetch of the data a chat is likely to request.
+
+A persona's first ``request_from_agent`` call only comes after the model's
+first turn. When a chat starts, the prefetcher predicts which data the
+persona will ask for and runs those fetches alongside that first LLM call:
+
+- candidates come from the graph: data the persona ``CAN_REQUEST`` that is
+  owned by another agent and not approval-gated
+- a candidate is warmed if the persona asked for it in at least
+  ``prefetch_min_share`` of its past chats, or the message names it
+- only fetches the owner answers on the fast path (``AgentSpec.data_tools``)
+  are speculated — tool calls, never an agent run — with parameters taken
+  from the chat message and from the calls most often made for that data
+
+Results live for the chat (and at most ``prefetch_ttl_seconds``). A request
+whose fast-path call matches a prefetched one awaits that result instead of
+calling the tool again; unused fetches are cancelled when the chat ends.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from app.agent_factory import AgentSpec
+from app.agents import agent_registry
+from app.config import get_settings
+from app.orchestrator import fastpath
+from app.orchestrator.fastpath import DirectCall
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Fetch:
+    call: DirectCall
+    task: asyncio.Task
+    finished: float = 0.0
+    used: bool = False
+
+
+@dataclass
+class _Session:
+    persona: str
+    refs: int = 0
+    planners: set[asyncio.Task] = field(default_factory=set)
+    fetches: dict[tuple, _Fetch] = field(default_factory=dict)
+    requested: set[str] = field(default_factory=set)
+
+
+class Prefetcher:
+    def __init__(self) -> None:
+        self._sessions: dict[str, _Session] = {}
+        self._chats: Counter[str] = Counter()  # persona → chats started
+        self._requests: dict[str, Counter[str]] = {}  # persona → chats that requested each data type
+        self._calls: dict[str, Counter[tuple]] = {}  # data type → fast-path calls made for it
+        self._stats = {"started": 0, "used": 0, "hits": 0, "in_flight_hits": 0, "misses": 0,
+                       "unused": 0, "cancelled": 0, "failed": 0, "stale": 0}
+
+    # ── Chat lifecycle ──────────────────────────────────────────────────
+
+    def begin(
+        self,
+        spec: AgentSpec,
+        message: str,
+        conversation_id: str,
+        prepare: Callable[[], None] | None = None,
+    ) -> None:
+        """Start predicting and warming data for a chat; pair with ``end``.
+
+        ``prepare`` (e.g. tool registration, which imports Strands) runs in a
+        worker thread before planning, so it never blocks the event loop; if
+        it fails the chat just goes without prefetch.
+        """
+        session = self._sessions.get(conversation_id)
+        if session is None:
+            session = self._sessions[conversation_id] = _Session(spec.slug)
+        session.refs += 1
+        self._chats[spec.slug] += 1
+        if "request_from_agent" not in spec.tools:
+            return
+        planner = asyncio.get_running_loop().create_task(self._plan(session, spec, message, prepare))
+        session.planners.add(planner)
+        planner.add_done_callback(session.planners.discard)
+
+    def end(self, conversation_id: str) -> None:
+        """Cancel whatever the chat didn't use and forget its results."""
+        session = self._sessions.get(conversation_id)
+        if session is None:
+            return
+        session.refs -= 1
+        if session.refs > 0:
+            return
+        del self._sessions[conversation_id]
+        for data_type in session.requested:
+            self._requests.setdefault(session.persona, Counter())[data_type] += 1
+        for planner in session.planners:
+            planner.cancel()
+        for fetch in session.fetches.values():
+            if fetch.used:
+                continue
+            if fetch.task.done():
+                self._stats["unused"] += 1
+            else:
+                fetch.task.cancel()
+                self._stats["cancelled"] += 1
+
+    # ── Serving requests ────────────────────────────────────────────────
+
+    def observe(self, conversation_id: str, source: str, data_type: str) -> None:
+        """Record that ``source`` asked for ``data_type`` during this chat."""
+        session = self._sessions.get(conversation_id)
+        if session is not None and session.persona == source:
+            session.requested.add(data_type)
+
+    async def run(self, conversation_id: str, data_type: str, call: DirectCall) -> Any:
+        """``call``'s result: the prefetched one if this chat warmed it, else a fresh call."""
+        self._calls.setdefault(data_type, Counter())[call.key] += 1
+        session = self._sessions.get(conversation_id)
+        if session is None:
+            return await call.run()
+        fetch = session.fetches.get(call.key)
+        if fetch is None or fetch.task.cancelled() or (fetch.task.done() and fetch.task.exception() is not None):
+            self._stats["misses"] += 1
+            return await call.run()
+        if fetch.task.done() and time.monotonic() - fetch.finished > get_settings().prefetch_ttl_seconds:
+            self._stats["stale"] += 1
+            self._stats["misses"] += 1
+            return await call.run()
+
+        self._stats["hits" if fetch.task.done() else "in_flight_hits"] += 1
+        if not fetch.used:
+            fetch.used = True
+            self._stats["used"] += 1
+        try:
+            # Shielded: a cancelled request leaves the fetch to others in the chat.
+            return await asyncio.shield(fetch.task)
+        except asyncio.CancelledError:
+            if not fetch.task.cancelled():
+                raise
+        except Exception as e:
+            logger.debug("Prefetched %s failed, calling it again: %s", call.tool_name, e)
+        return await call.run()
+
+    # ── Prediction ──────────────────────────────────────────────────────
+
+    async def _plan(
+        self, session: _Session, spec: AgentSpec, message: str, prepare: Callable[[], None] | None
+    ) -> None:
+        settings = get_settings()
+        if prepare is not None:
+            try:
+                await asyncio.to_thread(prepare)
+            except Exception as e:
+                logger.warning("No prefetch for %s, setup failed: %s", spec.slug, e)
+                return
+        try:
+            from app.graph.queries import requestable_data_async
+            rows = await requestable_data_async(spec.slug)
+        except Exception as e:
+            logger.debug("No prefetch for %s, graph unavailable: %s", spec.slug, e)
+            return
+
+        chats = self._chats[spec.slug]
+        requests = self._requests.get(spec.slug, Counter())
+        scored: list[tuple[float, str, AgentSpec]] = []
+        for row in rows:
+            owner = row["owner_slug"]
+            if row["requires_approval"] or not owner or owner == spec.slug:
+                continue
+            owner_spec = agent_registry.get(owner)
+            if owner_spec is None or row["data_id"] not in owner_spec.data_tools:
+                continue
+            share = requests[row["data_id"]] / chats if chats else 0.0
+            if _mentions(message, row["data_id"]):
+                share += 1.0
+            if share >= settings.prefetch_min_share:
+                scored.append((share, row["data_id"], owner_spec))
+
+        budget = settings.prefetch_max_calls
+        for _, data_type, owner_spec in sorted(scored, key=lambda s: -s[0]):
+            for call in self._predict(owner_spec, data_type, message):
+                if budget <= 0:
+                    return
+                if call.key in session.fetches:
+                    continue
+                self._start(session, call)
+                budget -= 1
+
+    def _predict(self, owner_spec: AgentSpec, data_type: str, message: str) -> list[DirectCall]:
+        calls = []
+        from_message = fastpath.plan(owner_spec, data_type, message, record=False)
+        if from_message is not None:
+            calls.append(from_message)
+        for (tool_name, kwargs), _ in self._calls.get(data_type, Counter()).most_common(2):
+            call = DirectCall(tool_name, dict(kwargs))
+            if all(call.key != c.key for c in calls):
+                calls.append(call)
+        return calls
+
+    def _start(self, session: _Session, call: DirectCall) -> None:
+        task = asyncio.get_running_loop().create_task(call.run())
+        fetch = session.fetches[call.key] = _Fetch(call, task)
+        self._stats["started"] += 1
+
+        def done(t: asyncio.Task) -> None:
+            fetch.finished = time.monotonic()
+            if not t.cancelled() and t.exception() is not None:
+                self._stats["failed"] += 1
+                logger.debug("Prefetch %s(%s) failed: %s", call.tool_name, call.kwargs, t.exception())
+
+        task.add_done_callback(done)
+        logger.debug("Prefetching %s(%s) for %s", call.tool_name, call.kwargs, session.persona)
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = dict(self._stats)
+        hits = stats["hits"] + stats["in_flight_hits"]
+        stats["hit_rate"] = round(hits / (hits + stats["misses"]), 3) if hits + stats["misses"] else None
+        stats["used_rate"] = round(stats["used"] / stats["started"], 3) if stats["started"] else None
+        stats["active_chats"] = len(self._sessions)
+        stats["request_share"] = {
+            persona: {dt: round(n / self._chats[persona], 3) for dt, n in counts.most_common()}
+            for persona, counts in self._requests.items() if self._chats[persona]
+        }
+        return stats
+
+
+def _mentions(message: str, data_type: str) -> bool:
+    word = re.escape(data_type.replace("_", " ").rstrip("s"))
+    return re.search(rf"\b{word}s?\b", message or "", re.IGNORECASE) is not None
+
+
+prefetcher = Prefetcher()
@@ -2,26 +2,75 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextvars
+import copy
 import logging
+import threading
+import time
 import uuid
-from typing import Any
-
-from app.agent_factory import AgentFactory
-from app.agents import AGENT_SPECS
-from app.models import ChatResponse
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Iterator, TypeVar
+
+from app.agent_factory import AgentFactory, AgentSpec, DeadlineHooks
+from app.agents import agent_registry
+from app.config import get_settings
+from app.models import BatchChatResult, ChatRequest, ChatResponse
+from app.orchestrator import fastpath, tiering
 from app.orchestrator.approval import ApprovalStatus, approval_queue
+from app.orchestrator.deadline import (
+    CLIENT_DISCONNECTED,
+    DEADLINE_EXCEEDED,
+    Deadline,
+    RequestCancelled,
+    bind_deadline,
+    run_with_deadline,
+    surface_cancellation,
+)
 from app.orchestrator.events import event_manager
-from app.tools import TOOLS
+from app.orchestrator.handles import handle_store
+from app.orchestrator.payloads import payload_store
+from app.orchestrator.pool import AgentPool, PooledAgent, RunContext
+from app.orchestrator.prefetch import prefetcher
+from app.orchestrator.suspend import SuspendedRun, suspend_point, with_tool_result
+from app.serialization import tool_result
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Set by stream_chat: where the top-level agent's text deltas go.
+_deltas: contextvars.ContextVar[asyncio.Queue | None] = contextvars.ContextVar(
+    "agentorg_deltas", default=None
+)
+
+# Set by _on_tier for a small-tier attempt: flips to True once any of its
+# runs started a tool, after which replaying the attempt could repeat side effects.
+_tools_ran: contextvars.ContextVar[list[bool] | None] = contextvars.ContextVar(
+    "agentorg_tools_ran", default=None
+)
+
+
+@contextmanager
+def _track_tools(pooled: PooledAgent) -> Iterator[None]:
+    try:
+        yield
+    finally:
+        attempt = _tools_ran.get()
+        if attempt is not None and pooled.context.tools_started:
+            attempt[0] = True
+
 
 class Orchestrator:
     """Main entry point for chat requests — manages agent lifecycle and routing."""
 
     def __init__(self) -> None:
-        AgentFactory.register_tools(TOOLS)
+        self._tools_registered = False
+        self._tools_lock = threading.Lock()
+        self.pool = AgentPool(self._build_agent, get_settings().agent_pool_max_idle)
+        agent_registry.add_listener(self.pool.clear)
+        self._suspend_lock = threading.Lock()
+        self._background: set[asyncio.Task] = set()
+        self._deferred_runs: dict[str, asyncio.Future] = {}
 
     # ── Public API ──────────────────────────────────────────────────────
 
@@ -30,14 +79,17 @@ class Orchestrator:
         message: str,
         persona: str,
         conversation_id: str | None = None,
+        deadline: Deadline | None = None,
     ) -> ChatResponse:
         conversation_id = conversation_id or str(uuid.uuid4())
-        spec = AGENT_SPECS.get(persona)
+        deadline = deadline or Deadline(get_settings().request_timeout_seconds)
+        spec = agent_registry.get(persona)
         if spec is None:
             return ChatResponse(
                 response=f"Unknown persona: {persona}",
                 conversation_id=conversation_id,
                 agent="system",
+                status="error",
             )
 
         trace_id = str(uuid.uuid4())
@@ -46,45 +98,58 @@ class Orchestrator:
             conversation_id, "agent:thinking", spec.slug, message=f"{spec.name} is thinking..."
         )
 
-        # Patch request_from_agent so it calls back to the orchestrator
-        patched_tools = dict(TOOLS)
-        orchestrator_ref = self
-
-        from strands import tool as strands_tool
-
-        @strands_tool
-        def request_from_agent(target_agent: str, data_type: str, ask: str) -> str:
-            """Route a data request to another agent in the organization.
-
-            Args:
-                target_agent: The slug of the agent to request from (e.g. 'accountant').
-                data_type: The type of data being requested (e.g. 'pnl', 'invoices').
-                ask: A natural language description of what you need.
-
-            Returns:
-                The response from the target agent, or a pending-approval notice.
-            """
-            return orchestrator_ref.route_request_sync(
-                source=spec.slug,
-                target=target_agent,
-                data_type=data_type,
-                ask=ask,
-                conversation_id=conversation_id,
-            )
-
-        patched_tools["request_from_agent"] = request_from_agent
-        AgentFactory.register_tools(patched_tools)
-
+        settings = get_settings()
         try:
-            response_text = await asyncio.to_thread(
-                self._run_agent_sync, spec, message, conversation_id
+            if settings.prefetch_enabled and settings.data_fast_path:
+                # Warm likely sub-agent data while the agent's first LLM call runs.
+                prefetcher.begin(spec, message, conversation_id, prepare=self._register_tools)
+            response_text, approval_id = await run_with_deadline(
+                self._on_tier(
+                    spec, tiering.choose(spec, message),
+                    lambda s: self._start_run(s, message, conversation_id, deadline, trace_id=trace_id),
+                    ok=lambda out: bool(out[0].strip() or out[1]),
+                ),
+                deadline,
+            )
+        except RequestCancelled as e:
+            logger.info("Chat for %s cancelled: %s", spec.slug, e.reason)
+            await event_manager.emit(
+                conversation_id, "agent:cancelled", spec.slug,
+                message=f"Request cancelled: {e.reason}",
+                data={"reason": e.reason},
+                trace_id=trace_id,
+            )
+            return ChatResponse(
+                response=f"Request cancelled: {e.reason}",
+                conversation_id=conversation_id,
+                agent=spec.slug,
+                trace_id=trace_id,
+                status="cancelled",
             )
         except Exception as e:
             logger.exception("Agent %s failed", spec.slug)
             await event_manager.emit(
                 conversation_id, "agent:error", spec.slug, message=str(e)
             )
-            response_text = f"I encountered an error: {e}"
+            return ChatResponse(
+                response=f"I encountered an error: {e}",
+                conversation_id=conversation_id,
+                agent=spec.slug,
+                trace_id=trace_id,
+                status="error",
+            )
+        finally:
+            prefetcher.end(conversation_id)
+
+        if approval_id is not None:
+            return ChatResponse(
+                response=response_text,
+                conversation_id=conversation_id,
+                agent=spec.slug,
+                trace_id=trace_id,
+                status="pending_approval",
+                approval_id=approval_id,
+            )
 
         await event_manager.emit(
             conversation_id, "agent:responding", spec.slug, message="Response ready"
@@ -97,6 +162,100 @@ class Orchestrator:
             trace_id=trace_id,
         )
 
+    async def handle_batch(
+        self,
+        items: list[ChatRequest],
+        parallelism: int | None = None,
+    ) -> AsyncIterator[BatchChatResult]:
+        """Run many chats concurrently, yielding each result as soon as it completes.
+
+        At most ``parallelism`` chats (capped by ``batch_max_parallelism``) run at
+        once; they draw warm agents from the shared pool. Closing the iterator
+        early cancels whatever is still in flight.
+        """
+        settings = get_settings()
+        limit = max(1, min(parallelism or settings.batch_max_parallelism, settings.batch_max_parallelism))
+        semaphore = asyncio.Semaphore(limit)
+        deadlines: list[Deadline] = []
+
+        async def run_one(index: int, item: ChatRequest) -> BatchChatResult:
+            async with semaphore:
+                deadline = Deadline(settings.request_timeout_seconds)
+                deadlines.append(deadline)
+                start = time.perf_counter()
+                try:
+                    resp = await self.handle_chat(
+                        message=item.message,
+                        persona=item.persona,
+                        conversation_id=item.conversation_id,
+                        deadline=deadline,
+                    )
+                except Exception as e:
+                    logger.exception("Batch item %d failed", index)
+                    resp = ChatResponse(
+                        response=str(e),
+                        conversation_id=item.conversation_id or "",
+                        agent=item.persona,
+                        status="error",
+                    )
+                return BatchChatResult(
+                    index=index,
+                    persona=item.persona,
+                    status=resp.status,
+                    duration_ms=(time.perf_counter() - start) * 1000,
+                    **resp.model_dump(exclude={"status"}),
+                )
+
+        tasks = [asyncio.create_task(run_one(i, item)) for i, item in enumerate(items)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for deadline in deadlines:
+                deadline.cancel(CLIENT_DISCONNECTED)
+            for task in tasks:
+                task.cancel()
+
+    async def stream_chat(
+        self,
+        message: str,
+        persona: str,
+        conversation_id: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Run a chat turn, yielding its events as they happen.
+
+        Yields the conversation's orchestration events (``agent:thinking``,
+        ``agent:routing``, approvals, ...), ``agent:delta`` chunks of the
+        top-level agent's reply (async orchestrator only) and finally a
+        ``result`` event carrying the ChatResponse. Closing the iterator early
+        cancels the run.
+        """
+        conversation_id = conversation_id or str(uuid.uuid4())
+        deadline = deadline or Deadline(get_settings().request_timeout_seconds)
+        queue = event_manager.subscribe(conversation_id)
+        token = _deltas.set(queue)
+        try:
+            task = asyncio.ensure_future(self.handle_chat(message, persona, conversation_id, deadline))
+        finally:
+            _deltas.reset(token)
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if getter not in done:
+                    getter.cancel()
+                    break
+                yield getter.result()
+            while not queue.empty():
+                yield queue.get_nowait()
+            yield {"type": "result", **task.result().model_dump()}
+        finally:
+            event_manager.unsubscribe(conversation_id, queue)
+            if not task.done():
+                deadline.cancel(CLIENT_DISCONNECTED)
+                task.cancel()
+
     def route_request_sync(
         self,
         source: str,
@@ -104,11 +263,74 @@ class Orchestrator:
         data_type: str,
         ask: str,
         conversation_id: str,
-    ) -> str:
-        """Called by request_from_agent tool — runs in agent's sync thread."""
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """Called by the sync request_from_agent tool — runs in agent's sync thread.
+
+        The routing itself runs on the server loop (so events, graph queries and
+        the target agent share its resources); this thread just waits for it,
+        for at most the deadline's remaining budget.
+        """
+        coro = self.route_request(source, target, data_type, ask, conversation_id, deadline)
+        timeout = deadline.remaining() if deadline is not None else None
+        loop = event_manager.loop
+        if loop is None or not loop.is_running():
+            try:
+                return asyncio.run(asyncio.wait_for(coro, timeout))
+            except TimeoutError:
+                return self._timed_out(deadline, target, data_type)
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            if future.done():
+                raise  # raised by the routing itself, not the wait
+            future.cancel()
+            return self._timed_out(deadline, target, data_type)
+
+    @staticmethod
+    def _timed_out(deadline: Deadline | None, target: str, data_type: str) -> dict[str, Any]:
+        if deadline is not None:
+            deadline.cancel(DEADLINE_EXCEEDED)
+        logger.warning("Request to %s for %s ran past its deadline; stopped waiting", target, data_type)
+        return {"status": "cancelled", "message": f"Request cancelled: {DEADLINE_EXCEEDED}", "reason": DEADLINE_EXCEEDED}
+
+    async def route_request(
+        self,
+        source: str,
+        target: str,
+        data_type: str,
+        ask: str,
+        conversation_id: str,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """Called by the async request_from_agent tool on the server loop."""
+        with bind_deadline(deadline):
+            try:
+                return await self._route_request(source, target, data_type, ask, conversation_id, deadline)
+            except RequestCancelled as e:
+                await event_manager.emit(
+                    conversation_id, "agent:cancelled", source,
+                    target=target,
+                    message=f"Request to {target} for {data_type} cancelled: {e.reason}",
+                    data={"reason": e.reason},
+                )
+                return {"status": "cancelled", "message": str(e), "reason": e.reason}
+
+    async def _route_request(
+        self,
+        source: str,
+        target: str,
+        data_type: str,
+        ask: str,
+        conversation_id: str,
+        deadline: Deadline | None,
+    ) -> dict[str, Any]:
+        if deadline is not None:
+            deadline.check()
 
         # 1. Check Neo4j permissions
-        event_manager.emit_sync(
+        await event_manager.emit(
             conversation_id, "agent:permission_check", source,
             target=target, message=f"Checking if {source} can access {data_type}",
         )
@@ -118,8 +340,8 @@ class Orchestrator:
         owner_slug = target
 
         try:
-            from app.graph.queries import full_routing_query
-            routing = full_routing_query(source, data_type)
+            from app.graph.queries import full_routing_query_async
+            routing = await full_routing_query_async(source, data_type)
             has_permission = routing["has_permission"]
             owner_slug = routing["owner_slug"] or target
             if routing["approval_level"]:
@@ -127,41 +349,50 @@ class Orchestrator:
                     "level": routing["approval_level"],
                     "reason": routing["approval_reason"],
                 }
+        except RequestCancelled:
+            raise
         except Exception as e:
             logger.warning("Neo4j unavailable, falling back to permissive mode: %s", e)
 
         if not has_permission:
-            event_manager.emit_sync(
+            await event_manager.emit(
                 conversation_id, "agent:denied", source,
                 message=f"{source} does not have permission to access {data_type}",
             )
-            return json.dumps({
+            return {
                 "status": "denied",
                 "message": f"Permission denied: {source} cannot access {data_type}",
-            })
+            }
+        prefetcher.observe(conversation_id, source, data_type)
 
         # 2. Route to target agent
-        event_manager.emit_sync(
+        await event_manager.emit(
             conversation_id, "agent:routing", source,
             target=target, message=f"Routing request to {target} for {data_type}",
         )
 
-        target_spec = AGENT_SPECS.get(owner_slug or target)
+        target_spec = agent_registry.get(owner_slug or target)
         if target_spec is None:
-            return json.dumps({"status": "error", "message": f"Unknown agent: {target}"})
+            return {"status": "error", "message": f"Unknown agent: {target}"}
+
+        # 3. Approval-gated data: in deferred mode the target agent only runs
+        # once someone approves, so denied or abandoned requests cost nothing.
+        deferred = approval_policy is not None and get_settings().approval_mode == "deferred"
+        target_response = None
+        if not deferred:
+            try:
+                target_response = await self._run_target(target_spec, data_type, ask, conversation_id, deadline)
+            except RequestCancelled:
+                raise
+            except Exception as e:
+                logger.exception("Target agent %s failed", target)
+                return {"status": "error", "message": str(e)}
+
+        if deadline is not None:
+            deadline.check()
 
-        # Run target agent
-        try:
-            agent = AgentFactory.create(target_spec)
-            result = agent(f"Please provide the {data_type} data. Specific request: {ask}")
-            target_response = str(result)
-        except Exception as e:
-            logger.exception("Target agent %s failed", target)
-            return json.dumps({"status": "error", "message": str(e)})
-
-        # 3. Check if approval is required
         if approval_policy:
-            event_manager.emit_sync(
+            await event_manager.emit(
                 conversation_id, "agent:awaiting_approval", source,
                 target=target,
                 message=f"Approval required: {approval_policy['reason']}",
@@ -175,49 +406,531 @@ class Orchestrator:
                 conversation_id=conversation_id,
                 ask=ask,
             )
-            # Store the data so it can be released after approval
-            req.stored_data = target_response
+            # Held until approval; large responses are spilled to disk meanwhile.
+            req.stored_data = payload_store.put(target_response)
+            req.deferred = deferred
 
-            return json.dumps({
+            return {
                 "status": "pending_approval",
                 "approval_id": req.id,
                 "message": f"This data requires approval. Reason: {approval_policy['reason']}. "
                            f"Approval ID: {req.id}. The request is pending review.",
-            })
+            }
 
         # 4. No approval needed — return data directly
-        event_manager.emit_sync(
+        await event_manager.emit(
             conversation_id, "agent:fulfilled", source,
             target=target, message=f"Data delivered from {target}",
         )
 
-        return json.dumps({
+        return {
             "status": "success",
-            "data": target_response,
-        })
+            "data": self._hand_off(target_response, conversation_id, owner_slug or target, data_type),
+        }
 
-    def fulfill_approved_request(self, approval_id: str) -> dict[str, Any]:
-        """Release stored data for an approved request."""
+    async def fulfill_approved_request(self, approval_id: str) -> dict[str, Any]:
+        """Release stored data for an approved request.
+
+        If a run is parked on the request, that run releases the data when it
+        resumes; this waits for it (up to ``approval_wait_max_seconds``) and
+        returns its answer instead. Calling it again after the request was
+        fulfilled returns the same answer without data.
+        """
         req = approval_queue.get(approval_id)
         if req is None:
             return {"status": "not_found"}
+        if req.status == ApprovalStatus.PENDING:
+            return {"status": req.status.value, "message": "Request is not in approved state"}
+        if req.held or req.suspended is not None or req.resuming:
+            req = await approval_queue.wait_settled(approval_id, get_settings().approval_wait_max_seconds)
+            if req is None:
+                return {"status": "not_found"}
+            return {
+                "status": req.status.value,
+                "data_type": req.data_type,
+                "response": req.response,
+                "settled": req.settled,
+            }
+        if req.status == ApprovalStatus.FULFILLED:
+            return {
+                "status": "fulfilled",
+                "data_type": req.data_type,
+                "response": req.response,
+                "message": "Request was already fulfilled",
+            }
         if req.status != ApprovalStatus.APPROVED:
             return {"status": req.status.value, "message": "Request is not in approved state"}
 
+        try:
+            data = await self._release_data(req)
+        except Exception as e:
+            logger.exception("Deferred request %s failed", approval_id)
+            return {"status": "error", "message": str(e)}
         approval_queue.fulfill(approval_id)
         return {
             "status": "fulfilled",
-            "data": req.stored_data,
+            "data": data,
             "data_type": req.data_type,
         }
 
+    def expire_approvals(self) -> int:
+        """Expire stale pending approvals (freeing their payloads) and resume runs parked on them."""
+        expired = approval_queue.expire(get_settings().approval_ttl_seconds)
+        for req in expired:
+            self.resume_suspended(req.id)
+        return len(expired)
+
+    def resume_suspended(self, approval_id: str) -> bool:
+        """Continue the run parked on ``approval_id`` now that it is resolved.
+
+        A run parked on several approvals continues once all of them are
+        resolved. The resumed run happens in the background; its answer is
+        emitted as ``agent:responding`` and stored on the approval requests.
+        Returns False if no run is parked on it or it is still waiting.
+        """
+        with self._suspend_lock:
+            req = approval_queue.get(approval_id)
+            if req is None or req.suspended is None:
+                return False
+            run = req.suspended
+            reqs = [r for r in map(approval_queue.get, run.tool_use_ids) if r is not None]
+            if any(r.status == ApprovalStatus.PENDING for r in reqs):
+                return False
+            for r in reqs:
+                r.suspended = None
+                r.resuming = True
+        self._spawn(self._resume(run))
+        return True
+
     # ── Internal ────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _run_agent_sync(spec, message: str, conversation_id: str) -> str:
-        agent = AgentFactory.create(spec)
-        result = agent(message)
+    async def _run_target(
+        self,
+        target_spec: AgentSpec,
+        data_type: str,
+        ask: str,
+        conversation_id: str,
+        deadline: Deadline | None,
+    ) -> Any:
+        """Ask the data owner's agent for ``data_type`` under the caller's deadline.
+
+        Plain fetches that the owner's spec maps to a tool skip the agent and
+        call that tool directly.
+        """
+        if deadline is not None:
+            deadline.check()
+        if get_settings().data_fast_path:
+            self._register_tools()
+            call = fastpath.plan(target_spec, data_type, ask)
+            if call is not None:
+                await event_manager.emit(
+                    conversation_id, "agent:routing", target_spec.slug,
+                    message=f"{target_spec.name} answering with {call.tool_name} directly",
+                    data={"tool": call.tool_name, "input": call.kwargs},
+                )
+                try:
+                    return await prefetcher.run(conversation_id, data_type, call)
+                except fastpath.DirectCallFailed as e:
+                    fastpath.failed(target_spec, data_type, e)
+        prompt = f"Please provide the {data_type} data. Specific request: {ask}"
+        return await self._on_tier(
+            target_spec, tiering.choose(target_spec, ask, nested=True),
+            lambda s: self._ask_agent(s, prompt, conversation_id, deadline),
+            ok=lambda text: bool(text.strip()),
+        )
+
+    async def _ask_agent(self, spec: AgentSpec, prompt: str, conversation_id: str, deadline: Deadline | None) -> str:
+        with self.pool.acquire(spec, conversation_id, deadline) as pooled, _track_tools(pooled), surface_cancellation():
+            result = await pooled.agent.invoke_async(prompt)
         return str(result)
 
+    @staticmethod
+    async def _on_tier(
+        spec: AgentSpec,
+        tier: str,
+        run: Callable[[AgentSpec], Awaitable[T]],
+        ok: Callable[[T], bool],
+    ) -> T:
+        """``run`` on ``tier``'s model; a small-tier run that fails or comes back empty is retried on large.
+
+        Only if it failed before starting any tool: a retry replays the whole
+        run, so once a tool may have had side effects the small tier's
+        outcome (error or empty answer) stands.
+        """
+        if tier == tiering.SMALL:
+            attempt = [False]
+            token = _tools_ran.set(attempt)
+            try:
+                result = await run(tiering.tier_spec(spec, tiering.SMALL))
+                if ok(result) or attempt[0]:
+                    return result
+                reason = "empty response"
+            except RequestCancelled:
+                raise
+            except Exception as e:
+                if attempt[0]:
+                    raise
+                reason = f"{type(e).__name__}: {e}"
+            finally:
+                _tools_ran.reset(token)
+            tiering.escalated(spec, reason)
+        return await run(tiering.tier_spec(spec, tiering.LARGE))
+
+    @staticmethod
+    def _hand_off(data: Any, conversation_id: str, source: str, data_type: str) -> Any:
+        """What the requesting agent's context gets: small data as-is, large data as a handle."""
+        if not get_settings().data_handles:
+            return data
+        return handle_store.wrap(data, conversation_id, source, data_type)
+
+    async def _release_data(self, req) -> Any:
+        """The data an approved request releases, running the target agent now if it was deferred."""
+        if not req.deferred or req.stored_data is not None:
+            return req.stored_data.load() if req.stored_data is not None else None
+        # One run per request even if /fulfill and a resume race for it.
+        task = self._deferred_runs.get(req.id)
+        if task is None:
+            task = asyncio.ensure_future(self._run_deferred(req))
+            self._deferred_runs[req.id] = task
+            task.add_done_callback(lambda _: self._deferred_runs.pop(req.id, None))
+        return await asyncio.shield(task)
+
+    async def _run_deferred(self, req) -> Any:
+        target_spec = agent_registry.get(req.target_agent)
+        if target_spec is None:
+            raise LookupError(f"Unknown agent: {req.target_agent}")
+        await event_manager.emit(
+            req.conversation_id, "agent:routing", req.source_agent,
+            target=req.target_agent, approval_id=req.id,
+            message=f"Approved — requesting {req.data_type} from {req.target_agent}",
+        )
+        deadline = Deadline(get_settings().request_timeout_seconds)
+        with bind_deadline(deadline):
+            data = await run_with_deadline(
+                self._run_target(target_spec, req.data_type, req.ask, req.conversation_id, deadline), deadline
+            )
+        req.stored_data = payload_store.put(data)
+        return data
+
+    def _spawn(self, coro: Coroutine[Any, Any, Any]) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            task = loop.create_task(coro)
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+        elif event_manager.loop is not None and event_manager.loop.is_running():
+            asyncio.run_coroutine_threadsafe(coro, event_manager.loop)
+        else:
+            asyncio.run(coro)
+
+    def _park(self, spec: AgentSpec, pooled: PooledAgent, trace_id: str) -> tuple[str, str | None]:
+        """Snapshot a run that stopped at one or more approval points."""
+        tool_use_ids = dict(pooled.context.suspensions)
+        approval_id = next(iter(tool_use_ids))
+        run = SuspendedRun(
+            approval_id=approval_id,
+            persona=spec.slug,
+            conversation_id=pooled.context.conversation_id,
+            tool_use_ids=tool_use_ids,
+            messages=copy.deepcopy(pooled.agent.messages),
+            trace_id=trace_id,
+            tier=spec.tier,
+        )
+        with self._suspend_lock:
+            reqs = [r for r in map(approval_queue.get, tool_use_ids) if r is not None]
+            if not reqs:
+                return f"Approval request {approval_id} no longer exists.", None
+            for r in reqs:
+                r.suspended = run
+            resolved = all(r.status != ApprovalStatus.PENDING for r in reqs)
+        # Approved or denied before the snapshot landed: carry straight on.
+        if resolved:
+            self.resume_suspended(reqs[0].id)
+        logger.info("Run for %s suspended on approvals %s", spec.slug, list(tool_use_ids))
+        if len(reqs) == 1:
+            return (
+                f"This request needs approval ({reqs[0].sensitivity_reason}). "
+                f"I'll continue as soon as approval {reqs[0].id} is resolved.",
+                reqs[0].id,
+            )
+        return (
+            f"These requests need approval: "
+            + "; ".join(f"{r.id} ({r.sensitivity_reason})" for r in reqs)
+            + ". I'll continue as soon as all of them are resolved.",
+            reqs[0].id,
+        )
+
+    async def _outcome(self, req, conversation_id: str) -> dict[str, Any]:
+        """What a resolved approval request's tool call returns to the resumed run."""
+        if req.status == ApprovalStatus.DENIED:
+            return {"status": "denied", "message": f"Access to {req.data_type} was denied by the approver"}
+        if req.status == ApprovalStatus.EXPIRED:
+            return {"status": "expired", "message": f"The approval request for {req.data_type} expired"}
+        try:
+            data = await self._release_data(req)
+        except Exception as e:
+            logger.exception("Deferred request %s failed", req.id)
+            return {"status": "error", "message": str(e)}
+        return {
+            "status": "success",
+            "data": self._hand_off(data, conversation_id, req.target_agent, req.data_type),
+        }
+
+    async def _resume(self, run: SuspendedRun) -> None:
+        reqs = {approval_id: approval_queue.get(approval_id) for approval_id in run.tool_use_ids}
+        live = [r for r in reqs.values() if r is not None]
+        spec = agent_registry.get(run.persona)
+        try:
+            if not live or spec is None:
+                logger.warning("Cannot resume run on approval %s: request or agent is gone", run.approval_id)
+                return
+            history = run.messages
+            for approval_id, tool_use_id in run.tool_use_ids.items():
+                req = reqs[approval_id]
+                if req is None:
+                    outcome = {"status": "error", "message": f"Approval request {approval_id} no longer exists"}
+                else:
+                    outcome = await self._outcome(req, run.conversation_id)
+                history = with_tool_result(history, tool_use_id, outcome)
+
+            decisions = (
+                f"the {live[0].status.value} decision" if len(live) == 1 else f"{len(live)} approval decisions"
+            )
+            await event_manager.emit(
+                run.conversation_id, "agent:resumed", spec.slug,
+                approval_id=run.approval_id,
+                message=f"{spec.name} is resuming after {decisions}",
+                trace_id=run.trace_id,
+            )
+            deadline = Deadline(get_settings().request_timeout_seconds)
+            try:
+                response_text, approval_id = await run_with_deadline(
+                    self._on_tier(
+                        spec, run.tier or tiering.LARGE,
+                        lambda s: self._start_run(s, None, run.conversation_id, deadline, history, run.trace_id),
+                        ok=lambda out: bool(out[0].strip() or out[1]),
+                    ),
+                    deadline,
+                )
+            except RequestCancelled as e:
+                for req in live:
+                    req.response = f"Request cancelled: {e.reason}"
+                await event_manager.emit(
+                    run.conversation_id, "agent:cancelled", spec.slug,
+                    approval_id=run.approval_id, message=f"Request cancelled: {e.reason}", data={"reason": e.reason},
+                )
+                return
+            except Exception as e:
+                logger.exception("Resumed run for %s failed", spec.slug)
+                for req in live:
+                    req.response = f"I encountered an error: {e}"
+                await event_manager.emit(
+                    run.conversation_id, "agent:error", spec.slug, approval_id=run.approval_id, message=str(e)
+                )
+                return
+
+            for req in live:
+                if req.status == ApprovalStatus.APPROVED:
+                    approval_queue.fulfill(req.id)
+                req.response = response_text
+            await event_manager.emit(
+                run.conversation_id, "agent:responding", spec.slug,
+                approval_id=run.approval_id,
+                message="Response ready",
+                data={"response": response_text, "pending_approval_id": approval_id,
+                      "approval_ids": list(run.tool_use_ids)},
+                trace_id=run.trace_id,
+            )
+        finally:
+            for req in live:
+                req.resuming = False
+                req.held = False
+                approval_queue.touch(req.id)
+
+    def _start_run(
+        self,
+        spec: AgentSpec,
+        message: str | None,
+        conversation_id: str,
+        deadline: Deadline,
+        history: list | None = None,
+        trace_id: str = "",
+    ) -> Coroutine[Any, Any, tuple[str, str | None]]:
+        if get_settings().async_orchestrator:
+            return self._run_agent(spec, message, conversation_id, deadline, history, trace_id)
+        return asyncio.to_thread(
+            self._run_agent_sync, spec, message, conversation_id, deadline, history, trace_id
+        )
+
+
+    def _register_tools(self) -> None:
+        # Deferred so importing the orchestrator doesn't pull in Strands.
+        # Locked: the prefetch planner calls this from a worker thread.
+        with self._tools_lock:
+            if not self._tools_registered:
+                from app.tools import TOOLS
+
+                AgentFactory.register_tools(TOOLS)
+                self._tools_registered = True
+
+    def _build_agent(self, spec: AgentSpec, context: RunContext, hooks: DeadlineHooks):
+        """Build a poolable agent whose request_from_agent reads the current run's context."""
+        self._register_tools()
+        orchestrator_ref = self
+
+        from strands import tool as strands_tool
+
+        if get_settings().async_orchestrator:
+            @strands_tool(context=True)
+            async def request_from_agent(target_agent: str, data_type: str, ask: str, tool_context) -> dict:
+                """Route a data request to another agent in the organization.
+
+                Args:
+                    target_agent: The slug of the agent to request from (e.g. 'accountant').
+                    data_type: The type of data being requested (e.g. 'pnl', 'invoices').
+                    ask: A natural language description of what you need.
+
+                Returns:
+                    The response from the target agent, or a pending-approval notice.
+                """
+                result = await orchestrator_ref.route_request(
+                    source=spec.slug,
+                    target=target_agent,
+                    data_type=data_type,
+                    ask=ask,
+                    conversation_id=context.conversation_id,
+                    deadline=context.deadline,
+                )
+                if suspend_point(context, tool_context, result):
+                    orchestrator_ref._hold(result)
+                return tool_result(result, status="error" if result["status"] == "error" else "success")
+        else:
+            @strands_tool(context=True)
+            def request_from_agent(target_agent: str, data_type: str, ask: str, tool_context) -> dict:
+                """Route a data request to another agent in the organization.
+
+                Args:
+                    target_agent: The slug of the agent to request from (e.g. 'accountant').
+                    data_type: The type of data being requested (e.g. 'pnl', 'invoices').
+                    ask: A natural language description of what you need.
+
+                Returns:
+                    The response from the target agent, or a pending-approval notice.
+                """
+                result = orchestrator_ref.route_request_sync(
+                    source=spec.slug,
+                    target=target_agent,
+                    data_type=data_type,
+                    ask=ask,
+                    conversation_id=context.conversation_id,
+                    deadline=context.deadline,
+                )
+                if suspend_point(context, tool_context, result):
+                    orchestrator_ref._hold(result)
+                return tool_result(result, status="error" if result["status"] == "error" else "success")
+
+        @strands_tool
+        def fetch_data(handle: str, path: str = "", start: int = 0, length: int = 0) -> dict:
+            """Read part of a large payload another agent returned as a data handle.
+
+            Args:
+                handle: The handle id (e.g. 'h-1a2b3c4d5e6f') from a request_from_agent result.
+                path: Dotted path into the data, with list indexes or slices (e.g. 'invoices.0:10'). Empty for the top level.
+                start: For text, the first character to return.
+                length: For text, how many characters to return (0 for the default maximum).
+
+            Returns:
+                The requested slice, or an outline of it if it is still too large.
+            """
+            result = handle_store.fetch(handle, context.conversation_id, path, start, length)
+            return tool_result(result, status="error" if result.get("status") == "error" else "success")
+
+        return AgentFactory.create(
+            spec,
+            hooks=[hooks],
+            tool_overrides={"request_from_agent": request_from_agent, "fetch_data": fetch_data},
+        )
+
+    async def _run_agent(
+        self,
+        spec,
+        message: str | None,
+        conversation_id: str,
+        deadline: Deadline | None = None,
+        history: list | None = None,
+        trace_id: str = "",
+    ) -> tuple[str, str | None]:
+        """Run a top-level chat turn; returns (text, approval_id if it parked)."""
+        with bind_deadline(deadline), self.pool.acquire(spec, conversation_id, deadline) as pooled, \
+                self._parking(pooled):
+            self._prepare(pooled, history)
+            with _track_tools(pooled), surface_cancellation():
+                result = await self._invoke(spec, pooled.agent, message)
+            if pooled.context.suspensions:
+                return self._park(spec, pooled, trace_id)
+            return str(result), None
+
+    def _run_agent_sync(
+        self,
+        spec,
+        message: str | None,
+        conversation_id: str,
+        deadline: Deadline | None = None,
+        history: list | None = None,
+        trace_id: str = "",
+    ) -> tuple[str, str | None]:
+        with bind_deadline(deadline), self.pool.acquire(spec, conversation_id, deadline) as pooled, \
+                self._parking(pooled):
+            self._prepare(pooled, history)
+            with _track_tools(pooled), surface_cancellation():
+                result = pooled.agent(message)
+            if pooled.context.suspensions:
+                return self._park(spec, pooled, trace_id)
+            return str(result), None
+
+    @staticmethod
+    async def _invoke(spec: AgentSpec, agent, message: str | None):
+        sink = _deltas.get()
+        if sink is None:
+            return await agent.invoke_async(message)
+        result = None
+        async for event in agent.stream_async(message):
+            if "data" in event:
+                sink.put_nowait({"type": "agent:delta", "agent": spec.slug, "data": {"text": event["data"]}})
+            elif "result" in event:
+                result = event["result"]
+        return result
+
+    @staticmethod
+    def _hold(result: dict[str, Any]) -> None:
+        """Claim a pending request's release for the run about to park on it."""
+        req = approval_queue.get(result["approval_id"])
+        if req is not None:
+            req.held = True
+
+    @staticmethod
+    @contextmanager
+    def _parking(pooled: PooledAgent) -> Iterator[None]:
+        """Give back the requests a run held if it fails before it could park."""
+        try:
+            yield
+        except BaseException:
+            for approval_id, _ in pooled.context.suspensions:
+                req = approval_queue.get(approval_id)
+                if req is not None and req.suspended is None:
+                    req.held = False
+                    approval_queue.touch(approval_id)
+            raise
+
+    @staticmethod
+    def _prepare(pooled: PooledAgent, history: list | None) -> None:
+        pooled.context.suspendable = get_settings().suspend_on_approval
+        if history:
+            # Resuming: the conversation continues from the snapshot, no new prompt.
+            pooled.agent.messages.extend(history)
+
 
 orchestrator = Orchestrator()
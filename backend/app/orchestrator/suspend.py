@@ -0,0 +1,53 @@
+"""Snapshots of agent runs parked at an approval point.
+
+When a top-level run's ``request_from_agent`` call comes back
+``pending_approval``, the tool stops the event loop right after its result
+is recorded. The run's messages — ending in that pending tool result — are
+kept here, and once the approval is resolved the same conversation continues
+with the real outcome in place of the pending notice. A turn that issued
+several such calls in parallel is parked on all of their approvals and
+resumes once every one of them is resolved. Nothing before the
+approval point is sent to the model again as a fresh prompt.
+"""
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class SuspendedRun:
+    approval_id: str
+    persona: str
+    conversation_id: str
+    tool_use_ids: dict[str, str]  # approval id → toolUseId of its pending result, for every approval waited on
+    messages: list[dict[str, Any]] = field(default_factory=list)
+    trace_id: str = ""
+    tier: str = ""  # model tier the run was on; it resumes on the same one
+
+
+def suspend_point(context, tool_context, result: dict[str, Any]) -> bool:
+    """Stop the calling run after this tool if it is waiting on an approval.
+
+    ``context`` is the pooled agent's RunContext; only runs that opted in
+    (top-level chats, not nested target-agent hops) are suspended.
+    """
+    if not context.suspendable or result.get("status") != "pending_approval":
+        return False
+    context.suspensions.append((result["approval_id"], tool_context.tool_use["toolUseId"]))
+    tool_context.invocation_state.setdefault("request_state", {})["stop_event_loop"] = True
+    return True
+
+
+def with_tool_result(messages: list[dict[str, Any]], tool_use_id: str, data: Any) -> list[dict[str, Any]]:
+    """Copy of ``messages`` with the result for ``tool_use_id`` replaced by ``data``."""
+    messages = copy.deepcopy(messages)
+    for message in reversed(messages):
+        for block in message.get("content", []):
+            result = block.get("toolResult")
+            if result is not None and result.get("toolUseId") == tool_use_id:
+                result["status"] = "success"
+                result["content"] = [{"json": data}]
+                return messages
+    raise KeyError(f"No tool result for {tool_use_id} in suspended run")
@@ -0,0 +1,74 @@
+"""Per-request model tier selection.
+
+Specs may name a cheaper model in ``model_tiers["small"]`` (and optionally
+override ``"large"``, which otherwise is the spec's usual model). A rule set
+picks the tier for each run:
+
+- sub-agent data fetches (another agent asking for ``data_type``) → small,
+  unless the ask wants analysis rather than a lookup
+- short top-level messages with no analysis words → small
+- everything else → large
+
+A small-tier run that raises or comes back empty is retried once on the
+large tier. With a fake base model (``BEDROCK_MODEL_ID=fake...``) every tier
+uses that model, so local harnesses never reach Bedrock.
+"""
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+
+from app.agent_factory import AgentFactory, AgentSpec
+from app.config import get_settings
+from app.orchestrator.fastpath import FREE_FORM
+
+logger = logging.getLogger(__name__)
+
+SMALL = "small"
+LARGE = "large"
+
+_stats = {"small": 0, "large": 0, "escalated": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def choose(spec: AgentSpec, message: str | None, nested: bool = False) -> str:
+    """The tier to run ``spec`` on for ``message``."""
+    settings = get_settings()
+    if not settings.model_tiering or not spec.model_tiers.get(SMALL):
+        tier = LARGE
+    elif FREE_FORM.search(message or ""):
+        tier = LARGE
+    elif nested:
+        tier = SMALL
+    else:
+        tier = SMALL if len(message or "") <= settings.model_tier_small_max_chars else LARGE
+    _count(tier)
+    return tier
+
+
+def tier_spec(spec: AgentSpec, tier: str) -> AgentSpec:
+    """``spec`` set up to run on ``tier``'s model (pooled separately per tier)."""
+    model_id = spec.model_tiers.get(tier)
+    if not model_id:
+        # No override (the usual case for large): the spec's own model.
+        return spec
+    base = spec.model_id or AgentFactory.default_model_id()
+    if base.startswith("fake"):
+        model_id = base
+    return dataclasses.replace(spec, model_id=model_id, tier=tier)
+
+
+def escalated(spec: AgentSpec, reason: str) -> None:
+    _count("escalated")
+    logger.info("Escalating %s from the small to the large model: %s", spec.slug, reason)
+
+
+def stats() -> dict[str, int]:
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,80 @@
+"""Full reports behind ``summarize_report`` digests.
+
+Reports are kept as content-addressed, gzip-compressed files, so the tool
+process pool and the API process see the same ones, and are read back
+section by section with their reference. Nothing here needs NumPy.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from app.config import get_settings
+from app.serialization import loads
+
+
+class ReportStore:
+    """Content-addressed, gzip-compressed report files shared across processes."""
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = Path(directory) if directory else Path(tempfile.gettempdir()) / "agentorg-reports"
+
+    def put(self, encoded: bytes) -> str:
+        ref = "report-" + hashlib.sha256(encoded).hexdigest()[:16]
+        path = self.directory / f"{ref}.json.gz"
+        if not path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(gzip.compress(encoded, compresslevel=5))
+            os.replace(tmp, path)
+        else:
+            os.utime(path)
+        return ref
+
+    def get(self, ref: str) -> Any:
+        if not re.fullmatch(r"report-[0-9a-f]{16}", ref):
+            raise KeyError(ref)
+        try:
+            return loads(gzip.decompress((self.directory / f"{ref}.json.gz").read_bytes()))
+        except FileNotFoundError:
+            raise KeyError(ref) from None
+
+    def sweep(self, max_age_seconds: float) -> int:
+        if not self.directory.is_dir():
+            return 0
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for path in self.directory.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+
+def section(report: Any, path: str) -> Any:
+    """The part of ``report`` at a dotted ``path`` (list indexes and ``a:b`` slices allowed)."""
+    node = report
+    for part in filter(None, path.split(".")):
+        if isinstance(node, list):
+            if ":" in part:
+                start, _, stop = part.partition(":")
+                node = node[int(start or 0): int(stop) if stop else None]
+            else:
+                node = node[int(part)]
+        elif isinstance(node, dict):
+            node = node[part]
+        else:
+            raise KeyError(part)
+    return node
+
+
+report_store = ReportStore(get_settings().report_store_dir or None)
@@ -0,0 +1,249 @@
+"""Local pre-aggregation of financial reports before they reach a model.
+
+``digest`` turns a parsed report (a P&L, an invoice ledger, ...) into a
+compact summary: headline figures and totals, each line item's share of its
+section total, and for every table of records the column aggregates, group
+totals, top-N rows and period-over-period changes. Figures that match the
+requested focus are listed first. The numeric work is vectorized with NumPy
+when it is installed and falls back to plain Python otherwise. NumPy is
+imported on the first digest, not with this module, so importing the API
+doesn't pay for it. Full reports are kept in ``app.report_store``.
+"""
+from __future__ import annotations
+
+import functools
+import re
+from typing import Any
+
+MAX_GROUPS = 20  # string columns with more distinct values aren't grouped
+_PERIOD_COLUMNS = re.compile(r"^(period|quarter|month|year)$|date", re.IGNORECASE)
+_ID_COLUMNS = re.compile(r"(^|_)id$", re.IGNORECASE)
+_MEASURES = ("amount", "total", "value", "revenue", "cost")
+_TOKENS = re.compile(r"[a-z0-9]+")
+# Focus words → words that show up in report keys.
+_SYNONYMS = {
+    "cost": ("cogs", "cost", "opex", "expense", "expenses"),
+    "costs": ("cogs", "cost", "opex", "expense", "expenses"),
+    "spend": ("amount", "opex", "expense", "expenses"),
+    "spending": ("amount", "opex", "expense", "expenses"),
+    "profit": ("profit", "income", "margin"),
+    "profitability": ("profit", "income", "margin"),
+    "sales": ("sales", "revenue"),
+    "overdue": ("overdue", "status"),
+    "vendors": ("vendor",),
+}
+
+
+# ── Vectorized helpers ─────────────────────────────────────────────────
+
+@functools.cache
+def _numpy():
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return numpy
+
+
+def _column_stats(values: list[float | None]) -> dict[str, float]:
+    np = _numpy()
+    if np is not None:
+        arr = np.asarray([np.nan if v is None else v for v in values], dtype=float)
+        return {
+            "sum": float(np.nansum(arr)),
+            "mean": float(np.nanmean(arr)),
+            "min": float(np.nanmin(arr)),
+            "max": float(np.nanmax(arr)),
+        }
+    present = [v for v in values if v is not None]
+    return {
+        "sum": float(sum(present)),
+        "mean": sum(present) / len(present),
+        "min": float(min(present)),
+        "max": float(max(present)),
+    }
+
+
+def _group_sums(keys: list[str], values: list[float | None]) -> dict[str, float]:
+    """Sum of ``values`` per distinct key, in first-seen key order."""
+    np = _numpy()
+    if np is not None:
+        labels, first, inverse = np.unique(np.asarray(keys, dtype=object), return_index=True, return_inverse=True)
+        weights = np.asarray([0.0 if v is None else v for v in values], dtype=float)
+        sums = np.bincount(inverse.ravel(), weights=weights, minlength=len(labels))
+        order = np.argsort(first)
+        return {str(labels[i]): float(sums[i]) for i in order}
+    sums: dict[str, float] = {}
+    for key, value in zip(keys, values):
+        sums[key] = sums.get(key, 0.0) + (value or 0.0)
+    return sums
+
+
+def _top_indices(values: list[float | None], n: int) -> list[int]:
+    np = _numpy()
+    if np is not None:
+        arr = np.asarray([-np.inf if v is None else v for v in values], dtype=float)
+        n = min(n, len(arr))
+        top = np.argpartition(-arr, n - 1)[:n]
+        return [int(i) for i in top[np.argsort(-arr[top], kind="stable")]]
+    return sorted(range(len(values)), key=lambda i: -(values[i] if values[i] is not None else float("-inf")))[:n]
+
+
+def _changes(labels: list[str], values: list[float]) -> list[dict[str, Any]]:
+    """Period-over-period change between consecutive labels."""
+    np = _numpy()
+    if len(values) < 2:
+        return []
+    if np is not None:
+        arr = np.asarray(values, dtype=float)
+        delta = np.diff(arr)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = np.where(arr[:-1] != 0, delta / np.abs(arr[:-1]) * 100, np.nan)
+        deltas, pcts = delta.tolist(), [None if np.isnan(p) else round(float(p), 1) for p in pct]
+    else:
+        deltas = [b - a for a, b in zip(values, values[1:])]
+        pcts = [round(d / abs(a) * 100, 1) if a else None for a, d in zip(values, deltas)]
+    return [
+        {"from": labels[i], "to": labels[i + 1], "delta": round(deltas[i], 2), "pct": pcts[i]}
+        for i in range(len(deltas))
+    ]
+
+
+# ── Digest ─────────────────────────────────────────────────────────────
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _focus_words(focus: str) -> set[str]:
+    words = set(_TOKENS.findall(focus.lower()))
+    for word in list(words):
+        words.update(_SYNONYMS.get(word, ()))
+    return words
+
+
+def _matches(path: str, words: set[str]) -> bool:
+    return bool(words) and bool(words & set(_TOKENS.findall(path.lower())))
+
+
+def _period_key(column: str, value: Any) -> str | None:
+    if not isinstance(value, str) or not value:
+        return None
+    # Dates are bucketed by month; period labels are used as-is.
+    return value[:7] if "date" in column.lower() and re.match(r"\d{4}-\d{2}", value) else value
+
+
+def _table(path: str, rows: list[dict], top_n: int) -> dict[str, Any]:
+    columns: dict[str, list] = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, [])
+    for key, values in columns.items():
+        values.extend(row.get(key) for row in rows)
+
+    numeric = [
+        k for k, v in columns.items()
+        if not _ID_COLUMNS.search(k) and any(_is_number(x) for x in v) and all(x is None or _is_number(x) for x in v)
+    ]
+    text = [k for k, v in columns.items() if k not in numeric and all(x is None or isinstance(x, str) for x in v)]
+    table: dict[str, Any] = {"path": path, "rows": len(rows)}
+    if not numeric:
+        return table
+    measure = next((k for k in numeric if k.lower() in _MEASURES), numeric[0])
+    table["measure"] = measure
+    table["columns"] = {k: _column_stats(columns[k]) for k in numeric}
+
+    by: dict[str, dict[str, float]] = {}
+    for key in text:
+        if _PERIOD_COLUMNS.search(key):
+            continue
+        distinct = {v for v in columns[key] if v is not None}
+        if 1 < len(distinct) <= MAX_GROUPS and len(distinct) < len(rows):
+            by[key] = _group_sums([v or "" for v in columns[key]], columns[measure])
+    if by:
+        table["by"] = by
+
+    if len(rows) > top_n:
+        table["top"] = [rows[i] for i in _top_indices(columns[measure], top_n)]
+    else:
+        table["top"] = rows
+
+    periods: dict[str, Any] = {}
+    for key in text:
+        if not _PERIOD_COLUMNS.search(key):
+            continue
+        labels = [_period_key(key, v) for v in columns[key]]
+        pairs = [(label, value) for label, value in zip(labels, columns[measure]) if label is not None]
+        if len({label for label, _ in pairs}) < 2:
+            continue
+        sums = _group_sums([label for label, _ in pairs], [value for _, value in pairs])
+        # Month buckets sort chronologically; other labels keep the report's order.
+        ordered = sorted(sums) if "date" in key.lower() else list(sums)
+        periods[key] = {
+            "totals": {label: sums[label] for label in ordered},
+            "changes": _changes(ordered, [sums[label] for label in ordered]),
+        }
+    if periods:
+        table["periods"] = periods
+    return table
+
+
+def _walk(node: Any, path: str, metrics: dict[str, float], tables: list, top_n: int) -> None:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            _walk(value, f"{path}.{key}" if path else key, metrics, tables, top_n)
+    elif isinstance(node, list):
+        if node and all(isinstance(row, dict) for row in node):
+            tables.append(_table(path, node, top_n))
+    elif _is_number(node):
+        metrics[path] = node
+
+
+def _shares(report: Any, path: str = "") -> dict[str, float]:
+    """Each line item's percentage of its section's ``total_*`` figure."""
+    np = _numpy()
+    shares: dict[str, float] = {}
+    if not isinstance(report, dict):
+        return shares
+    totals = [k for k, v in report.items() if k.startswith("total") and _is_number(v)]
+    if len(totals) == 1 and report[totals[0]]:
+        items = [k for k, v in report.items() if _is_number(v) and k != totals[0]]
+        if items:
+            if np is not None:
+                pct = np.asarray([report[k] for k in items], dtype=float) / report[totals[0]] * 100
+                values = pct.round(1).tolist()
+            else:
+                values = [round(report[k] / report[totals[0]] * 100, 1) for k in items]
+            shares.update({f"{path}.{k}" if path else k: v for k, v in zip(items, values)})
+    for key, value in report.items():
+        if isinstance(value, dict):
+            shares.update(_shares(value, f"{path}.{key}" if path else key))
+    return shares
+
+
+def digest(report: Any, focus: str = "", top_n: int = 5) -> dict[str, Any]:
+    """Compact, focus-ordered summary of ``report``."""
+    np = _numpy()
+    metrics: dict[str, float] = {}
+    tables: list[dict[str, Any]] = []
+    _walk(report, "", metrics, tables, top_n)
+    words = _focus_words(focus)
+
+    labels = {k: v for k, v in report.items() if isinstance(v, str)} if isinstance(report, dict) else {}
+    focused = [path for path in metrics if _matches(path, words)]
+    headline = [path for path in metrics if "." not in path or path.rsplit(".", 1)[1].startswith("total")]
+    # With a focus, keep the matching figures and the headline numbers only.
+    keep = focused + [p for p in headline if p not in focused] if focused else list(metrics)
+
+    result: dict[str, Any] = {"labels": labels, "metrics": {p: metrics[p] for p in keep}}
+    shares = _shares(report)
+    if shares:
+        result["shares_pct"] = {p: v for p, v in shares.items() if not focused or p in focused} or shares
+    if tables:
+        result["tables"] = sorted(tables, key=lambda t: not (
+            _matches(t["path"], words) or any(_matches(c, words) for c in [*t.get("columns", {}), *t.get("by", {})])
+        ))
+    if focused:
+        result["focus_matches"] = focused
+    result["source"] = {"metrics": len(metrics), "tables": len(tables), "engine": "numpy" if np is not None else "python"}
+    return result
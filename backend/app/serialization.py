@@ -0,0 +1,89 @@
+"""One JSON codec for every boundary: tool results, SSE events, HTTP bodies.
+
+Everything inside the process passes plain Python structures; encoding
+happens once, where data leaves (model tool results, the event stream, API
+responses). Uses orjson when it is installed and falls back to the stdlib
+``json`` module with the same compact output otherwise.
+"""
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        return orjson.loads(data)
+else:
+    _encoder = json.JSONEncoder(default=_default, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps(obj: Any) -> bytes:
+        return _encoder.encode(obj).encode()
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+def dumps_str(obj: Any) -> str:
+    return dumps(obj).decode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through :func:`dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# ── Tool results ────────────────────────────────────────────────────────
+
+def tool_result(data: Any, status: str = "success") -> dict[str, Any]:
+    """A Strands ToolResult carrying ``data`` as a structured JSON block.
+
+    The model gets the structure as-is, so nothing is stringified inside the
+    process; the model client encodes it once on the way out.
+    """
+    return {"status": status, "content": [{"json": data}]}
+
+
+def tool_payload(result: Any) -> Any:
+    """The data inside a ToolResult (JSON block, else text), or ``result`` itself."""
+    if not (isinstance(result, dict) and "content" in result and "status" in result):
+        return result
+    for block in result["content"]:
+        if "json" in block:
+            return block["json"]
+        if "text" in block:
+            return block["text"]
+    return None
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import sys
@@ -15,17 +14,38 @@ from dotenv import load_dotenv
 # Load .env into os.environ so boto3/Strands can find AWS credentials
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
-from app.agents import AGENT_SPECS
+from app.agents import agent_registry
 from app.config import get_settings
-from app.models import AgentConfigOut, ApprovalOut, ChatRequest, ChatResponse, PermissionsBlock
+from app.http_cache import VersionedCache, conditional_response
+from app.models import (
+    AgentConfigOut,
+    ApprovalOut,
+    ApprovalWaitOut,
+    BatchChatRequest,
+    ChatRequest,
+    ChatResponse,
+    PermissionsBlock,
+)
+from app.orchestrator import fastpath, tiering
 from app.orchestrator.approval import approval_queue
+from app.orchestrator.deadline import CLIENT_DISCONNECTED, Deadline
 from app.orchestrator.events import event_manager
+from app.orchestrator.handles import handle_store
+from app.orchestrator.payloads import payload_store
+from app.orchestrator.prefetch import prefetcher
 from app.orchestrator.router import orchestrator
+from app.report_store import report_store
+from app.serialization import FastJSONResponse, dumps, dumps_str
+from app.tool_cache import tool_cache
+from app.tool_executor import tool_executor
 from app.tracing.middleware import TracingMiddleware
+from app.tracing.profiler import profile_ring
+from app.warmup import warm_up, warmup_state
 
 logging.basicConfig(
     level=logging.INFO,
@@ -37,27 +57,64 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+async def _sweep_expired() -> None:
+    while True:
+        try:
+            await asyncio.to_thread(orchestrator.expire_approvals)
+            await asyncio.to_thread(report_store.sweep, settings.report_ttl_seconds)
+            handle_store.expire(settings.data_handle_ttl_seconds)
+        except Exception:
+            logger.exception("Expiry sweep failed")
+        await asyncio.sleep(settings.approval_sweep_interval_seconds)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("AgentOrg API starting up...")
+    event_manager.bind_loop(asyncio.get_running_loop())
     try:
-        from app.graph.client import get_driver
-        get_driver()
-        logger.info("Neo4j connected")
+        if settings.graph_backend == "neo4j":
+            from app.graph.client import open_async_driver
+            open_async_driver()
     except Exception as e:
         logger.warning("Neo4j not available — running without graph permissions: %s", e)
+
+    warmup_task = None
+    if settings.warmup_enabled:
+        # Heavy imports, graph connection and agent construction happen here,
+        # not at import time; /api/ready reports 503 until they're done.
+        warmup_task = asyncio.create_task(asyncio.to_thread(warm_up, settings))
+        if settings.warmup_blocking:
+            await warmup_task
+    else:
+        warmup_state.ready = True
+    # Spilled payloads left behind by earlier processes; live ones are freed by their owners.
+    await asyncio.to_thread(payload_store.sweep_orphans)
+    sweeper = asyncio.create_task(_sweep_expired())
+    registry_watcher = asyncio.create_task(agent_registry.watch())
     yield
+    sweeper.cancel()
+    registry_watcher.cancel()
+    tool_executor.shutdown()
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
     # Shutdown
     try:
-        from app.graph.client import close_driver
+        from app.graph.client import close_async_driver, close_driver
         close_driver()
+        await close_async_driver()
     except Exception:
         pass
     logger.info("AgentOrg API shut down")
 
 
-app = FastAPI(title="AgentOrg API", version="0.1.0", lifespan=lifespan)
+app = FastAPI(
+    title="AgentOrg API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 # ── Middleware ───────────────────────────────────────────────────────────
 app.add_middleware(
@@ -66,6 +123,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Trace-ID", "X-Profile"],
 )
 app.add_middleware(TracingMiddleware)
 
@@ -76,14 +134,56 @@ async def health():
     return {"status": "ok", "service": "agentorg-api"}
 
 
+@app.get("/api/ready")
+async def ready():
+    return FastJSONResponse(
+        status_code=200 if warmup_state.ready else 503,
+        content=warmup_state.to_dict(),
+    )
+
+
 # ── Chat ────────────────────────────────────────────────────────────────
+async def _cancel_on_disconnect(request: Request, deadline: Deadline, interval: float = 0.5) -> None:
+    while not deadline.cancelled:
+        if await request.is_disconnected():
+            deadline.cancel(CLIENT_DISCONNECTED)
+            return
+        await asyncio.sleep(interval)
+
+
 @app.post("/api/chat", response_model=ChatResponse)
-async def chat(req: ChatRequest):
-    return await orchestrator.handle_chat(
-        message=req.message,
-        persona=req.persona,
-        conversation_id=req.conversation_id,
-    )
+async def chat(req: ChatRequest, request: Request):
+    deadline = Deadline(settings.request_timeout_seconds)
+    watcher = asyncio.create_task(_cancel_on_disconnect(request, deadline))
+    try:
+        return await orchestrator.handle_chat(
+            message=req.message,
+            persona=req.persona,
+            conversation_id=req.conversation_id,
+            deadline=deadline,
+        )
+    finally:
+        watcher.cancel()
+
+
+@app.post("/api/chat/batch")
+async def chat_batch(req: BatchChatRequest):
+    """Run many chats concurrently; results stream back as NDJSON in completion order."""
+    if len(req.items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(req.items)} items (max {settings.batch_max_items})",
+        )
+
+    async def ndjson():
+        results = orchestrator.handle_batch(req.items, parallelism=req.parallelism)
+        try:
+            async for result in results:
+                yield dumps(result.model_dump()) + b"\n"
+        finally:
+            await results.aclose()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 # ── SSE Stream ──────────────────────────────────────────────────────────
@@ -96,10 +196,10 @@ async def chat_stream(conversation_id: str = Query(...)):
             while True:
                 try:
                     event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield {"data": json.dumps(event)}
+                    yield {"data": dumps_str(event)}
                 except asyncio.TimeoutError:
                     # Send keepalive
-                    yield {"data": json.dumps({"type": "keepalive"})}
+                    yield {"data": dumps_str({"type": "keepalive"})}
         except asyncio.CancelledError:
             pass
         finally:
@@ -109,25 +209,11 @@ async def chat_stream(conversation_id: str = Query(...)):
 
 
 # ── Agents ──────────────────────────────────────────────────────────────
-@app.get("/api/agents", response_model=list[AgentConfigOut])
-async def list_agents():
-    return [
-        AgentConfigOut(
-            slug=spec.slug,
-            name=spec.name,
-            role=spec.role,
-            description=spec.description,
-            permissions=PermissionsBlock(**spec.permissions_dict()),
-        )
-        for spec in AGENT_SPECS.values()
-    ]
+_agents_cache = VersionedCache("agents")
+_approvals_cache = VersionedCache("approvals")
 
 
-@app.get("/api/agents/{slug}", response_model=AgentConfigOut)
-async def get_agent(slug: str):
-    spec = AGENT_SPECS.get(slug)
-    if spec is None:
-        raise HTTPException(status_code=404, detail=f"Agent '{slug}' not found")
+def _agent_out(spec) -> AgentConfigOut:
     return AgentConfigOut(
         slug=spec.slug,
         name=spec.name,
@@ -137,27 +223,66 @@ async def get_agent(slug: str):
     )
 
 
+@app.get("/api/agents", response_model=list[AgentConfigOut])
+async def list_agents(request: Request):
+    cached = _agents_cache.get(
+        agent_registry.current_version(),
+        "all",
+        lambda: ([_agent_out(spec).model_dump() for spec in agent_registry.values()], {}),
+    )
+    return conditional_response(request, cached)
+
+
+@app.get("/api/agents/{slug}", response_model=AgentConfigOut)
+async def get_agent(slug: str, request: Request):
+    spec = agent_registry.get(slug)
+    if spec is None:
+        raise HTTPException(status_code=404, detail=f"Agent '{slug}' not found")
+    cached = _agents_cache.get(
+        agent_registry.current_version(), slug, lambda: (_agent_out(spec).model_dump(), {})
+    )
+    return conditional_response(request, cached)
+
+
 @app.put("/api/agents/{slug}/permissions", response_model=AgentConfigOut)
 async def update_permissions(slug: str, permissions: PermissionsBlock):
-    spec = AGENT_SPECS.get(slug)
+    # A new spec version, so pooled agents built with the old tools are dropped.
+    spec = agent_registry.update(
+        slug,
+        data_access=list(permissions.dataAccess),
+        tools=list(permissions.tools),
+        routing=list(permissions.routing),
+    )
     if spec is None:
         raise HTTPException(status_code=404, detail=f"Agent '{slug}' not found")
-    spec.data_access = permissions.dataAccess
-    spec.tool_names = permissions.tools
-    spec.routing = permissions.routing
-    return AgentConfigOut(
-        slug=spec.slug,
-        name=spec.name,
-        role=spec.role,
-        description=spec.description,
-        permissions=PermissionsBlock(**spec.permissions_dict()),
-    )
+    return _agent_out(spec)
 
 
 # ── Approvals ───────────────────────────────────────────────────────────
 @app.get("/api/approvals", response_model=list[ApprovalOut])
-async def list_approvals(status: Optional[str] = Query(None)):
-    return approval_queue.list_by_status(status)
+async def list_approvals(
+    request: Request,
+    status: Optional[str] = Query(None),
+    source_agent: Optional[str] = Query(None),
+    target_agent: Optional[str] = Query(None),
+    conversation_id: Optional[str] = Query(None),
+    cursor: int = Query(0, ge=0, description="X-Next-Cursor from the previous page"),
+    limit: Optional[int] = Query(None, ge=1),
+):
+    """Approvals in creation order. With ``limit`` the response is one page and
+    ``X-Next-Cursor`` (when present) fetches the next one."""
+    limit = min(limit, settings.approvals_max_page_size) if limit else None
+
+    def build():
+        items, next_cursor = approval_queue.page(
+            status, after=cursor, limit=limit,
+            source_agent=source_agent, target_agent=target_agent, conversation_id=conversation_id,
+        )
+        return items, ({"X-Next-Cursor": str(next_cursor)} if next_cursor is not None else {})
+
+    key = (status, source_agent, target_agent, conversation_id, cursor, limit)
+    cached = _approvals_cache.get(approval_queue.version, key, build)
+    return conditional_response(request, cached)
 
 
 @app.post("/api/approvals/{approval_id}/approve", response_model=ApprovalOut)
@@ -172,6 +297,7 @@ async def approve_request(approval_id: str):
         approval_id=req.id,
         message=f"Request for {req.data_type} has been approved",
     )
+    orchestrator.resume_suspended(req.id)
     return req.to_dict()
 
 
@@ -187,12 +313,25 @@ async def deny_request(approval_id: str):
         approval_id=req.id,
         message=f"Request for {req.data_type} has been denied",
     )
+    orchestrator.resume_suspended(req.id)
     return req.to_dict()
 
 
+@app.get("/api/approvals/{approval_id}/wait", response_model=ApprovalWaitOut)
+async def wait_for_approval(
+    approval_id: str,
+    timeout: float = Query(30.0, gt=0, description="Seconds to wait before returning unsettled"),
+):
+    """Block until the approval is decided and any run parked on it has resumed."""
+    req = await approval_queue.wait_settled(approval_id, min(timeout, settings.approval_wait_max_seconds))
+    if req is None:
+        raise HTTPException(status_code=404, detail="Approval request not found")
+    return {**req.to_dict(), "settled": req.settled, "response": req.response}
+
+
 @app.post("/api/approvals/{approval_id}/fulfill")
 async def fulfill_request(approval_id: str):
-    result = orchestrator.fulfill_approved_request(approval_id)
+    result = await orchestrator.fulfill_approved_request(approval_id)
     if result["status"] == "not_found":
         raise HTTPException(status_code=404, detail="Approval request not found")
     return result
@@ -211,6 +350,69 @@ async def delete_approval(approval_id: str):
     return {"deleted": True}
 
 
+# ── Tool cache ──────────────────────────────────────────────────────────
+@app.get("/api/tools/cache")
+async def tool_cache_stats():
+    """Per-tool hit/miss counters for cacheable tools."""
+    return tool_cache.stats()
+
+
+@app.delete("/api/tools/cache")
+async def invalidate_tool_cache(tag: Optional[str] = None, tool: Optional[str] = None):
+    if tag == "graph":
+        # After an out-of-process reseed: rebuild the in-memory graph snapshot too.
+        from app.graph.queries import reset_backend
+        reset_backend()
+    return {"deleted": tool_cache.invalidate(tag=tag, tool=tool)}
+
+
+@app.get("/api/tools/executor")
+async def tool_executor_stats():
+    """Calls made through the tool process pool and shared-memory transfers."""
+    return tool_executor.stats()
+
+
+# ── Prefetch ────────────────────────────────────────────────────────────
+@app.get("/api/prefetch")
+async def prefetch_stats():
+    """Speculative prefetch hit rate, wasted work and per-persona request shares."""
+    return prefetcher.stats()
+
+
+# ── Orchestrator ────────────────────────────────────────────────────────
+@app.get("/api/orchestrator/fastpath")
+async def fastpath_stats():
+    """Inter-agent requests answered by a direct tool call vs. the owner's agent."""
+    return fastpath.stats()
+
+
+@app.get("/api/orchestrator/tiering")
+async def tiering_stats():
+    """Runs started on the small and large model tiers, and small runs escalated to large."""
+    return tiering.stats()
+
+
+@app.get("/api/orchestrator/payloads")
+async def payload_stats():
+    """Approval payloads kept in memory vs. spilled to disk, and the bytes spilled."""
+    return payload_store.stats()
+
+
+# ── Profiles ────────────────────────────────────────────────────────────
+@app.get("/api/profiles")
+async def list_profiles(limit: int = Query(50, ge=1, le=500)):
+    return list(profile_ring.recent(limit))
+
+
+@app.get("/api/profiles/{trace_id}", response_class=PlainTextResponse)
+async def get_profile(trace_id: str):
+    """Collapsed stacks for a profiled request (flamegraph.pl / speedscope input)."""
+    try:
+        return PlainTextResponse(await asyncio.to_thread(profile_ring.load, trace_id))
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+
 # ── Run ─────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,151 @@
+"""Result caching for read-only tools.
+
+Tools opt in from the ``TOOLS`` registry with ``cacheable(tool, ttl=...)``.
+``AgentFactory`` wraps them when resolving an agent's tools, so every agent
+(and the orchestrator's direct tool calls) shares one bounded LRU cache.
+Entries are keyed by tool name and the declared key arguments, expire after
+the tool's TTL, and can be dropped early by tag with ``invalidate``. Error
+results are never cached, nor are ``degraded`` ones: fallback answers a tool
+gave while its backend was unreachable.
+"""
+from __future__ import annotations
+
+import copy
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+from app.config import get_settings
+from app.serialization import tool_payload
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl: float
+    key_args: tuple[str, ...] | None = None  # None: every argument is part of the key
+    tags: tuple[str, ...] = ()
+
+
+def cacheable(tool, ttl: float, key_args: tuple[str, ...] | None = None, tags: tuple[str, ...] = ()):
+    """Mark a registry tool as safe to cache for ``ttl`` seconds."""
+    tool.cache_policy = CachePolicy(ttl, tuple(key_args) if key_args is not None else None, tuple(tags))
+    return tool
+
+
+class ToolCache:
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, tuple[str, ...], Any]] = OrderedDict()
+        self._stats: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, key: Hashable) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats.setdefault(name, {"hits": 0, "misses": 0, "expired": 0})
+            entry = self._entries.get((name, key))
+            if entry is not None and entry[0] <= now:
+                del self._entries[(name, key)]
+                stats["expired"] += 1
+                entry = None
+            if entry is None:
+                stats["misses"] += 1
+                return _MISSING
+            self._entries.move_to_end((name, key))
+            stats["hits"] += 1
+        return copy.deepcopy(entry[2])
+
+    def put(self, name: str, key: Hashable, value: Any, policy: CachePolicy) -> None:
+        entry = (time.monotonic() + policy.ttl, policy.tags, copy.deepcopy(value))
+        with self._lock:
+            self._entries[(name, key)] = entry
+            self._entries.move_to_end((name, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tag: str | None = None, tool: str | None = None) -> int:
+        """Drop entries carrying ``tag`` and/or belonging to ``tool`` (all if neither)."""
+        with self._lock:
+            doomed = [
+                k for k, (_, tags, _) in self._entries.items()
+                if (tag is None or tag in tags) and (tool is None or k[0] == tool)
+            ]
+            for k in doomed:
+                del self._entries[k]
+        return len(doomed)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            tools = {name: dict(counts) for name, counts in self._stats.items()}
+            size = len(self._entries)
+        for counts in tools.values():
+            lookups = counts["hits"] + counts["misses"]
+            counts["hit_rate"] = round(counts["hits"] / lookups, 4) if lookups else 0.0
+        return {"entries": size, "max_entries": self.max_entries, "tools": tools}
+
+    def wrap(self, name: str, tool):
+        """A copy of the decorated ``tool`` whose results go through this cache."""
+        from strands.tools.decorator import DecoratedFunctionTool
+
+        policy: CachePolicy = tool.cache_policy
+        func = tool._tool_func
+        signature = inspect.signature(func)
+
+        def key_for(args, kwargs) -> Hashable:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            names = policy.key_args if policy.key_args is not None else tuple(bound.arguments)
+            return tuple((n, _freeze(bound.arguments.get(n))) for n in names)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def cached(*args, **kwargs):
+                key = key_for(args, kwargs)
+                result = self.get(name, key)
+                if result is _MISSING:
+                    result = await func(*args, **kwargs)
+                    if _cacheable_result(result):
+                        self.put(name, key, result, policy)
+                return result
+        else:
+            @functools.wraps(func)
+            def cached(*args, **kwargs):
+                key = key_for(args, kwargs)
+                result = self.get(name, key)
+                if result is _MISSING:
+                    result = func(*args, **kwargs)
+                    if _cacheable_result(result):
+                        self.put(name, key, result, policy)
+                return result
+
+        wrapped = DecoratedFunctionTool(tool.tool_name, tool.tool_spec, cached, tool._metadata)
+        wrapped.cache_policy = policy
+        return wrapped
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _cacheable_result(result: Any) -> bool:
+    if isinstance(result, dict) and result.get("status") == "error":
+        return False
+    payload = tool_payload(result)
+    return not (isinstance(payload, dict) and payload.get("degraded"))
+
+
+def _make_cache() -> ToolCache:
+    return ToolCache(get_settings().tool_cache_max_entries)
+
+
+tool_cache = _make_cache()
@@ -0,0 +1,246 @@
+"""Process-pool execution for CPU-heavy tools.
+
+Tools run in the agent's thread by default, so a CPU-bound one holds the GIL
+and stalls every other conversation in the process. Registry tools marked
+``run_in_process(tool)`` are instead sent to a shared pool of worker
+processes. Arguments and results cross the process boundary as encoded JSON;
+anything at or above ``shm_threshold`` bytes goes through a shared memory
+block instead of the pool's pipe, so large reports aren't pickled and copied
+through it.
+
+Workers are spawned (not forked — the parent runs threads and an event loop)
+on first use and import the tool's module themselves. If a call breaks the
+pool (its worker died) the pool is replaced and the call retried once. When
+a fresh pool can't even start a worker (e.g. ``__main__`` isn't importable
+by the spawned children), or the platform can't create the pool or shared
+memory at all (AWS Lambda has no ``/dev/shm``), process tools run in this
+process from then on.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib import import_module
+from multiprocessing import shared_memory
+from typing import Any
+
+from app.config import get_settings
+from app.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+
+# What creating the pool, spawning workers or a shared memory block raises
+# where the platform doesn't support them.
+_UNSUPPORTED = (OSError, NotImplementedError)
+
+
+class _ProcessesUnavailable(Exception):
+    """The pool or its shared memory can't be set up here; run the tool in-process."""
+
+
+def run_in_process(tool):
+    """Mark a registry tool as CPU-heavy: it runs in the tool process pool."""
+    tool.execution = "process"
+    return tool
+
+
+# ── Transfer ────────────────────────────────────────────────────────────
+# A payload is ("inline", bytes) or ("shm", block name, size).
+
+def _pack(data: Any, threshold: int) -> tuple:
+    encoded = dumps(data)
+    if len(encoded) < threshold:
+        return ("inline", encoded)
+    block = shared_memory.SharedMemory(create=True, size=len(encoded))
+    block.buf[: len(encoded)] = encoded
+    block.close()
+    return ("shm", block.name, len(encoded))
+
+
+def _unpack(payload: tuple) -> Any:
+    if payload[0] == "inline":
+        return loads(payload[1])
+    _, name, size = payload
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return loads(bytes(block.buf[:size]))
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _discard(payload: tuple) -> None:
+    if payload[0] == "shm":
+        try:
+            block = shared_memory.SharedMemory(name=payload[1])
+        except FileNotFoundError:
+            return
+        block.close()
+        block.unlink()
+
+
+def _worker_call(module: str, attr: str, payload: tuple, threshold: int) -> tuple:
+    """Runs in a worker: decode arguments, call the tool function, encode the result."""
+    tool = getattr(import_module(module), attr)
+    func = getattr(tool, "_tool_func", tool)
+    kwargs = _unpack(payload)
+    result = func(**kwargs)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+    return _pack(result, threshold)
+
+
+def _inline_call(module: str, attr: str, kwargs: dict[str, Any]) -> Any:
+    tool = getattr(import_module(module), attr)
+    result = getattr(tool, "_tool_func", tool)(**kwargs)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
+
+
+# ── Executor ────────────────────────────────────────────────────────────
+
+class ToolExecutor:
+    def __init__(self, max_workers: int, shm_threshold: int) -> None:
+        self.max_workers = max_workers
+        self.shm_threshold = shm_threshold
+        self._pool: ProcessPoolExecutor | None = None
+        self._inline = False  # set once pools keep breaking: run tools in-process
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "errors": 0, "shm_args": 0, "shm_results": 0, "broken_pools": 0, "inline": 0}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def _replace_broken(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+            self._stats["broken_pools"] += 1
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    async def call(self, module: str, attr: str, kwargs: dict[str, Any]) -> Any:
+        """Run ``module.attr`` with ``kwargs`` in the pool and return its result."""
+        self._count("calls")
+        for _ in range(2):
+            if self._inline:
+                break
+            try:
+                pool = self._pool_or_unavailable()
+                return await self._submit(pool, module, attr, kwargs)
+            except _ProcessesUnavailable as e:
+                self._fall_back_inline(e.__cause__)
+                break
+            except BrokenProcessPool:
+                logger.warning("Tool process pool broke running %s.%s; replacing it", module, attr)
+                self._replace_broken(pool)
+                await self._check_workers_start()
+        else:
+            raise BrokenProcessPool(f"{module}.{attr} killed its worker process twice")
+        self._count("inline")
+        return await asyncio.to_thread(_inline_call, module, attr, kwargs)
+
+    def _pool_or_unavailable(self) -> ProcessPoolExecutor:
+        try:
+            return self._get_pool()
+        except _UNSUPPORTED as e:
+            raise _ProcessesUnavailable() from e
+
+    def _fall_back_inline(self, error: BaseException | None) -> None:
+        logger.error("Tool process pool unavailable (%s); running process tools in-process from now on", error)
+        self._inline = True
+        self.shutdown()
+
+    async def _check_workers_start(self) -> None:
+        """Switch to in-process execution if a fresh pool can't run even a trivial call."""
+        try:
+            pool = self._pool_or_unavailable()
+            await asyncio.get_running_loop().run_in_executor(pool, os.getpid)
+        except _ProcessesUnavailable as e:
+            self._fall_back_inline(e.__cause__)
+        except _UNSUPPORTED as e:
+            self._fall_back_inline(e)
+        except BrokenProcessPool:
+            self._replace_broken(pool)
+            logger.error("Tool worker processes fail to start; running process tools in-process from now on")
+            self._inline = True
+
+    async def _submit(self, pool: ProcessPoolExecutor, module: str, attr: str, kwargs: dict[str, Any]) -> Any:
+        # Only setting up the call (shared memory, spawning workers) maps
+        # platform errors to _ProcessesUnavailable; the tool's own OSErrors
+        # come back through the future below and are re-raised as they are.
+        try:
+            payload = _pack(kwargs, self.shm_threshold)
+        except _UNSUPPORTED as e:
+            raise _ProcessesUnavailable() from e
+        if payload[0] == "shm":
+            self._count("shm_args")
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(pool, _worker_call, module, attr, payload, self.shm_threshold)
+        except _UNSUPPORTED as e:
+            _discard(payload)
+            raise _ProcessesUnavailable() from e
+        try:
+            result = await future
+        except BaseException:
+            # The worker may not have consumed (and unlinked) the argument block.
+            _discard(payload)
+            self._count("errors")
+            raise
+        if result[0] == "shm":
+            self._count("shm_results")
+        return _unpack(result)
+
+    def wrap(self, tool):
+        """A copy of the decorated ``tool`` that executes in the process pool."""
+        from strands.tools.decorator import DecoratedFunctionTool
+
+        func = tool._tool_func
+        signature = inspect.signature(func)
+        module, attr = func.__module__, func.__name__
+
+        @functools.wraps(func)
+        async def offloaded(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            return await self.call(module, attr, dict(bound.arguments))
+
+        wrapped = DecoratedFunctionTool(tool.tool_name, tool.tool_spec, offloaded, tool._metadata)
+        wrapped.execution = "process"
+        return wrapped
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "max_workers": self.max_workers, "started": self._pool is not None,
+                    "inline_fallback": self._inline}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _make_executor() -> ToolExecutor:
+    settings = get_settings()
+    return ToolExecutor(settings.tool_process_workers, settings.tool_shm_threshold)
+
+
+tool_executor = _make_executor()
@@ -1,12 +1,16 @@
 """Strands tools available to agents."""
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 
 from strands.tools import tool
 
+from app.config import get_settings
+from app.serialization import loads, tool_result
+from app.tool_cache import cacheable
+from app.tool_executor import run_in_process
+
 logger = logging.getLogger(__name__)
 
 MOCK_DATA_DIR = Path(__file__).parent / "mock_data"
@@ -14,7 +18,7 @@ MOCK_DATA_DIR = Path(__file__).parent / "mock_data"
 
 # ── Inter-agent communication ───────────────────────────────────────────
 @tool
-def request_from_agent(target_agent: str, data_type: str, ask: str) -> str:
+def request_from_agent(target_agent: str, data_type: str, ask: str) -> dict:
     """Route a data request to another agent in the organization.
 
     Args:
@@ -26,14 +30,34 @@ def request_from_agent(target_agent: str, data_type: str, ask: str) -> str:
         The response from the target agent, or a pending-approval notice.
     """
     # This is intercepted by the orchestrator at runtime.
-    return json.dumps({
+    return tool_result({
         "status": "error",
         "message": "Orchestrator not connected — request_from_agent requires the orchestrator runtime.",
-    })
+    }, status="error")
+
+
+@tool
+def fetch_data(handle: str, path: str = "", start: int = 0, length: int = 0) -> dict:
+    """Read part of a large payload another agent returned as a data handle.
+
+    Args:
+        handle: The handle id (e.g. 'h-1a2b3c4d5e6f') from a request_from_agent result.
+        path: Dotted path into the data, with list indexes or slices (e.g. 'invoices.0:10'). Empty for the top level.
+        start: For text, the first character to return.
+        length: For text, how many characters to return (0 for the default maximum).
+
+    Returns:
+        The requested slice, or an outline of it if it is still too large.
+    """
+    # Bound to the conversation by the orchestrator at runtime.
+    return tool_result({
+        "status": "error",
+        "message": "Orchestrator not connected — fetch_data requires the orchestrator runtime.",
+    }, status="error")
 
 
 @tool
-def summarize_report(report_json: str, focus: str) -> str:
+def summarize_report(report_json: str, focus: str) -> dict:
     """Summarize a financial report with a specific focus area.
 
     Args:
@@ -41,17 +65,52 @@ def summarize_report(report_json: str, focus: str) -> str:
         focus: What aspect to focus the summary on (e.g. 'revenue trends', 'cost reduction').
 
     Returns:
-        A concise summary of the report focused on the requested area.
+        A compact digest of the report (totals, shares, top items, period-over-period
+        changes) ordered by the focus, and a report_ref for reading full sections.
     """
-    return json.dumps({
+    from app.report_store import report_store
+    from app.reports import digest
+
+    try:
+        report = loads(report_json)
+    except ValueError:
+        return tool_result({
+            "status": "success",
+            "message": f"Please summarize the following report focusing on {focus}:\n{report_json}",
+        })
+    return tool_result({
         "status": "success",
-        "message": f"Please summarize the following report focusing on {focus}:\n{report_json}",
+        "message": (
+            f"Summarize this digest focusing on {focus}. For figures it leaves out, "
+            "call read_report_section with the report_ref."
+        ),
+        "report_ref": report_store.put(report_json.encode()),
+        "digest": digest(report, focus, get_settings().report_digest_top_n),
     })
 
 
+@tool
+def read_report_section(report_ref: str, path: str) -> dict:
+    """Read part of a report previously passed to summarize_report.
+
+    Args:
+        report_ref: The report_ref returned by summarize_report.
+        path: Dotted path into the report, e.g. 'operating_expenses' or 'invoices.0:10'. Empty for the whole report.
+
+    Returns:
+        The requested section of the full report.
+    """
+    from app.report_store import report_store, section
+
+    try:
+        return tool_result({"report_ref": report_ref, "path": path, "data": section(report_store.get(report_ref), path)})
+    except (KeyError, IndexError, ValueError) as e:
+        return tool_result({"status": "error", "message": f"No section {path!r} in {report_ref}: {e}"}, status="error")
+
+
 # ── Data retrieval ──────────────────────────────────────────────────────
 @tool
-def pull_pnl(quarter: str, year: str) -> str:
+def pull_pnl(quarter: str, year: str) -> dict:
     """Pull the Profit & Loss statement for a given quarter and year.
 
     Args:
@@ -59,18 +118,18 @@ def pull_pnl(quarter: str, year: str) -> str:
         year: The year (e.g. '2024').
 
     Returns:
-        JSON string of the P&L data.
+        The P&L data.
     """
     try:
-        data = json.loads((MOCK_DATA_DIR / "pnl.json").read_text())
+        data = loads((MOCK_DATA_DIR / "pnl.json").read_bytes())
         data["_query"] = {"quarter": quarter, "year": year}
-        return json.dumps(data)
+        return tool_result(data)
     except Exception as e:
-        return json.dumps({"status": "error", "message": str(e)})
+        return tool_result({"status": "error", "message": str(e)}, status="error")
 
 
 @tool
-def pull_invoices(status_filter: str, category: str) -> str:
+def pull_invoices(status_filter: str, category: str) -> dict:
     """Pull invoices filtered by status and/or category.
 
     Args:
@@ -78,10 +137,10 @@ def pull_invoices(status_filter: str, category: str) -> str:
         category: Filter by category or 'all' for all categories.
 
     Returns:
-        JSON string of the filtered invoices.
+        The filtered invoices.
     """
     try:
-        data = json.loads((MOCK_DATA_DIR / "invoices.json").read_text())
+        data = loads((MOCK_DATA_DIR / "invoices.json").read_bytes())
         invoices = data["invoices"]
 
         if status_filter and status_filter != "all":
@@ -89,72 +148,80 @@ def pull_invoices(status_filter: str, category: str) -> str:
         if category and category != "all":
             invoices = [i for i in invoices if i["category"] == category]
 
-        return json.dumps({
+        return tool_result({
             "invoices": invoices,
             "count": len(invoices),
             "filter": {"status": status_filter, "category": category},
         })
     except Exception as e:
-        return json.dumps({"status": "error", "message": str(e)})
+        return tool_result({"status": "error", "message": str(e)}, status="error")
 
 
 @tool
-def check_approval_required_tool(data_type: str) -> str:
+async def check_approval_required_tool(data_type: str) -> dict:
     """Check whether accessing a data type requires approval.
 
     Args:
         data_type: The data resource identifier (e.g. 'pnl', 'invoices').
 
     Returns:
-        JSON indicating whether approval is required and the reason.
+        Whether approval is required and the reason.
     """
     try:
-        from app.graph.queries import check_approval_required
+        from app.graph.queries import check_approval_required_async
 
-        policy = check_approval_required(data_type)
+        policy = await check_approval_required_async(data_type)
         if policy:
-            return json.dumps({
+            return tool_result({
                 "requires_approval": True,
                 "level": policy["level"],
                 "reason": policy["reason"],
             })
-        return json.dumps({"requires_approval": False})
+        return tool_result({"requires_approval": False})
     except Exception as e:
         logger.warning("Neo4j unavailable for approval check: %s", e)
         needs = data_type in ("pnl", "budget")
-        return json.dumps({
+        # A guess, not the policy: degraded results are never cached.
+        return tool_result({
             "requires_approval": needs,
             "reason": f"{data_type} is sensitive" if needs else "",
+            "degraded": True,
         })
 
 
 @tool
-def check_approval_status(approval_id: str) -> str:
+def check_approval_status(approval_id: str) -> dict:
     """Check the status of a previously created approval request.
 
     Args:
         approval_id: The ID of the approval request to check.
 
     Returns:
-        JSON with the approval status and any associated data.
+        The approval status and any associated data.
     """
     try:
         from app.orchestrator.approval import approval_queue
 
         req = approval_queue.get(approval_id)
         if req is None:
-            return json.dumps({"status": "not_found", "approval_id": approval_id})
-        return json.dumps(req.to_dict())
+            return tool_result({"status": "not_found", "approval_id": approval_id})
+        return tool_result(req.to_dict())
     except Exception as e:
-        return json.dumps({"status": "error", "message": str(e)})
+        return tool_result({"status": "error", "message": str(e)}, status="error")
 
 
 # ── Tool registry ──────────────────────────────────────────────────────
 TOOLS: dict[str, object] = {
     "request_from_agent": request_from_agent,
-    "summarize_report": summarize_report,
-    "pull_pnl": pull_pnl,
-    "pull_invoices": pull_invoices,
-    "check_approval_required": check_approval_required_tool,
+    "fetch_data": fetch_data,
+    # CPU-bound over large inputs: run in the tool process pool.
+    "summarize_report": run_in_process(summarize_report),
+    "read_report_section": read_report_section,
+    # Read-only lookups: same arguments, same answer until the TTL or a tag
+    # invalidation ("mock_data", "graph") says otherwise.
+    "pull_pnl": cacheable(pull_pnl, ttl=300, tags=("mock_data",)),
+    # A small file read and filter: IPC would cost more than it saves.
+    "pull_invoices": cacheable(pull_invoices, ttl=300, tags=("mock_data",)),
+    "check_approval_required": cacheable(check_approval_required_tool, ttl=60, tags=("graph",)),
     "check_approval_status": check_approval_status,
 }
@@ -1,6 +1,9 @@
 """FastAPI middleware that wraps each request in a trace span."""
 from __future__ import annotations
 
+import asyncio
+import logging
+import random
 import time
 import uuid
 
@@ -8,8 +11,19 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.requests import Request
 from starlette.responses import Response
 
+from app.config import get_settings
+from app.tracing.profiler import profile_ring, profiler
 from app.tracing.spans import tracer
 
+logger = logging.getLogger(__name__)
+
+
+def _should_profile(request: Request) -> bool:
+    settings = get_settings()
+    if settings.profiling_enabled and request.headers.get("x-profile") == "1":
+        return True
+    return settings.profile_sample_rate > 0 and random.random() < settings.profile_sample_rate
+
 
 class TracingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
@@ -22,6 +36,30 @@ class TracingMiddleware(BaseHTTPMiddleware):
             path=request.url.path,
             trace_id=trace_id,
         ):
-            response = await call_next(request)
+            if not _should_profile(request):
+                response = await call_next(request)
+                response.headers["X-Trace-ID"] = trace_id
+                return response
+
+            # Covers the handler up to the response start (not a streamed body).
+            profile = profiler.start(trace_id)
+            start = time.perf_counter()
+            saved = False
+            try:
+                response = await call_next(request)
+            finally:
+                profiler.stop(profile)
+                try:
+                    await asyncio.to_thread(
+                        profile_ring.save, profile,
+                        method=request.method, path=request.url.path,
+                        duration_ms=f"{(time.perf_counter() - start) * 1000:.1f}",
+                    )
+                    saved = True
+                except Exception:
+                    # A lost profile must not fail the request it measured.
+                    logger.exception("Could not save profile %s", trace_id)
             response.headers["X-Trace-ID"] = trace_id
+            if saved:
+                response.headers["X-Profile"] = f"/api/profiles/{trace_id}"
             return response
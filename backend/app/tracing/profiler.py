@@ -0,0 +1,170 @@
+"""Opt-in sampling profiler for individual requests.
+
+``TracingMiddleware`` profiles a request when it carries ``X-Profile: 1``
+(and ``PROFILING_ENABLED`` is set) or is picked by ``PROFILE_SAMPLE_RATE``.
+While at least one profiled request is in flight, a single sampler thread
+snapshots every thread's stack each ``PROFILE_INTERVAL_MS`` — the event loop
+and the worker threads agents, tools and graph queries run on — and counts
+identical stacks. Idle pool threads parked in a wait are skipped.
+
+Samples are not attributed to a request beyond its time window: whatever
+else the process was doing meanwhile shows up too, so profile on a quiet
+worker for clean numbers. Profiles are stored as collapsed stacks
+(``frame;frame;frame count``, the input format of flamegraph.pl and
+speedscope) in a bounded on-disk ring, one file per trace ID.
+"""
+from __future__ import annotations
+
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterator
+
+from app.config import get_settings
+
+# Frames (at or just above the leaf) of threads that are parked, not working.
+_IDLE_FRAMES = {
+    ("threading", "Condition.wait"),
+    ("threading", "Event.wait"),
+    ("queue", "Queue.get"),
+    ("concurrent.futures.thread", "_worker"),
+    ("multiprocessing.connection", "wait"),
+}
+_TRACE_ID = re.compile(r"^[0-9A-Za-z-]{1,64}$")
+
+
+def _is_idle(frame) -> bool:
+    for _ in range(2):
+        if frame is None:
+            return False
+        if (frame.f_globals.get("__name__"), frame.f_code.co_qualname) in _IDLE_FRAMES:
+            return True
+        frame = frame.f_back
+    return False
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}"
+
+
+class Profile:
+    __slots__ = ("trace_id", "stacks", "samples", "started")
+
+    def __init__(self, trace_id: str) -> None:
+        self.trace_id = trace_id
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.started = time.perf_counter()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._active: dict[str, Profile] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self, trace_id: str) -> Profile:
+        profile = Profile(trace_id)
+        with self._lock:
+            self._active[trace_id] = profile
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+        return profile
+
+    def stop(self, profile: Profile) -> Profile:
+        """Detach ``profile`` from the sampler; it is safe to read once this returns."""
+        with self._lock:
+            self._active.pop(profile.trace_id, None)
+        return profile
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        while True:
+            with self._lock:
+                active = list(self._active.values())
+                if not active:
+                    self._thread = None
+                    return
+            names = {t.ident: t.name for t in threading.enumerate()}
+            stacks: list[str] = []
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                if _is_idle(frame):
+                    continue
+                frames = []
+                while frame is not None:
+                    frames.append(_frame_name(frame))
+                    frame = frame.f_back
+                frames.append(f"thread:{names.get(ident, ident)}")
+                stacks.append(";".join(reversed(frames)))
+            # Under the lock, and only profiles still active: once stop()
+            # returns, the sampler never touches that profile again.
+            with self._lock:
+                for profile in self._active.values():
+                    profile.stacks.update(stacks)
+                    profile.samples += 1
+            time.sleep(self.interval)
+
+
+class ProfileRing:
+    """Collapsed-stack files, newest ``size`` kept."""
+
+    def __init__(self, directory: str | Path | None, size: int) -> None:
+        self.directory = Path(directory) if directory else Path(tempfile.gettempdir()) / "agentorg-profiles"
+        self.size = size
+        self._lock = threading.Lock()
+
+    def _path(self, trace_id: str) -> Path:
+        if not _TRACE_ID.match(trace_id):
+            raise KeyError(trace_id)
+        return self.directory / f"{trace_id}.folded"
+
+    def save(self, profile: Profile, **meta: str) -> None:
+        header = " ".join(f"{k}={v}" for k, v in {"samples": profile.samples, **meta}.items())
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(profile.trace_id)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(f"# {header}\n{profile.collapsed()}")
+            os.replace(tmp, path)
+            files = sorted(self.directory.glob("*.folded"), key=lambda p: p.stat().st_mtime)
+            for old in files[: max(0, len(files) - self.size)]:
+                old.unlink(missing_ok=True)
+
+    def load(self, trace_id: str) -> str:
+        try:
+            return self._path(trace_id).read_text()
+        except FileNotFoundError:
+            raise KeyError(trace_id) from None
+
+    def recent(self, limit: int = 50) -> Iterator[dict]:
+        if not self.directory.is_dir():
+            return
+        files = sorted(self.directory.glob("*.folded"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in files[:limit]:
+            with path.open() as f:
+                header = f.readline().lstrip("# ").strip()
+            yield {"trace_id": path.stem, "created": path.stat().st_mtime, "info": header}
+
+
+def _make() -> tuple[SamplingProfiler, ProfileRing]:
+    settings = get_settings()
+    return (
+        SamplingProfiler(settings.profile_interval_ms / 1000),
+        ProfileRing(settings.profile_dir or None, settings.profile_ring_size),
+    )
+
+
+profiler, profile_ring = _make()
@@ -0,0 +1,108 @@
+"""Worker warm-up: pay import, client and agent construction costs before serving traffic."""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupState:
+    """What /api/ready reports. ``ready`` flips once warm-up has finished (or was skipped)."""
+
+    ready: bool = False
+    started_at: float | None = None
+    finished_at: float | None = None
+    steps: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        duration_ms = None
+        if self.started_at is not None and self.finished_at is not None:
+            duration_ms = round((self.finished_at - self.started_at) * 1000, 1)
+        return {
+            "status": "ready" if self.ready else "warming",
+            "duration_ms": duration_ms,
+            "steps": self.steps,
+            "errors": self.errors,
+        }
+
+
+warmup_state = WarmupState()
+
+
+def _timed(state: WarmupState, name: str, fn) -> None:
+    start = time.perf_counter()
+    try:
+        result = fn()
+        state.steps[name] = {"ms": round((time.perf_counter() - start) * 1000, 1), "result": result}
+    except Exception as e:
+        logger.warning("Warm-up step %s failed: %s", name, e)
+        state.errors[name] = str(e)
+
+
+def _import_heavy_modules() -> list[str]:
+    import strands  # noqa: F401
+    import strands.models  # noqa: F401
+    import app.tools  # noqa: F401
+    import app.graph.queries  # noqa: F401
+
+    return ["strands", "strands.models", "app.tools", "app.graph.queries"]
+
+
+def _build_bedrock_client(settings: Settings) -> str:
+    from app.bedrock import get_bedrock_client
+
+    client = get_bedrock_client(settings.aws_region)
+    return client.meta.region_name
+
+
+def _connect_graph(settings: Settings) -> str | list[str]:
+    from app.graph.queries import get_backend
+
+    get_backend()
+    if settings.graph_backend != "neo4j":
+        return settings.graph_backend
+
+    from app.graph.client import get_driver
+
+    driver = get_driver()
+    driver.verify_connectivity()
+    if settings.graph_ensure_schema:
+        from app.graph.schema import ensure_schema
+
+        return ensure_schema(driver)
+    return "connected"
+
+
+def _warm_agent_pool(settings: Settings) -> dict[str, int]:
+    from app.agents import agent_registry
+    from app.orchestrator.router import orchestrator
+
+    slugs = settings.warmup_personas or agent_registry.slugs()
+    warmed = {}
+    for slug in slugs:
+        spec = agent_registry.get(slug)
+        if spec is None:
+            logger.warning("Warm-up: unknown persona %s", slug)
+            continue
+        warmed[slug] = orchestrator.pool.warm(spec, settings.warmup_agents_per_persona)
+    return warmed
+
+
+def warm_up(settings: Settings, state: WarmupState = warmup_state) -> WarmupState:
+    """Run the blocking warm-up steps. Failures are recorded but never fatal."""
+    state.started_at = time.perf_counter()
+    _timed(state, "imports", _import_heavy_modules)
+    _timed(state, "bedrock_client", lambda: _build_bedrock_client(settings))
+    _timed(state, "graph", lambda: _connect_graph(settings))
+    _timed(state, "agent_pool", lambda: _warm_agent_pool(settings))
+    state.finished_at = time.perf_counter()
+    state.ready = True
+    logger.info("Warm-up finished: %s", state.to_dict())
+    return state
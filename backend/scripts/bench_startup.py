@@ -0,0 +1,86 @@
+"""Benchmark API import time and warm-up cost.
+
+Each run imports ``app.server`` in a fresh interpreter so module caches don't
+hide the cold-start cost. Run from the backend directory:
+
+    python scripts/bench_startup.py --runs 10
+    python scripts/bench_startup.py --warmup      # also time warm_up()
+    python scripts/bench_startup.py --importtime  # top self-time offenders
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import app.server
+elapsed = time.perf_counter() - start
+heavy = [m for m in ("strands", "boto3", "botocore", "neo4j", "numpy") if m in sys.modules]
+out = {"import_ms": elapsed * 1000, "heavy_loaded": heavy}
+if WARMUP:
+    from app.config import get_settings
+    from app.warmup import warm_up
+    start = time.perf_counter()
+    state = warm_up(get_settings())
+    out["warmup_ms"] = (time.perf_counter() - start) * 1000
+    out["warmup"] = state.to_dict()
+print(json.dumps(out))
+"""
+
+
+def _run_once(warmup: bool) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", f"WARMUP = {warmup}\n" + IMPORT_SNIPPET],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _importtime(top: int) -> list[tuple[int, str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.server"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", action="store_true", help="also run and time warm_up()")
+    parser.add_argument("--importtime", action="store_true", help="show slowest modules by self time")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    results = [_run_once(args.warmup) for _ in range(args.runs)]
+    import_ms = [r["import_ms"] for r in results]
+    print(f"import app.server  runs={args.runs}  "
+          f"median={statistics.median(import_ms):.1f}ms  min={min(import_ms):.1f}ms  max={max(import_ms):.1f}ms")
+    print(f"heavy modules loaded at import: {results[-1]['heavy_loaded'] or 'none'}")
+    if args.warmup:
+        warm_ms = [r["warmup_ms"] for r in results]
+        print(f"warm_up()          median={statistics.median(warm_ms):.1f}ms")
+        print(json.dumps(results[-1]["warmup"], indent=2))
+
+    if args.importtime:
+        print(f"\nTop {args.top} modules by self import time:")
+        for self_us, name in _importtime(args.top):
+            print(f"  {self_us / 1000:8.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
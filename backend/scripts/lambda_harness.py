@@ -0,0 +1,107 @@
+"""Local Lambda-like harness: cold start vs warm invocation latency.
+
+Each "execution environment" is a fresh interpreter that imports
+``app.handler`` (the init phase) and then invokes ``handler`` several times,
+like Lambda reusing a warm environment. ``--concurrency`` starts that many
+environments at once to mimic a burst of cold starts. Defaults to the
+offline fake model; run from the backend directory:
+
+    python scripts/lambda_harness.py --environments 4 --invocations 10
+    python scripts/lambda_harness.py --preinit --model fake:200
+    python scripts/lambda_harness.py --model us.anthropic.claude-3-5-sonnet-20241022-v2:0
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+ENVIRONMENT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import app.handler as h
+init_ms = (time.perf_counter() - start) * 1000
+invocations = []
+for i in range(INVOCATIONS):
+    event = {"body": json.dumps({"query": QUERY, "persona": PERSONA})}
+    start = time.perf_counter()
+    result = h.handler(event, None)
+    invocations.append({"ms": (time.perf_counter() - start) * 1000, "status": result["statusCode"]})
+print("\\n@@result " + json.dumps({"init_ms": init_ms, "invocations": invocations}))
+"""
+
+
+def _run_environment(args: argparse.Namespace) -> dict:
+    env = {
+        **os.environ,
+        "BEDROCK_MODEL_ID": args.model,
+        "LAMBDA_PREINIT": str(args.preinit).lower(),
+        "GRAPH_BACKEND": args.graph_backend,
+    }
+    code = (
+        f"INVOCATIONS = {args.invocations}\nQUERY = {args.query!r}\nPERSONA = {args.persona!r}\n"
+        + ENVIRONMENT_SNIPPET
+    )
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+    # Agents may print streamed text to stdout; the result line is tagged.
+    line = next(l for l in reversed(proc.stdout.splitlines()) if l.startswith("@@result "))
+    result = json.loads(line[len("@@result "):])
+    result["process_ms"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _row(label: str, values: list[float]) -> str:
+    if not values:
+        return f"{label:<22} n=0"
+    return (f"{label:<22} n={len(values):<4} p50={statistics.median(values):8.1f}ms  "
+            f"p95={_percentile(values, 95):8.1f}ms  max={max(values):8.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--environments", type=int, default=3, help="fresh interpreters (cold starts)")
+    parser.add_argument("--invocations", type=int, default=5, help="invocations per environment")
+    parser.add_argument("--concurrency", type=int, default=1, help="environments started at once")
+    parser.add_argument("--model", default="fake:50", help="BEDROCK_MODEL_ID (default: fake model, 50ms)")
+    parser.add_argument("--preinit", action="store_true", help="set LAMBDA_PREINIT=true")
+    parser.add_argument("--graph-backend", default="memory")
+    parser.add_argument("--persona", default="finance-manager")
+    parser.add_argument("--query", default="Pull the Q4 2024 invoices")
+    args = parser.parse_args()
+
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+        results = list(pool.map(lambda _: _run_environment(args), range(args.environments)))
+
+    init = [r["init_ms"] for r in results]
+    first = [r["invocations"][0]["ms"] for r in results if r["invocations"]]
+    warm = [inv["ms"] for r in results for inv in r["invocations"][1:]]
+    statuses = sorted({inv["status"] for r in results for inv in r["invocations"]})
+    print(f"model={args.model} preinit={args.preinit} environments={args.environments} "
+          f"invocations={args.invocations} concurrency={args.concurrency} statuses={statuses}")
+    print(_row("init (import)", init))
+    print(_row("first invocation", first))
+    print(_row("cold total", [i + f for i, f in zip(init, first)]))
+    print(_row("warm invocations", warm))
+
+
+if __name__ == "__main__":
+    main()
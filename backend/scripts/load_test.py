@@ -0,0 +1,279 @@
+"""Load generator for /api/chat with live SSE subscribers.
+
+Opens one ``/api/chat/stream`` subscription per conversation, then fires
+chats at those conversations at a fixed arrival rate (open loop, so a slow
+server builds a backlog instead of slowing the generator down). Reports:
+
+- chat latency percentiles, overall and per response status
+- SSE delivery lag: receive time minus the event's server timestamp (both
+  ends on one box, so the clocks agree)
+- dropped events: chats that answered but whose terminal event never
+  arrived on their conversation's stream
+- server RSS over time, read from /proc (Linux)
+
+With ``--spawn`` the API server is started here with the offline fake model;
+otherwise point ``--url`` at a running one (and pass ``--server-pid`` for
+memory samples). Needs httpx. Run from the backend directory:
+
+    python scripts/load_test.py --spawn --conversations 50 --rate 20 --duration 30
+    python scripts/load_test.py --spawn --model fake:500 --auto-approve --message "Pull the Q4 2024 P&L"
+    python scripts/load_test.py --url http://localhost:8000 --server-pid 12345
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - dev-only dependency
+    sys.exit("load_test.py needs httpx: pip install httpx")
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+TERMINAL_EVENTS = {"agent:responding", "agent:error", "agent:cancelled"}
+
+
+def _percentiles(values: list[float]) -> str:
+    if not values:
+        return "n=0"
+    ordered = sorted(values)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))]
+
+    return (f"n={len(ordered):<5} p50={statistics.median(ordered):8.1f}ms  p90={pct(90):8.1f}ms  "
+            f"p99={pct(99):8.1f}ms  max={ordered[-1]:8.1f}ms")
+
+
+def _rss_mb(pid: int) -> float | None:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.latency: dict[str, list[float]] = defaultdict(list)
+        self.lag: list[float] = []
+        self.events: dict[str, int] = defaultdict(int)
+        self.terminal: dict[str, int] = defaultdict(int)  # conversation → terminal events seen
+        self.expected: dict[str, int] = defaultdict(int)  # conversation → answered chats
+        self.errors: dict[str, int] = defaultdict(int)
+        self.memory: list[tuple[float, float]] = []
+        self.approved = 0
+        self.sent = 0
+        self.stream_failures = 0
+        self.load_seconds = 0.0
+
+
+async def _subscribe(client: httpx.AsyncClient, url: str, conversation_id: str, stats: Stats,
+                     ready: asyncio.Event) -> None:
+    try:
+        async with client.stream("GET", f"{url}/api/chat/stream", params={"conversation_id": conversation_id},
+                                 timeout=httpx.Timeout(None, connect=10)) as response:
+            ready.set()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                received = time.time()
+                event = json.loads(line[5:].strip())
+                kind = event.get("type", "")
+                if kind == "keepalive":
+                    continue
+                stats.events[kind] += 1
+                if "timestamp" in event:
+                    sent = datetime.fromisoformat(event["timestamp"]).timestamp()
+                    stats.lag.append((received - sent) * 1000)
+                if kind in TERMINAL_EVENTS:
+                    stats.terminal[conversation_id] += 1
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        stats.stream_failures += 1
+        ready.set()
+
+
+async def _approve(client: httpx.AsyncClient, url: str, approval_id: str, delay: float, stats: Stats) -> None:
+    await asyncio.sleep(delay)
+    response = await client.post(f"{url}/api/approvals/{approval_id}/approve")
+    if response.status_code == 200:
+        stats.approved += 1
+        # The resumed run answers on the stream, not in a chat response.
+        return
+    stats.errors[f"approve {response.status_code}"] += 1
+
+
+async def _chat(client: httpx.AsyncClient, args: argparse.Namespace, conversation_id: str, stats: Stats,
+                background: set[asyncio.Task]) -> None:
+    start = time.perf_counter()
+    try:
+        response = await client.post(f"{args.url}/api/chat", json={
+            "message": args.message, "persona": args.persona, "conversation_id": conversation_id,
+        }, timeout=args.timeout)
+    except Exception as e:
+        stats.errors[type(e).__name__] += 1
+        return
+    elapsed = (time.perf_counter() - start) * 1000
+    if response.status_code != 200:
+        stats.errors[f"http {response.status_code}"] += 1
+        return
+    body = response.json()
+    status = body.get("status", "ok")
+    stats.latency[status].append(elapsed)
+    if status == "pending_approval":
+        if args.auto_approve and body.get("approval_id"):
+            stats.expected[conversation_id] += 1
+            task = asyncio.create_task(_approve(client, args.url, body["approval_id"], args.approve_delay, stats))
+            background.add(task)
+            task.add_done_callback(background.discard)
+    else:
+        stats.expected[conversation_id] += 1
+
+
+async def _sample_memory(pid: int | None, stats: Stats, interval: float) -> None:
+    if pid is None:
+        return
+    start = time.perf_counter()
+    while True:
+        rss = _rss_mb(pid)
+        if rss is not None:
+            stats.memory.append((time.perf_counter() - start, rss))
+        await asyncio.sleep(interval)
+
+
+async def _wait_ready(url: str, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.perf_counter() < deadline:
+            try:
+                if (await client.get(f"{url}/api/ready")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise SystemExit(f"Server at {url} not ready after {timeout:.0f}s")
+
+
+async def run(args: argparse.Namespace, server_pid: int | None) -> Stats:
+    stats = Stats()
+    conversations = [f"load-{uuid.uuid4().hex[:8]}-{i}" for i in range(args.conversations)]
+    limits = httpx.Limits(max_connections=args.conversations + args.max_in_flight + 10)
+    async with httpx.AsyncClient(limits=limits, timeout=args.timeout) as client:
+        ready = [asyncio.Event() for _ in conversations]
+        streams = [asyncio.create_task(_subscribe(client, args.url, c, stats, r))
+                   for c, r in zip(conversations, ready)]
+        await asyncio.gather(*(r.wait() for r in ready))
+        sampler = asyncio.create_task(_sample_memory(server_pid, stats, args.memory_interval))
+
+        in_flight = asyncio.Semaphore(args.max_in_flight)
+        chats: set[asyncio.Task] = set()
+        background: set[asyncio.Task] = set()
+
+        async def one(conversation_id: str) -> None:
+            async with in_flight:
+                await _chat(client, args, conversation_id, stats, background)
+
+        total = int(args.rate * args.duration)
+        start = time.perf_counter()
+        for i in range(total):
+            # Open loop: request i goes out at i / rate regardless of earlier responses.
+            delay = start + i / args.rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(one(conversations[i % len(conversations)]))
+            chats.add(task)
+            task.add_done_callback(chats.discard)
+            stats.sent += 1
+        await asyncio.gather(*chats)
+        await asyncio.gather(*background)
+        stats.load_seconds = time.perf_counter() - start
+        await asyncio.sleep(args.grace)  # let trailing events arrive
+
+        sampler.cancel()
+        for task in streams:
+            task.cancel()
+        await asyncio.gather(*streams, sampler, return_exceptions=True)
+    return stats
+
+
+def _report(args: argparse.Namespace, stats: Stats) -> None:
+    answered = sum(len(v) for v in stats.latency.values())
+    dropped = sum(max(0, expected - stats.terminal.get(c, 0)) for c, expected in stats.expected.items())
+    print(f"model={args.model} persona={args.persona} conversations={args.conversations} "
+          f"rate={args.rate}/s duration={args.duration}s")
+    print(f"sent={stats.sent} answered={answered} throughput={answered / stats.load_seconds:.1f}/s "
+          f"errors={dict(stats.errors) or 0} approved={stats.approved} stream_failures={stats.stream_failures}")
+    print(f"{'chat latency':<22} {_percentiles([v for vs in stats.latency.values() for v in vs])}")
+    for status, values in sorted(stats.latency.items()):
+        print(f"{'  ' + status:<22} {_percentiles(values)}")
+    print(f"{'SSE delivery lag':<22} {_percentiles(stats.lag)}")
+    print(f"events={sum(stats.events.values())} dropped_terminal_events={dropped} "
+          f"by_type={dict(sorted(stats.events.items()))}")
+    if stats.memory:
+        step = max(1, len(stats.memory) // 10)
+        samples = "  ".join(f"{t:.0f}s:{rss:.0f}" for t, rss in stats.memory[::step])
+        print(f"server RSS MB: start={stats.memory[0][1]:.0f} peak={max(m for _, m in stats.memory):.0f} "
+              f"end={stats.memory[-1][1]:.0f}  [{samples}]")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--spawn", action="store_true", help="start the API server here (uses --model)")
+    parser.add_argument("--port", type=int, default=8765, help="port for --spawn")
+    parser.add_argument("--model", default="fake:200", help="BEDROCK_MODEL_ID for --spawn (default: fake, 200ms)")
+    parser.add_argument("--server-pid", type=int, default=None, help="sample this process's RSS")
+    parser.add_argument("--conversations", type=int, default=20, help="SSE subscriptions / conversations")
+    parser.add_argument("--rate", type=float, default=10.0, help="chat requests per second")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of load")
+    parser.add_argument("--max-in-flight", type=int, default=500)
+    parser.add_argument("--persona", default="finance-manager")
+    parser.add_argument("--message", default="Give me a quick status update")
+    parser.add_argument("--auto-approve", action="store_true", help="approve pending approvals as they appear")
+    parser.add_argument("--approve-delay", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--grace", type=float, default=2.0, help="seconds to wait for trailing events")
+    parser.add_argument("--memory-interval", type=float, default=1.0)
+    parser.add_argument("--server-log", default=None, help="file for the spawned server's output (default: discard)")
+    args = parser.parse_args()
+
+    server = None
+    server_pid = args.server_pid
+    if args.spawn:
+        args.url = f"http://127.0.0.1:{args.port}"
+        log = open(args.server_log, "w") if args.server_log else subprocess.DEVNULL
+        env = {**os.environ, "BEDROCK_MODEL_ID": args.model, "GRAPH_BACKEND": os.environ.get("GRAPH_BACKEND", "memory")}
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.server:app", "--port", str(args.port), "--log-level", "warning"],
+            cwd=BACKEND_DIR, env=env,
+            stdout=log, stderr=subprocess.STDOUT,
+        )
+        server_pid = server.pid
+    else:
+        args.model = os.environ.get("BEDROCK_MODEL_ID", "server default")
+    try:
+        asyncio.run(_wait_ready(args.url, 60))
+        _report(args, asyncio.run(run(args, server_pid)))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(10)
+
+
+if __name__ == "__main__":
+    main()
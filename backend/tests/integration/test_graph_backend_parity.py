@@ -0,0 +1,37 @@
+"""The in-memory backend must answer exactly like the Cypher queries. Needs Neo4j."""
+import itertools
+
+import pytest
+
+neo4j = pytest.importorskip("neo4j")
+
+from app.graph.client import close_driver, get_driver  # noqa: E402
+from app.graph.loader import load_definition  # noqa: E402
+from app.graph.memory import MemoryBackend  # noqa: E402
+from app.graph.queries import Neo4jBackend  # noqa: E402
+from app.graph.seed import seed  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def org():
+    try:
+        get_driver().verify_connectivity()
+    except Exception as e:
+        close_driver()
+        pytest.skip(f"Neo4j not available: {e}")
+    seed(wipe=False)
+    yield load_definition()
+    close_driver()
+
+
+def test_memory_backend_matches_cypher(org):
+    cypher, memory = Neo4jBackend(), MemoryBackend.from_definition(org)
+    people = [p["slug"] for p in org.people] + ["unknown-person"]
+    data = [d["id"] for d in org.data_resources] + ["unknown-data"]
+
+    for requester, data_id in itertools.product(people, data):
+        assert memory.full_routing_query(requester, data_id) == cypher.full_routing_query(requester, data_id)
+        assert memory.check_permission(requester, data_id) == cypher.check_permission(requester, data_id)
+    for data_id in data:
+        assert memory.find_data_owner(data_id) == cypher.find_data_owner(data_id)
+        assert memory.check_approval_required(data_id) == cypher.check_approval_required(data_id)
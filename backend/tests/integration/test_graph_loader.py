@@ -0,0 +1,63 @@
+"""Incremental loads must remove what the org definition no longer lists. Needs Neo4j."""
+import copy
+
+import pytest
+
+neo4j = pytest.importorskip("neo4j")
+
+from app.graph.client import close_driver, get_driver  # noqa: E402
+from app.graph.loader import GraphLoader, load_definition  # noqa: E402
+from app.graph.queries import Neo4jBackend  # noqa: E402
+from app.graph.schema import ensure_schema  # noqa: E402
+
+
+@pytest.fixture
+def loader():
+    try:
+        driver = get_driver()
+        driver.verify_connectivity()
+    except Exception as e:
+        close_driver()
+        pytest.skip(f"Neo4j not available: {e}")
+    ensure_schema(driver)
+    loader = GraphLoader(driver)
+    loader.load(load_definition())
+    yield loader
+    # Put the bundled org back.
+    loader.load(load_definition())
+    close_driver()
+
+
+def test_incremental_load_revokes_removed_edges(loader):
+    org = load_definition()
+    backend = Neo4jBackend()
+    assert backend.check_permission("finance-manager", "invoices")
+    assert backend.check_approval_required("pnl") is not None
+
+    revoked = copy.deepcopy(org)
+    fm = next(p for p in revoked.people if p["slug"] == "finance-manager")
+    fm["can_request"].remove("invoices")
+    pnl = next(d for d in revoked.data_resources if d["id"] == "pnl")
+    pnl["requires_approval"] = []
+    stats = loader.load(revoked)
+
+    assert stats.removed["can_request"] == 1
+    assert stats.removed["requires_approval"] == 1
+    assert not backend.check_permission("finance-manager", "invoices")
+    assert backend.check_approval_required("pnl") is None
+    # Untouched edges survive.
+    assert backend.check_permission("finance-manager", "pnl")
+    assert backend.check_permission("ceo", "invoices")
+
+
+def test_incremental_load_removes_dropped_nodes(loader):
+    org = load_definition()
+    extra = copy.deepcopy(org)
+    extra.people.append({"slug": "temp-analyst", "name": "tmp", "role": "Analyst",
+                         "manages": [], "owns_data": [], "can_request": ["invoices"]})
+    loader.load(extra)
+    assert Neo4jBackend().check_permission("temp-analyst", "invoices")
+
+    stats = loader.load(org)
+    assert stats.removed["Person"] == 1
+    assert not Neo4jBackend().check_permission("temp-analyst", "invoices")
@@ -0,0 +1,39 @@
+"""Asserts every routing query is index-backed. Needs a running Neo4j:
+
+    docker compose up -d neo4j
+    pytest tests/integration
+"""
+import pytest
+
+neo4j = pytest.importorskip("neo4j")
+
+from app.graph.client import close_driver, get_driver  # noqa: E402
+from app.graph.plans import QUERY_CASES, check_query_plans  # noqa: E402
+from app.graph.schema import ensure_schema  # noqa: E402
+from app.graph.seed import seed  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def driver():
+    try:
+        driver = get_driver()
+        driver.verify_connectivity()
+    except Exception as e:
+        close_driver()
+        pytest.skip(f"Neo4j not available: {e}")
+    ensure_schema(driver)
+    seed(wipe=False)
+    yield driver
+    close_driver()
+
+
+@pytest.mark.parametrize("profile", [False, True], ids=["explain", "profile"])
+def test_routing_queries_use_indexes(driver, profile):
+    report = check_query_plans(driver, profile=profile)
+    assert set(report) == set(QUERY_CASES)
+    for name, result in report.items():
+        assert result["index_backed"], f"{name} plan is not index-backed: {result['operators']}"
+
+
+def test_ensure_schema_is_idempotent(driver):
+    assert ensure_schema(driver) == ensure_schema(driver)
@@ -0,0 +1,38 @@
+"""Orchestrator unit tests run offline: the fake model and the in-memory graph."""
+import os
+
+os.environ["BEDROCK_MODEL_ID"] = "fake"
+os.environ["GRAPH_BACKEND"] = "memory"
+
+import pytest  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+
+get_settings.cache_clear()
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """Override settings for one test: ``settings(suspend_on_approval=False)``."""
+
+    def apply(**values):
+        for name, value in values.items():
+            monkeypatch.setenv(name.upper(), str(value))
+        get_settings.cache_clear()
+        return get_settings()
+
+    yield apply
+    monkeypatch.undo()
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def orchestrator():
+    from app.orchestrator.approval import approval_queue
+    from app.orchestrator.router import orchestrator
+
+    approval_queue.clear()
+    orchestrator.pool.clear()
+    yield orchestrator
+    approval_queue.clear()
+    orchestrator.pool.clear()
@@ -0,0 +1,180 @@
+"""Runs parked on approval requests: suspend, resolve, resume, release."""
+import asyncio
+import json
+
+import pytest
+
+from app import bedrock
+from app.fake_model import FakeModel
+from app.orchestrator.approval import ApprovalStatus, approval_queue
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def outcomes(orchestrator, monkeypatch):
+    """Every tool result a resumed run was given, in order."""
+    seen = []
+    outcome = orchestrator._outcome
+
+    async def recording(req, conversation_id):
+        result = await outcome(req, conversation_id)
+        seen.append(result)
+        return result
+
+    monkeypatch.setattr(orchestrator, "_outcome", recording)
+    return seen
+
+
+async def park(orchestrator, message="Pull the pnl for Q4", persona="finance-manager"):
+    response = await orchestrator.handle_chat(message, persona)
+    assert response.status == "pending_approval"
+    return response
+
+
+async def settle(approval_id):
+    req = await approval_queue.wait_settled(approval_id, 10)
+    assert req.settled
+    return req
+
+
+def test_park_approve_resume(orchestrator, outcomes):
+    async def scenario():
+        response = await park(orchestrator)
+        req = approval_queue.get(response.approval_id)
+        assert req.suspended is not None and req.held
+
+        approval_queue.approve(req.id)
+        assert orchestrator.resume_suspended(req.id)
+        return await settle(req.id)
+
+    req = run(scenario())
+    assert req.status == ApprovalStatus.FULFILLED
+    assert req.response.strip() == "Here is what I found."
+    assert req.stored_data is None
+    [outcome] = outcomes
+    assert outcome["status"] == "success" and outcome["data"] is not None
+
+
+def test_deny_resumes_with_denial(orchestrator, outcomes):
+    async def scenario():
+        response = await park(orchestrator)
+        approval_queue.deny(response.approval_id)
+        assert orchestrator.resume_suspended(response.approval_id)
+        return await settle(response.approval_id)
+
+    req = run(scenario())
+    assert req.status == ApprovalStatus.DENIED
+    assert req.response
+    assert req.stored_data is None
+    assert [o["status"] for o in outcomes] == ["denied"]
+
+
+def test_expired_request_resumes_with_expiry(orchestrator, outcomes, settings):
+    async def scenario():
+        response = await park(orchestrator)
+        settings(approval_ttl_seconds=0)
+        assert orchestrator.expire_approvals() == 1
+        return await settle(response.approval_id)
+
+    req = run(scenario())
+    assert req.status == ApprovalStatus.EXPIRED
+    assert req.stored_data is None
+    assert [o["status"] for o in outcomes] == ["expired"]
+
+
+class TwoRequests(FakeModel):
+    """Asks for two approval-gated data types in one turn."""
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        prompt = " ".join(block.get("text", "") for block in messages[-1]["content"])
+        if len(messages) > 1 or prompt != "Brief me":
+            async for event in super().stream(messages, tool_specs, system_prompt, **kwargs):
+                yield event
+            return
+        yield {"messageStart": {"role": "assistant"}}
+        for i, (target, data_type) in enumerate([("accountant", "pnl"), ("finance-manager", "budget")]):
+            tool_input = {"target_agent": target, "data_type": data_type, "ask": f"the {data_type}"}
+            yield {"contentBlockStart": {"start": {"toolUse": {"toolUseId": f"two-{i}", "name": "request_from_agent"}}}}
+            yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(tool_input)}}}}
+            yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "tool_use"}}
+
+
+def test_run_parked_on_two_approvals_resumes_after_both(orchestrator, outcomes, settings, monkeypatch):
+    # Deferred: only the approved request's owner runs (the fake owner of budget would loop).
+    settings(approval_mode="deferred")
+    get_model = bedrock.get_model
+    monkeypatch.setattr(bedrock, "get_model", lambda model_id, region=None: (
+        TwoRequests(model_id) if model_id == "fake" else get_model(model_id, region)
+    ))
+
+    async def scenario():
+        response = await park(orchestrator, "Brief me", persona="ceo")
+        run_ = approval_queue.get(response.approval_id).suspended
+        first, second = run_.tool_use_ids
+        assert approval_queue.get(second).suspended is run_
+
+        approval_queue.approve(first)
+        assert not orchestrator.resume_suspended(first)
+        assert not approval_queue.get(first).settled
+
+        approval_queue.deny(second)
+        assert orchestrator.resume_suspended(second)
+        return await settle(first), await settle(second)
+
+    first, second = run(scenario())
+    assert first.status == ApprovalStatus.FULFILLED
+    assert second.status == ApprovalStatus.DENIED
+    assert first.response == second.response
+    assert sorted(o["status"] for o in outcomes) == ["denied", "success"]
+
+
+def test_deferred_release_runs_target_once_when_fulfill_races_resume(orchestrator, settings, monkeypatch):
+    settings(approval_mode="deferred")
+    calls = []
+    run_target = orchestrator._run_target
+
+    async def counting(*args, **kwargs):
+        calls.append(args)
+        return await run_target(*args, **kwargs)
+
+    monkeypatch.setattr(orchestrator, "_run_target", counting)
+
+    async def scenario():
+        response = await park(orchestrator)
+        assert not calls  # deferred: the owner only runs once approved
+        approval_queue.approve(response.approval_id)
+        fulfilled, resumed = await asyncio.gather(
+            orchestrator.fulfill_approved_request(response.approval_id),
+            asyncio.to_thread(orchestrator.resume_suspended, response.approval_id),
+        )
+        again = await orchestrator.fulfill_approved_request(response.approval_id)
+        return fulfilled, resumed, again
+
+    fulfilled, resumed, again = run(scenario())
+    assert resumed
+    assert len(calls) == 1
+    assert fulfilled["status"] == "fulfilled" and fulfilled["response"]
+    assert again["status"] == "fulfilled" and again["response"] == fulfilled["response"]
+
+
+def test_fulfill_releases_data_when_no_run_is_parked(orchestrator, settings):
+    settings(suspend_on_approval=False)
+
+    async def scenario():
+        response = await orchestrator.handle_chat("Pull the pnl for Q4", "finance-manager")
+        [pending] = approval_queue.list_by_status("pending")
+        approval_queue.approve(pending["id"])
+        return (
+            response,
+            await orchestrator.fulfill_approved_request(pending["id"]),
+            await orchestrator.fulfill_approved_request(pending["id"]),
+        )
+
+    response, fulfilled, again = run(scenario())
+    assert response.status == "ok"
+    assert fulfilled["status"] == "fulfilled" and fulfilled["data"] is not None
+    assert again["status"] == "fulfilled" and "data" not in again
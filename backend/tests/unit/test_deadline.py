@@ -0,0 +1,106 @@
+"""Request deadlines and cooperative cancellation."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app import bedrock
+from app.fake_model import FakeModel
+from app.orchestrator.deadline import (
+    CLIENT_DISCONNECTED,
+    DEADLINE_EXCEEDED,
+    Deadline,
+    RequestCancelled,
+    run_with_deadline,
+    surface_cancellation,
+)
+
+
+def test_deadline_expires_and_cancels_with_reason():
+    deadline = Deadline(0.01)
+    assert not deadline.cancelled
+    assert 0 < deadline.timeout(5) <= 0.01
+    asyncio.run(asyncio.sleep(0.02))
+    assert deadline.cancelled and deadline.reason == DEADLINE_EXCEEDED
+    with pytest.raises(RequestCancelled):
+        deadline.check()
+
+
+def test_unbounded_deadline_only_cancels_explicitly():
+    deadline = Deadline()
+    assert deadline.remaining() is None and deadline.timeout(3) == 3
+    deadline.cancel(CLIENT_DISCONNECTED)
+    deadline.cancel(DEADLINE_EXCEEDED)  # first reason wins
+    with pytest.raises(RequestCancelled) as e:
+        deadline.check()
+    assert e.value.reason == CLIENT_DISCONNECTED
+
+
+def test_run_with_deadline_stops_waiting_and_cancels_the_work():
+    async def scenario():
+        work = asyncio.ensure_future(asyncio.sleep(10))
+        with pytest.raises(RequestCancelled):
+            await run_with_deadline(work, Deadline(0.05), poll_interval=0.01)
+        await asyncio.sleep(0)
+        return work
+
+    assert asyncio.run(scenario()).cancelled()
+    assert asyncio.run(run_with_deadline(asyncio.sleep(0, result="done"), Deadline(1))) == "done"
+
+
+def test_surface_cancellation_unwraps_chained_errors():
+    with pytest.raises(RequestCancelled) as e:
+        with surface_cancellation():
+            try:
+                raise RequestCancelled(CLIENT_DISCONNECTED)
+            except RequestCancelled as cause:
+                raise RuntimeError("wrapped by the framework") from cause
+    assert e.value.reason == CLIENT_DISCONNECTED
+    with pytest.raises(ValueError):
+        with surface_cancellation():
+            raise ValueError("not a cancellation")
+
+
+def test_chat_past_its_deadline_is_cancelled(orchestrator, monkeypatch):
+    monkeypatch.setattr(bedrock, "get_model", lambda model_id, region=None: FakeModel(model_id, latency=1.0))
+    discarded = orchestrator.pool.stats()["discarded"]
+
+    response = asyncio.run(orchestrator.handle_chat("hello", "finance-manager", deadline=Deadline(0.1)))
+
+    assert response.status == "cancelled"
+    assert DEADLINE_EXCEEDED in response.response
+    # The interrupted agent is not put back in the pool.
+    assert orchestrator.pool.stats()["discarded"] == discarded + 1
+
+
+def test_sync_route_request_stops_waiting_at_the_deadline(orchestrator, monkeypatch):
+    from app.orchestrator.events import event_manager
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    hung = threading.Event()
+    cancelled = threading.Event()
+
+    async def never_answers(*args):
+        hung.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    monkeypatch.setattr(event_manager, "_loop", loop)
+    monkeypatch.setattr(orchestrator, "_route_request", never_answers)
+    deadline = Deadline(0.2)
+    try:
+        started = time.monotonic()
+        result = orchestrator.route_request_sync("finance-manager", "accountant", "pnl", "", "c1", deadline)
+        assert time.monotonic() - started < 2
+        assert result["status"] == "cancelled" and result["reason"] == DEADLINE_EXCEEDED
+        assert deadline.cancelled
+        assert hung.is_set() and cancelled.wait(2)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(2)
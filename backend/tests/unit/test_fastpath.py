@@ -0,0 +1,30 @@
+"""Direct tool calls for routine inter-agent data requests."""
+import asyncio
+
+from app import tools
+from app.agent_factory import AgentFactory
+from app.orchestrator import fastpath
+
+
+def test_direct_call_answers_a_plain_fetch(orchestrator):
+    result = asyncio.run(orchestrator.route_request(
+        "finance-manager", "accountant", "invoices", "Pull the overdue invoices", "c1",
+    ))
+    assert result["status"] == "success"
+    assert result["data"]["filter"]["status"] == "overdue"
+
+
+def test_failed_direct_call_falls_back_to_the_agent(orchestrator, settings, monkeypatch, tmp_path):
+    settings(tool_cache_enabled=False)
+    monkeypatch.setattr(tools, "MOCK_DATA_DIR", tmp_path)  # pull_invoices now returns an error result
+    monkeypatch.setattr(AgentFactory, "_prepared_tools", {})
+    failed = fastpath.stats()["failed"]
+
+    result = asyncio.run(orchestrator.route_request(
+        "finance-manager", "accountant", "invoices", "Pull the overdue invoices", "c1",
+    ))
+
+    assert result["status"] == "success"
+    # The owner's agent answered, not the tool's error payload.
+    assert isinstance(result["data"], str) and "error" not in result["data"]
+    assert fastpath.stats()["failed"] == failed + 1
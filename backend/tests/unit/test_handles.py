@@ -0,0 +1,24 @@
+"""Data handles for large inter-agent payloads."""
+from app.orchestrator import handles
+from app.orchestrator.handles import HandleStore
+from app.orchestrator.payloads import PayloadStore
+
+
+def test_fetch_reads_a_slice_of_a_spilled_payload(tmp_path, monkeypatch):
+    monkeypatch.setattr(handles, "payload_store", PayloadStore(tmp_path, inline_threshold=64))
+    store = HandleStore(inline_threshold=64, fetch_max_bytes=4096)
+    wrapped = store.wrap({"rows": list(range(100))}, "c1", "accountant", "pnl")
+
+    assert store.fetch(wrapped["handle"], "c1", "rows.0:3")["data"] == [0, 1, 2]
+    assert store.fetch(wrapped["handle"], "other-chat")["status"] == "error"
+
+
+def test_fetch_of_a_discarded_spill_file_is_an_unknown_handle(tmp_path, monkeypatch):
+    monkeypatch.setattr(handles, "payload_store", PayloadStore(tmp_path, inline_threshold=64))
+    store = HandleStore(inline_threshold=64, fetch_max_bytes=4096)
+    wrapped = store.wrap({"rows": list(range(100))}, "c1", "accountant", "pnl")
+    for spilled in tmp_path.iterdir():
+        spilled.unlink()
+
+    result = store.fetch(wrapped["handle"], "c1", "rows")
+    assert result == {"status": "error", "message": f"Unknown or expired handle: {wrapped['handle']}"}
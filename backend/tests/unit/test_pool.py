@@ -0,0 +1,78 @@
+"""Pooled agents: reuse, isolation between runs, invalidation."""
+import dataclasses
+
+import pytest
+
+from app.agent_factory import AgentSpec
+from app.orchestrator.deadline import Deadline
+from app.orchestrator.pool import AgentPool
+
+
+class StubAgent:
+    def __init__(self, spec, context, hooks):
+        self.spec, self.context, self.hooks = spec, context, hooks
+        self.messages = []
+
+
+@pytest.fixture
+def spec():
+    return AgentSpec(slug="accountant", name="acct_agent", role="Accountant", description="", version=1)
+
+
+def test_released_agent_is_reused_with_a_clean_slate(spec):
+    pool = AgentPool(StubAgent)
+    deadline = Deadline(5)
+    with pool.acquire(spec, "c1", deadline) as first:
+        assert first.context.conversation_id == "c1" and first.hooks.deadline is deadline
+        first.agent.messages.append({"role": "user"})
+        first.context.suspensions.append(("a1", "t1"))
+        first.context.tools_started = 2
+    with pool.acquire(spec, "c2") as second:
+        assert second is first
+        assert second.agent.messages == []
+        assert second.context.conversation_id == "c2" and second.context.deadline is None
+        assert second.context.suspensions == [] and second.context.tools_started == 0
+    assert pool.stats()["built"] == 1 and pool.stats()["reused"] == 1
+
+
+def test_concurrent_runs_get_separate_agents(spec):
+    pool = AgentPool(StubAgent)
+    with pool.acquire(spec, "c1") as a, pool.acquire(spec, "c2") as b:
+        assert a is not b
+        assert a.context.conversation_id == "c1" and b.context.conversation_id == "c2"
+    assert pool.stats()["idle"] == {"accountant": 2}
+
+
+def test_agent_whose_run_raised_is_dropped(spec):
+    pool = AgentPool(StubAgent)
+    with pytest.raises(RuntimeError):
+        with pool.acquire(spec, "c1"):
+            raise RuntimeError("boom")
+    assert pool.stats()["discarded"] == 1 and pool.stats()["idle"] == {}
+
+
+def test_new_spec_version_replaces_idle_agents(spec):
+    pool = AgentPool(StubAgent)
+    with pool.acquire(spec, "c1") as old:
+        pass
+    newer = dataclasses.replace(spec, version=2)
+    with pool.acquire(newer, "c2") as new:
+        assert new is not old and new.version == 2
+    assert pool.stats()["discarded"] == 1
+
+
+def test_idle_agents_are_capped(spec):
+    pool = AgentPool(StubAgent, max_idle_per_spec=1)
+    with pool.acquire(spec, "c1"), pool.acquire(spec, "c2"):
+        pass
+    assert pool.stats()["idle"] == {"accountant": 1} and pool.stats()["discarded"] == 1
+    assert pool.warm(spec, 3) == 0
+
+
+def test_clear_drops_per_tier_agents_for_the_slug(spec):
+    pool = AgentPool(StubAgent)
+    pool.warm(spec)
+    pool.warm(dataclasses.replace(spec, tier="small"))
+    pool.warm(dataclasses.replace(spec, slug="ceo"))
+    pool.clear("accountant")
+    assert pool.stats()["idle"] == {"ceo": 1}
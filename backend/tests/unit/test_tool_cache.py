@@ -0,0 +1,31 @@
+"""Which tool results the shared cache keeps."""
+from strands import tool
+
+from app.serialization import tool_result
+from app.tool_cache import ToolCache, cacheable
+
+calls = []
+
+
+@tool
+def lookup(data_type: str, outcome: str = "ok") -> dict:
+    """Look something up.
+
+    Args:
+        data_type: What to look up.
+        outcome: "ok", "error" or "degraded".
+    """
+    calls.append(data_type)
+    if outcome == "error":
+        return tool_result({"message": "backend down"}, status="error")
+    return tool_result({"data_type": data_type, "degraded": outcome == "degraded"})
+
+
+def test_only_sound_results_are_cached():
+    cache = ToolCache()
+    cached = cache.wrap("lookup", cacheable(lookup, ttl=60))._tool_func
+    calls.clear()
+    for outcome in ("ok", "error", "degraded"):
+        cached(data_type=outcome, outcome=outcome)
+        cached(data_type=outcome, outcome=outcome)
+    assert calls == ["ok", "error", "error", "degraded", "degraded"]
@@ -0,0 +1,51 @@
+"""Process-pool tool execution and its in-process fallbacks."""
+import asyncio
+import os
+
+import pytest
+
+from app import tool_executor as te
+from app.tool_executor import ToolExecutor
+
+
+def where(padding: str = "", size: int = 0) -> dict:
+    return {"pid": os.getpid(), "received": len(padding), "padding": "x" * size}
+
+
+def missing_file() -> str:
+    with open("/nonexistent/agentorg-test") as f:
+        return f.read()
+
+
+def unsupported(*args, **kwargs):
+    raise OSError(38, "Function not implemented")
+
+
+@pytest.fixture
+def executor():
+    executor = ToolExecutor(max_workers=1, shm_threshold=1024)
+    yield executor
+    executor.shutdown()
+
+
+def test_runs_inline_when_the_pool_cannot_be_created(executor, monkeypatch):
+    monkeypatch.setattr(te, "ProcessPoolExecutor", unsupported)
+    result = asyncio.run(executor.call(__name__, "where", {}))
+    assert result["pid"] == os.getpid()
+    assert executor.stats()["inline_fallback"] and executor.stats()["inline"] == 1
+
+
+def test_runs_inline_when_shared_memory_is_missing(executor, monkeypatch):
+    monkeypatch.setattr(te.shared_memory, "SharedMemory", unsupported)
+    result = asyncio.run(executor.call(__name__, "where", {"padding": "x" * 4096}))
+    assert result["pid"] == os.getpid() and result["received"] == 4096
+    assert executor.stats()["inline_fallback"]
+
+
+def test_tool_errors_are_not_mistaken_for_an_unsupported_platform(executor):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(executor.call(__name__, "missing_file", {}))
+    assert not executor.stats()["inline_fallback"]
+    result = asyncio.run(executor.call(__name__, "where", {"padding": "x" * 4096, "size": 4096}))
+    assert result["pid"] != os.getpid() and result["received"] == len(result["padding"]) == 4096
+    assert executor.stats()["shm_args"] == executor.stats()["shm_results"] == 1
@@ -183,7 +183,7 @@ export default function AskPage() {
   useCopilotAction({
     name: "fulfillApproval",
     description:
-      "Release the cached data for an approved request. Call this after the user approves a reviewApproval action. Returns the actual data that was held pending approval.",
+      "Release the cached data for an approved request. Call this after the user approves a reviewApproval action. Returns the agent's answer using the released data, or the actual data that was held pending approval.",
     parameters: [
       { name: "approval_id", type: "string", description: "The approval request ID to fulfill", required: true },
     ],
@@ -196,6 +196,12 @@ export default function AskPage() {
       );
     },
     handler: async ({ approval_id }: { approval_id: string }) => {
+      // A run parked on the approval releases the data itself when it resumes;
+      // use its answer, and only fetch the raw data when no run picked it up.
+      const waited = await api.waitForApproval(approval_id);
+      if (waited.response != null) {
+        return JSON.stringify({ status: waited.status, data_type: waited.data_type, response: waited.response });
+      }
       const result = await api.fulfillApproval(approval_id);
       return JSON.stringify(result);
     },
@@ -239,7 +245,7 @@ When the user asks a question, call the queryAgentNetwork action with their mess
 
 IMPORTANT: When queryAgentNetwork returns a JSON response containing "pending_approval", you MUST immediately call reviewApproval with the approval details (approval_id, source_agent, target_agent, data_type, sensitivity_reason) from the pending_approval object.
 
-After the user approves (reviewApproval returns { approved: true }), you MUST call fulfillApproval with the same approval_id to retrieve the released data. Then present the data to the user in a clear, natural format.
+After the user approves (reviewApproval returns { approved: true }), you MUST call fulfillApproval with the same approval_id to retrieve the released data. If it returns a "response", that is the agent's answer using the data; otherwise present the returned data to the user in a clear, natural format.
 
 If the user denies the approval, acknowledge it gracefully and let them know the request was denied.
 
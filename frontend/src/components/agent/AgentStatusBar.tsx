@@ -11,6 +11,8 @@ const STATUS_LABELS: Record<AgentEventType, string> = {
   "agent:denied": "Request denied",
   "agent:fulfilled": "Request fulfilled",
   "agent:responding": "Composing response...",
+  "agent:resumed": "Resuming after approval...",
+  "agent:cancelled": "Request cancelled",
   "agent:error": "An error occurred",
 };
 
@@ -26,6 +26,11 @@ const STATUS_CONFIG = {
     color: "var(--status-approved)",
     label: "Fulfilled",
   },
+  expired: {
+    icon: Clock,
+    color: "var(--status-denied)",
+    label: "Expired",
+  },
 };
 
 interface ApprovalItemProps {
@@ -1,4 +1,4 @@
-import type { ChatRequest, ChatResponse, Approval, AgentConfig, FulfillResponse } from "./types";
+import type { ChatRequest, ChatResponse, Approval, ApprovalWait, AgentConfig, FulfillResponse } from "./types";
 
 const BASE_URL = "/backend";
 
@@ -81,6 +81,10 @@ export const api = {
     return fetchJSON<Approval>(`/approvals/${id}/deny`, { method: "POST" });
   },
 
+  waitForApproval(id: string, timeoutSeconds = 30) {
+    return fetchJSON<ApprovalWait>(`/approvals/${id}/wait?timeout=${timeoutSeconds}`);
+  },
+
   fulfillApproval(id: string) {
     return fetchJSON<FulfillResponse>(`/approvals/${id}/fulfill`, {
       method: "POST",
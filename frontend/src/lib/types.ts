@@ -7,6 +7,8 @@ export type AgentEventType =
   | "agent:denied"
   | "agent:fulfilled"
   | "agent:responding"
+  | "agent:resumed"
+  | "agent:cancelled"
   | "agent:error";
 
 export interface AgentEvent {
@@ -31,6 +33,8 @@ export interface ChatResponse {
   conversation_id: string;
   agent: string;
   trace_id?: string;
+  status?: "ok" | "error" | "cancelled" | "pending_approval";
+  approval_id?: string;
 }
 
 export interface Approval {
@@ -39,11 +43,16 @@ export interface Approval {
   target_agent: string;
   data_type: string;
   sensitivity_reason: string;
-  status: "pending" | "approved" | "denied" | "fulfilled";
+  status: "pending" | "approved" | "denied" | "fulfilled" | "expired";
   created_at: string;
   resolved_at?: string;
 }
 
+export interface ApprovalWait extends Approval {
+  settled: boolean;
+  response?: string;
+}
+
 export interface AgentConfig {
   slug: string;
   name: string;
@@ -60,4 +69,6 @@ export interface FulfillResponse {
   status: string;
   data?: string;
   data_type?: string;
+  response?: string | null;
+  message?: string;
 }